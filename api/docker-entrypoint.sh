@@ -44,9 +44,11 @@ start_worker_beat() {
 manage_db_partitions() {
   if [ "${DJANGO_MANAGE_DB_PARTITIONS}" = "True" ]; then
     echo "Managing DB partitions..."
-    # For now we skip the deletion of partitions until we define the data retention policy
+    # The expired partitions are removed by findings_retention, which detaches them before dropping them
     # --yes auto approves the operation without the need of an interactive terminal
     poetry run python manage.py pgpartition --using admin --skip-delete --yes
+    # Drop or detach the partitions older than FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS, if it is set
+    poetry run python manage.py findings_retention
   fi
 }
 
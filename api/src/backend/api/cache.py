@@ -0,0 +1,135 @@
+import hashlib
+import logging
+from functools import wraps
+from uuid import uuid4
+
+from config.custom_logging import BackendLogger
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from api.rbac.permissions import get_providers, get_role
+
+logger = logging.getLogger(BackendLogger.API)
+
+RESPONSE_CACHE_PREFIX = "response-cache"
+RESPONSE_CACHE_HEADER = "X-Prowler-Cache"
+
+
+def _get_tenant_version(tenant_id: str) -> str:
+    """Return the current cache version of the tenant, every invalidation starts a new one."""
+    version_key = f"{RESPONSE_CACHE_PREFIX}:version:{tenant_id}"
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(version_key, version, timeout=None):
+            version = cache.get(version_key, version)
+    return version
+
+
+def invalidate_response_cache(tenant_id: str):
+    """
+    Invalidate the cached responses of the given tenant.
+
+    The responses are not deleted, the tenant gets a new cache version so the old responses are no longer
+    read and expire on their own.
+    """
+    try:
+        cache.set(
+            f"{RESPONSE_CACHE_PREFIX}:version:{tenant_id}", uuid4().hex, timeout=None
+        )
+    except Exception as e:
+        logger.warning(f"Could not invalidate the response cache of {tenant_id}: {e}")
+
+
+def _get_visibility_scope(user) -> str:
+    """Return the providers the user can see, so users with different roles do not share responses."""
+    role = get_role(user)
+    if role is None:
+        return "none"
+    if role.unlimited_visibility:
+        return "all"
+    provider_ids = sorted(
+        str(provider_id)
+        for provider_id in get_providers(role).values_list("id", flat=True)
+    )
+    return hashlib.sha256(",".join(provider_ids).encode()).hexdigest()
+
+
+def _get_query_string(query_params) -> str:
+    """Return the query string with its parameters and values sorted."""
+    return "&".join(
+        f"{key}={value}"
+        for key in sorted(query_params)
+        for value in sorted(query_params.getlist(key))
+    )
+
+
+def get_response_cache_key(endpoint: str, request) -> str:
+    """
+    Return the cache key of the response of the request, scoped by tenant, cache version and the providers
+    visible to the user.
+    """
+    tenant_id = request.tenant_id
+    request_hash = hashlib.sha256(
+        "|".join(
+            (
+                _get_visibility_scope(request.user),
+                request.accepted_media_type or "",
+                _get_query_string(request.query_params),
+            )
+        ).encode()
+    ).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}:{tenant_id}:{_get_tenant_version(tenant_id)}:{endpoint}:{request_hash}"
+
+
+def cache_response(view_func):
+    """
+    Decorator to cache the rendered responses of a viewset action until a scan of the tenant is completed.
+
+    Only successful responses are cached. The `X-Prowler-Cache` header of the response tells if it was read
+    from the cache (`HIT`) or not (`MISS`), and it is logged with the request by `APILoggingMiddleware`, so the
+    hits and misses of every endpoint are counted from the API logs. If the cache is not available the responses
+    are always computed.
+
+    Example:
+        @action(detail=False, methods=["get"], url_name="providers")
+        @cache_response
+        def providers(self, request):
+            ...
+    """
+
+    @wraps(view_func)
+    def wrapper(self, request, *args, **kwargs):
+        endpoint = f"{self.basename}-{self.action}"
+        try:
+            cache_key = get_response_cache_key(endpoint, request)
+            cached = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Response cache not available for {endpoint}: {e}")
+            return view_func(self, request, *args, **kwargs)
+
+        if cached is not None:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+            response[RESPONSE_CACHE_HEADER] = "HIT"
+            return response
+
+        response = view_func(self, request, *args, **kwargs)
+        response[RESPONSE_CACHE_HEADER] = "MISS"
+        if response.status_code == 200:
+
+            def store_response(rendered_response):
+                try:
+                    cache.set(
+                        cache_key,
+                        (rendered_response.content, rendered_response["Content-Type"]),
+                        timeout=settings.RESPONSE_CACHE_TIMEOUT,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not cache the response of {endpoint}: {e}")
+
+            response.add_post_render_callback(store_response)
+        return response
+
+    return wrapper
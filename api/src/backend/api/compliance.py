@@ -2,6 +2,7 @@ from types import MappingProxyType
 
 from api.models import Provider
 from prowler.config.config import get_available_compliance_frameworks
+from prowler.lib.check.compliance import ComplianceIndex
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.models import CheckMetadata
 
@@ -109,18 +110,11 @@ def load_prowler_checks(prowler_compliance):
     """
     checks = {}
     for provider_type in Provider.ProviderChoices.values:
+        compliance_index = ComplianceIndex(prowler_compliance[provider_type])
         checks[provider_type] = {
-            check_id: set() for check_id in get_prowler_provider_checks(provider_type)
+            check_id: compliance_index.get_frameworks(check_id)
+            for check_id in get_prowler_provider_checks(provider_type)
         }
-        for compliance_name, compliance_data in prowler_compliance[
-            provider_type
-        ].items():
-            for requirement in compliance_data.Requirements:
-                for check in requirement.Checks:
-                    try:
-                        checks[provider_type][check].add(compliance_name)
-                    except KeyError:
-                        continue
     return checks
 
 
@@ -29,6 +29,10 @@ POSTGRES_TENANT_VAR = "api.tenant_id"
 POSTGRES_USER_VAR = "api.user_id"
 
 SET_CONFIG_QUERY = "SELECT set_config(%s, %s::text, TRUE);"
+# Bound of a range partition as returned by `pg_get_expr(relpartbound, oid)`
+PARTITION_RANGE_BOUND_PATTERN = re.compile(
+    r"FOR VALUES FROM \('(?P<from_value>[0-9a-f-]+)'\) TO \('(?P<to_value>[0-9a-f-]+)'\)"
+)
 
 
 @contextmanager
@@ -456,6 +460,51 @@ def drop_index_on_partitions(
         schema_editor.execute(sql)
 
 
+def get_partition_bounds(
+    parent_table: str, using: str = DEFAULT_DB_ALIAS
+) -> list[tuple[str, uuid.UUID | None, uuid.UUID | None]]:
+    """
+    Return the partitions of a UUIDv7 range partitioned table with their bounds, sorted by their lower bound.
+
+    Args:
+        parent_table: The name of the root table (e.g. "findings").
+        using: The database alias to read the partitions from.
+
+    Returns:
+        list[tuple]: (partition name, from value, to value) of every partition, the upper bound is exclusive.
+            The default partition is returned last and without bounds.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            """,
+            [parent_table],
+        )
+        partitions = cursor.fetchall()
+
+    range_partitions = []
+    other_partitions = []
+    for partition, bound in partitions:
+        match = PARTITION_RANGE_BOUND_PATTERN.search(bound or "")
+        if match:
+            range_partitions.append(
+                (
+                    partition,
+                    uuid.UUID(match["from_value"]),
+                    uuid.UUID(match["to_value"]),
+                )
+            )
+        else:
+            other_partitions.append((partition, None, None))
+    return sorted(range_partitions, key=lambda partition: partition[1]) + sorted(
+        other_partitions
+    )
+
+
 def generate_api_key_prefix():
     """Generate a random 8-character prefix for API keys (e.g., 'pk_abc123de')."""
     random_chars = generate_random_token(length=8)
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.partitions import apply_partitions_retention
+
+
+class Command(BaseCommand):
+    help = "Drops or detaches the findings partitions older than the configured age."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age-months",
+            type=int,
+            default=settings.FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS,
+            help="Months of findings to keep, FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS by default.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["drop", "detach"],
+            default=settings.FINDINGS_TABLE_PARTITION_RETENTION_MODE,
+            help="Drop the expired partitions or detach them to be archived, FINDINGS_TABLE_PARTITION_RETENTION_MODE by default.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only list the partitions that would be removed.",
+        )
+
+    def handle(self, *args, **options):
+        max_age_months = options["max_age_months"]
+        if max_age_months is None:
+            self.stdout.write(
+                self.style.NOTICE("No findings retention configured, skipping.")
+            )
+            return
+        if max_age_months < 1:
+            raise CommandError("The findings retention must be at least 1 month.")
+
+        partitions = apply_partitions_retention(
+            max_age_months,
+            detach=options["mode"] == "detach",
+            dry_run=options["dry_run"],
+        )
+        if options["dry_run"]:
+            action = "would be removed"
+        else:
+            action = "detached" if options["mode"] == "detach" else "dropped"
+        for partition in partitions:
+            self.stdout.write(f"\t{partition}")
+        self.stdout.write(self.style.SUCCESS(f"{len(partitions)} partitions {action}."))
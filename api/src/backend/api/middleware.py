@@ -3,6 +3,8 @@ import time
 
 from config.custom_logging import BackendLogger
 
+from api.cache import RESPONSE_CACHE_HEADER
+
 
 def extract_auth_info(request) -> dict:
     if getattr(request, "auth", None) is not None:
@@ -38,18 +40,19 @@ class APILoggingMiddleware:
         response = self.get_response(request)
         duration = time.time() - request_start_time
         auth_info = extract_auth_info(request)
-        self.logger.info(
-            "",
-            extra={
-                "user_id": auth_info["user_id"],
-                "tenant_id": auth_info["tenant_id"],
-                "api_key_prefix": auth_info["api_key_prefix"],
-                "method": request.method,
-                "path": request.path,
-                "query_params": request.GET.dict(),
-                "status_code": response.status_code,
-                "duration": duration,
-            },
-        )
+        extra = {
+            "user_id": auth_info["user_id"],
+            "tenant_id": auth_info["tenant_id"],
+            "api_key_prefix": auth_info["api_key_prefix"],
+            "method": request.method,
+            "path": request.path,
+            "query_params": request.GET.dict(),
+            "status_code": response.status_code,
+            "duration": duration,
+        }
+        # The hits and misses of the response cache are counted from the logs
+        if response.has_header(RESPONSE_CACHE_HEADER):
+            extra["response_cache"] = response[RESPONSE_CACHE_HEADER]
+        self.logger.info("", extra=extra)
 
         return response
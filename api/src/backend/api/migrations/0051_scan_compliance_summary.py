@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0050_lighthouse_multi_llm"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scan",
+            name="compliance_summary",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
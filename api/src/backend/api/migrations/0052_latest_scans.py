@@ -0,0 +1,99 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import api.rls
+from api.db_router import MainRouter
+
+
+def populate_latest_scans(apps, schema_editor):
+    """Point every provider to its latest completed scan."""
+    Scan = apps.get_model("api", "Scan")
+    LatestScan = apps.get_model("api", "LatestScan")
+
+    latest_scans = (
+        Scan.objects.using(MainRouter.admin_db)
+        .filter(state="completed")
+        .order_by("provider_id", "-inserted_at")
+        .distinct("provider_id")
+        .values_list("tenant_id", "provider_id", "id")
+    )
+    LatestScan.objects.using(MainRouter.admin_db).bulk_create(
+        [
+            LatestScan(tenant_id=tenant_id, provider_id=provider_id, scan_id=scan_id)
+            for tenant_id, provider_id, scan_id in latest_scans
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0051_scan_compliance_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestScan",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("summary", models.JSONField(blank=True, null=True)),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_scans",
+                        related_query_name="latest_scan",
+                        to="api.provider",
+                    ),
+                ),
+                (
+                    "scan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="api.scan",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "latest_scans",
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("tenant_id", "provider_id"),
+                        name="unique_latest_scan_by_provider",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="latestscan",
+            constraint=api.rls.RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_latestscan",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_scans,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,115 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+import api.rls
+from api.db_router import MainRouter
+
+SUMMARY_FIELDS = (
+    "_pass",
+    "fail",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+)
+
+
+def populate_latest_scan_summaries(apps, schema_editor):
+    """Store the summary of every latest scan and the totals of every tenant."""
+    LatestScan = apps.get_model("api", "LatestScan")
+    ScanSummary = apps.get_model("api", "ScanSummary")
+    TenantLatestScanSummary = apps.get_model("api", "TenantLatestScanSummary")
+
+    latest_scans = list(LatestScan.objects.using(MainRouter.admin_db).all())
+    scan_totals = {
+        row["scan_id"]: {field: row[f"total_{field}"] or 0 for field in SUMMARY_FIELDS}
+        for row in ScanSummary.objects.using(MainRouter.admin_db)
+        .filter(scan_id__in=[latest_scan.scan_id for latest_scan in latest_scans])
+        .values("scan_id")
+        .annotate(**{f"total_{field}": Sum(field) for field in SUMMARY_FIELDS})
+    }
+
+    tenant_totals = {}
+    for latest_scan in latest_scans:
+        if latest_scan.summary is None:
+            latest_scan.summary = scan_totals.get(latest_scan.scan_id, {})
+        totals = tenant_totals.setdefault(
+            latest_scan.tenant_id, dict.fromkeys(SUMMARY_FIELDS, 0)
+        )
+        for field in SUMMARY_FIELDS:
+            totals[field] += latest_scan.summary.get(field, 0)
+
+    LatestScan.objects.using(MainRouter.admin_db).bulk_update(
+        latest_scans, ["summary"], batch_size=1000
+    )
+    TenantLatestScanSummary.objects.using(MainRouter.admin_db).bulk_create(
+        [
+            TenantLatestScanSummary(tenant_id=tenant_id, summary=summary)
+            for tenant_id, summary in tenant_totals.items()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0054_findings_inserted_index_parent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TenantLatestScanSummary",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("summary", models.JSONField(default=dict)),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "tenant_latest_scan_summaries",
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("tenant_id",),
+                        name="unique_latest_scan_summary_by_tenant",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="tenantlatestscansummary",
+            constraint=api.rls.RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_tenantlatestscansummary",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_scan_summaries,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
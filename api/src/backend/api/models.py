@@ -17,8 +17,8 @@ from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import Q, Sum
 from django.utils.translation import gettext_lazy as _
 from django_celery_beat.models import PeriodicTask
 from django_celery_results.models import TaskResult
@@ -517,6 +517,9 @@ class Scan(RowLevelSecurityProtectedModel):
         PeriodicTask, on_delete=models.SET_NULL, null=True, blank=True
     )
     output_location = models.CharField(blank=True, null=True, max_length=4096)
+    # Check status by region and ThreatScore requirement counters, aggregated while the findings
+    # are stored, so the compliance overviews do not need to read the findings again
+    compliance_summary = models.JSONField(null=True, blank=True)
     provider = models.ForeignKey(
         Provider,
         on_delete=models.CASCADE,
@@ -889,6 +892,10 @@ class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
                 fields=["tenant_id", "scan_id", "check_id"],
                 name="find_tenant_scan_check_idx",
             ),
+            models.Index(
+                fields=["tenant_id", "-inserted_at", "-id"],
+                name="find_tenant_inserted_id_idx",
+            ),
         ]
 
     class JSONAPIMeta:
@@ -1424,6 +1431,158 @@ class ScanSummary(RowLevelSecurityProtectedModel):
         resource_name = "scan-summaries"
 
 
+class LatestScan(RowLevelSecurityProtectedModel):
+    """
+    Latest completed scan of each provider, updated every time one of its scans is saved as completed.
+
+    The overviews read the latest scans from this table instead of looking for the latest completed scan of
+    every provider in the scans table. The totals of the scan summaries of the latest scan are stored in
+    `summary` when the scan is completed and every time its scan summaries are stored, see `update_summary`,
+    so the overviews only read them.
+    """
+
+    SUMMARY_FIELDS = (
+        "_pass",
+        "fail",
+        "muted",
+        "total",
+        "new",
+        "changed",
+        "unchanged",
+        "fail_new",
+        "fail_changed",
+        "pass_new",
+        "pass_changed",
+        "muted_new",
+        "muted_changed",
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    provider = models.ForeignKey(
+        Provider,
+        on_delete=models.CASCADE,
+        related_name="latest_scans",
+        related_query_name="latest_scan",
+    )
+    scan = models.ForeignKey(Scan, on_delete=models.CASCADE, related_name="+")
+    summary = models.JSONField(null=True, blank=True)
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "latest_scans"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=("tenant_id", "provider_id"),
+                name="unique_latest_scan_by_provider",
+            ),
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+
+    @classmethod
+    def get_scan_summary(cls, scan_id: str) -> dict:
+        """Return the totals of the scan summaries of the scan, empty if the scan has no scan summaries."""
+        totals = ScanSummary.all_objects.filter(scan_id=scan_id).aggregate(
+            # Annotations cannot have the name of a model field
+            **{f"total_{field}": Sum(field) for field in cls.SUMMARY_FIELDS},
+        )
+        if totals["total_total"] is None:
+            return {}
+        return {field: totals[f"total_{field}"] or 0 for field in cls.SUMMARY_FIELDS}
+
+    @classmethod
+    def update_provider(cls, tenant_id: str, provider_id: str):
+        """Point the provider to its latest completed scan, with the summary of the scan."""
+        latest_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .order_by("-inserted_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if latest_scan_id is None:
+            if cls.objects.filter(
+                tenant_id=tenant_id, provider_id=provider_id
+            ).delete()[0]:
+                TenantLatestScanSummary.update_tenant(tenant_id)
+            return
+
+        if cls.objects.filter(
+            tenant_id=tenant_id, provider_id=provider_id, scan_id=latest_scan_id
+        ).exists():
+            return
+        cls.objects.update_or_create(
+            tenant_id=tenant_id,
+            provider_id=provider_id,
+            defaults={
+                "scan_id": latest_scan_id,
+                "summary": cls.get_scan_summary(latest_scan_id),
+            },
+        )
+        TenantLatestScanSummary.update_tenant(tenant_id)
+
+    @classmethod
+    def update_summary(cls, tenant_id: str, scan_id: str):
+        """Store the summary of the scan if it is the latest scan of its provider, e.g. after storing its scan summaries."""
+        if not cls.objects.filter(tenant_id=tenant_id, scan_id=scan_id).exists():
+            return
+        cls.objects.filter(tenant_id=tenant_id, scan_id=scan_id).update(
+            summary=cls.get_scan_summary(scan_id)
+        )
+        TenantLatestScanSummary.update_tenant(tenant_id)
+
+
+class TenantLatestScanSummary(RowLevelSecurityProtectedModel):
+    """
+    Totals of the summaries of the latest scans of all the providers of a tenant, one row per tenant.
+
+    It is updated with the summaries of the latest scans, so the overview of the users that can see all the
+    providers reads a single row.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    summary = models.JSONField(default=dict)
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "tenant_latest_scan_summaries"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=("tenant_id",),
+                name="unique_latest_scan_summary_by_tenant",
+            ),
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+
+    @classmethod
+    def update_tenant(cls, tenant_id: str):
+        """Recompute the totals of the tenant from the summaries of its latest scans."""
+        with transaction.atomic():
+            cls.objects.get_or_create(tenant_id=tenant_id)
+            # The row is locked before reading the latest scans, so the scans of different providers completed
+            # at the same time do not overwrite the totals of each other
+            tenant_summary = cls.objects.select_for_update().get(tenant_id=tenant_id)
+            tenant_summary.summary = dict.fromkeys(LatestScan.SUMMARY_FIELDS, 0)
+            for summary in LatestScan.objects.filter(tenant_id=tenant_id).values_list(
+                "summary", flat=True
+            ):
+                for field in LatestScan.SUMMARY_FIELDS:
+                    tenant_summary.summary[field] += (summary or {}).get(field, 0)
+            tenant_summary.save()
+
+
 class Integration(RowLevelSecurityProtectedModel):
     class IntegrationChoices(models.TextChoices):
         AMAZON_S3 = "amazon_s3", _("Amazon S3")
@@ -1,6 +1,125 @@
+import base64
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q
 from drf_spectacular_jsonapi.schemas.pagination import JsonApiPageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_json_api.serializers import ValidationError
+
+from api.uuid_utils import datetime_to_uuid7, uuid7_start
 
 
 class ComplianceOverviewPagination(JsonApiPageNumberPagination):
     page_size = 50
     max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination on `(inserted_at, id)` in descending order, for the tables partitioned by their UUIDv7 `id`.
+
+    Every page is read with a `WHERE (inserted_at, id) < (cursor)` condition instead of an offset, so deep pages
+    cost the same as the first one. The cursor of the next page is returned in `links.next`, the first page is
+    requested with an empty `page[cursor]`.
+
+    The paginated queryset must be a list of primary keys, `paginate_queryset` returns the primary keys of the
+    page to be used with `PaginateByPkMixin`.
+    """
+
+    cursor_query_param = "page[cursor]"
+    page_size_query_param = "page[size]"
+    page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+    max_page_size = 100
+
+    def _decode_cursor(self, encoded_cursor: str) -> tuple[datetime, UUID] | None:
+        if not encoded_cursor:
+            return None
+        try:
+            inserted_at, pk = (
+                base64.urlsafe_b64decode(encoded_cursor.encode()).decode().split("|")
+            )
+            return datetime.fromisoformat(inserted_at), UUID(pk)
+        except (TypeError, ValueError):
+            raise NotFound("Invalid cursor.")
+
+    @staticmethod
+    def _encode_cursor(inserted_at: datetime, pk: UUID) -> str:
+        return base64.urlsafe_b64encode(
+            f"{inserted_at.isoformat()}|{pk}".encode()
+        ).decode()
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(
+                request.query_params.get(self.page_size_query_param, self.page_size)
+            )
+        except ValueError:
+            raise ValidationError({"page[size]": "A valid integer is required."})
+        if page_size < 1:
+            raise ValidationError({"page[size]": "Must be greater than 0."})
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get("sort"):
+            raise ValidationError(
+                {"sort": "Sorting is not supported with cursor pagination."}
+            )
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self._decode_cursor(
+            request.query_params.get(self.cursor_query_param, "")
+        )
+
+        queryset = queryset.order_by("-inserted_at", "-id")
+        if cursor:
+            inserted_at, pk = cursor
+            queryset = queryset.filter(
+                Q(inserted_at__lt=inserted_at) | Q(inserted_at=inserted_at, id__lt=pk),
+                # The UUIDv7 of a row is generated before its insertion, so the partitions of the following
+                # days can be skipped
+                id__lt=uuid7_start(datetime_to_uuid7(inserted_at + timedelta(days=1))),
+            )
+
+        rows = list(queryset.values_list("inserted_at", "id")[: self.page_size + 1])
+        self.next_cursor = (
+            self._encode_cursor(*rows[self.page_size - 1])
+            if len(rows) > self.page_size
+            else None
+        )
+        return [pk for _, pk in rows[: self.page_size]]
+
+    def get_paginated_response(self, data):
+        url = self.request.build_absolute_uri()
+        first = replace_query_param(url, self.cursor_query_param, "")
+        return Response(
+            {
+                "results": data,
+                "meta": {
+                    "pagination": {
+                        "size": self.page_size,
+                        "next_cursor": self.next_cursor,
+                    }
+                },
+                "links": {
+                    "first": first,
+                    "next": (
+                        replace_query_param(
+                            url, self.cursor_query_param, self.next_cursor
+                        )
+                        if self.next_cursor
+                        else None
+                    ),
+                    "prev": None,
+                },
+            }
+        )
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """Return True if the request asks for cursor pagination."""
+        return cls.cursor_query_param in request.query_params
@@ -3,6 +3,7 @@ from typing import Generator, Optional
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.db import connections, transaction
 from psqlextra.partitioning import (
     PostgresPartitioningManager,
     PostgresRangePartition,
@@ -13,6 +14,8 @@ from psqlextra.partitioning import (
 from psqlextra.partitioning.config import PostgresPartitioningConfig
 from uuid6 import UUID
 
+from api.db_router import MainRouter
+from api.db_utils import get_partition_bounds
 from api.models import Finding, ResourceFindingMapping
 from api.rls import RowLevelSecurityConstraint
 from api.uuid_utils import datetime_to_uuid7
@@ -156,10 +159,85 @@ class PostgresUUIDv7PartitioningStrategy(PostgresRangePartitioningStrategy):
         )
 
 
-def relative_days_or_none(value):
+def relative_months_or_none(value):
     if value is None:
         return None
-    return relativedelta(days=value)
+    return relativedelta(months=value)
+
+
+def get_expired_partitions(model, max_age: relativedelta) -> list[str]:
+    """
+    Return the range partitions of a UUIDv7 partitioned model whose rows are all older than `max_age`.
+
+    Args:
+        model: The partitioned model, e.g. Finding.
+        max_age (relativedelta): The age of the rows to keep.
+
+    Returns:
+        list[str]: The names of the expired partitions, oldest first.
+    """
+    expiration_uuid = datetime_to_uuid7(datetime.now(timezone.utc) - max_age)
+    return [
+        partition
+        for partition, _, to_value in get_partition_bounds(
+            model._meta.db_table, using=MainRouter.admin_db
+        )
+        # The upper bound is exclusive, the default partition has no bounds
+        if to_value is not None and to_value <= expiration_uuid
+    ]
+
+
+def apply_partitions_retention(
+    max_age_months: int, detach: bool = False, dry_run: bool = False
+) -> list[str]:
+    """
+    Drop or detach the findings and resource finding mappings partitions older than `max_age_months`.
+
+    Whole partitions are removed at once, for every tenant, instead of deleting their rows. The mappings reference
+    the findings, so their partitions are removed first and every partition is detached before being dropped.
+    Detached partitions are kept as standalone tables without foreign keys, so they can be archived.
+
+    Args:
+        max_age_months (int): The number of months of findings to keep.
+        detach (bool): Detach the partitions instead of dropping them.
+        dry_run (bool): Only return the partitions that would be removed.
+
+    Returns:
+        list[str]: The names of the removed partitions.
+    """
+    max_age = relativedelta(months=max_age_months)
+    removed_partitions = []
+    admin_connection = connections[MainRouter.admin_db]
+    quote_name = admin_connection.ops.quote_name
+    for model in (ResourceFindingMapping, Finding):
+        parent_table = model._meta.db_table
+        for partition in get_expired_partitions(model, max_age):
+            removed_partitions.append(partition)
+            if dry_run:
+                continue
+            with (
+                transaction.atomic(using=MainRouter.admin_db),
+                admin_connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    f"ALTER TABLE {quote_name(parent_table)} DETACH PARTITION {quote_name(partition)}"
+                )
+                if not detach:
+                    cursor.execute(f"DROP TABLE {quote_name(partition)}")
+                    continue
+                cursor.execute(
+                    """
+                    SELECT conname
+                    FROM pg_constraint
+                    WHERE conrelid = %s::regclass AND contype = 'f'
+                    """,
+                    [partition],
+                )
+                for (constraint,) in cursor.fetchall():
+                    cursor.execute(
+                        f"ALTER TABLE {quote_name(partition)} DROP CONSTRAINT {quote_name(constraint)}"
+                    )
+    return removed_partitions
 
 
 #
@@ -176,7 +254,7 @@ manager = PostgresPartitioningManager(
                     months=settings.FINDINGS_TABLE_PARTITION_MONTHS
                 ),
                 count=settings.FINDINGS_TABLE_PARTITION_COUNT,
-                max_age=relative_days_or_none(
+                max_age=relative_months_or_none(
                     settings.FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS
                 ),
                 name_format="%Y_%b",
@@ -192,7 +270,7 @@ manager = PostgresPartitioningManager(
                     months=settings.FINDINGS_TABLE_PARTITION_MONTHS
                 ),
                 count=settings.FINDINGS_TABLE_PARTITION_COUNT,
-                max_age=relative_days_or_none(
+                max_age=relative_months_or_none(
                     settings.FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS
                 ),
                 name_format="%Y_%b",
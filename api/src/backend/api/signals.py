@@ -1,16 +1,19 @@
 from celery import states
 from celery.signals import before_task_publish
 from config.celery import celery_app
-from django.db.models.signals import post_delete, pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django_celery_results.backends.database import DatabaseBackend
 
 from api.db_utils import delete_related_daily_task
 from api.models import (
+    LatestScan,
     LighthouseProviderConfiguration,
     LighthouseTenantConfiguration,
     Membership,
     Provider,
+    Scan,
+    StateChoices,
     TenantAPIKey,
     User,
 )
@@ -41,6 +44,13 @@ def delete_provider_scan_task(sender, instance, **kwargs):  # noqa: F841
     delete_related_daily_task(instance.id)
 
 
+@receiver(post_save, sender=Scan)
+def update_provider_latest_scan(sender, instance, **kwargs):  # noqa: F841
+    # Keep the latest completed scan of the provider up to date for the overviews
+    if instance.state == StateChoices.COMPLETED:
+        LatestScan.update_provider(instance.tenant_id, instance.provider_id)
+
+
 @receiver(pre_delete, sender=User)
 def revoke_user_api_keys(sender, instance, **kwargs):  # noqa: F841
     """
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from enum import Enum
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 import pytest
 from django.conf import settings
@@ -13,6 +14,7 @@ from api.db_utils import (
     enum_to_choices,
     generate_api_key_prefix,
     generate_random_token,
+    get_partition_bounds,
     one_week_from_now,
     update_objects_in_batches,
 )
@@ -146,6 +148,42 @@ class TestBatchDelete:
         assert summary == {"api.Provider": create_test_providers}
 
 
+class TestGetPartitionBounds:
+    def test_get_partition_bounds(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("findings_default", "DEFAULT"),
+            (
+                "findings_2025_feb",
+                "FOR VALUES FROM ('0194bd0e-6000-7000-8000-000000000000') TO ('01955217-9fff-7fff-bfff-ffffffffffff')",
+            ),
+            (
+                "findings_2025_jan",
+                "FOR VALUES FROM ('01941f29-7400-7000-8000-000000000000') TO ('0194bd0e-5fff-7fff-bfff-ffffffffffff')",
+            ),
+        ]
+        with patch("api.db_utils.connections") as mock_connections:
+            mock_connections.__getitem__.return_value.cursor.return_value.__enter__.return_value = (
+                cursor
+            )
+            partitions = get_partition_bounds("findings")
+
+        assert cursor.execute.call_args.args[1] == ["findings"]
+        assert partitions == [
+            (
+                "findings_2025_jan",
+                UUID("01941f29-7400-7000-8000-000000000000"),
+                UUID("0194bd0e-5fff-7fff-bfff-ffffffffffff"),
+            ),
+            (
+                "findings_2025_feb",
+                UUID("0194bd0e-6000-7000-8000-000000000000"),
+                UUID("01955217-9fff-7fff-bfff-ffffffffffff"),
+            ),
+            ("findings_default", None, None),
+        ]
+
+
 class TestShouldCreateIndexOnPartition:
     @freeze_time("2025-05-15 00:00:00Z")
     @pytest.mark.parametrize(
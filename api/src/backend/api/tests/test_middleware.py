@@ -54,3 +54,31 @@ def test_api_logging_middleware_logging(mock_logger):
                 }
 
                 mock_logger.info.assert_called_once_with("", extra=expected_extra)
+
+
+@pytest.mark.django_db
+def test_api_logging_middleware_logging_response_cache():
+    factory = RequestFactory()
+    request = factory.get("/api/v1/overviews/providers")
+
+    response = HttpResponse()
+    response["X-Prowler-Cache"] = "HIT"
+
+    get_response = MagicMock(return_value=response)
+
+    with patch("api.middleware.extract_auth_info") as mock_extract_auth_info:
+        mock_extract_auth_info.return_value = {
+            "user_id": "user123",
+            "tenant_id": "tenant456",
+            "api_key_prefix": "N/A",
+        }
+
+        with patch("api.middleware.logging.getLogger") as mock_get_logger:
+            mock_logger = MagicMock()
+            mock_get_logger.return_value = mock_logger
+
+            middleware = APILoggingMiddleware(get_response)
+            middleware(request)
+
+            _, kwargs = mock_logger.info.call_args
+            assert kwargs["extra"]["response_cache"] == "HIT"
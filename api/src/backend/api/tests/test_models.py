@@ -3,7 +3,16 @@ from allauth.socialaccount.models import SocialApp
 from django.core.exceptions import ValidationError
 
 from api.db_router import MainRouter
-from api.models import Resource, ResourceTag, SAMLConfiguration, SAMLDomainIndex
+from api.models import (
+    LatestScan,
+    Resource,
+    ResourceTag,
+    SAMLConfiguration,
+    SAMLDomainIndex,
+    Scan,
+    StateChoices,
+    TenantLatestScanSummary,
+)
 
 
 @pytest.mark.django_db
@@ -125,6 +134,116 @@ class TestResourceModel:
 #         assert Finding.objects.filter(uid=long_uid).exists()
 
 
+@pytest.mark.django_db
+class TestLatestScanModel:
+    def test_completed_scan_updates_latest_scan(self, scans_fixture):
+        scan1, _, scan3 = scans_fixture
+
+        latest_scan = LatestScan.objects.get(
+            tenant_id=scan1.tenant_id, provider=scan1.provider
+        )
+        assert latest_scan.scan_id == scan1.id
+        assert not LatestScan.objects.filter(
+            tenant_id=scan3.tenant_id, provider=scan3.provider
+        ).exists()
+
+        scan3.state = StateChoices.COMPLETED
+        scan3.save()
+
+        assert (
+            LatestScan.objects.get(
+                tenant_id=scan3.tenant_id, provider=scan3.provider
+            ).scan_id
+            == scan3.id
+        )
+
+    def test_update_provider_stores_summary(self, scans_fixture):
+        scan1, *_ = scans_fixture
+        LatestScan.objects.filter(tenant_id=scan1.tenant_id, scan=scan1).update(
+            summary={"total": 1}
+        )
+
+        new_scan = Scan.objects.create(
+            name="Scan 4",
+            provider=scan1.provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=scan1.tenant_id,
+        )
+
+        latest_scan = LatestScan.objects.get(
+            tenant_id=scan1.tenant_id, provider=scan1.provider
+        )
+        assert latest_scan.scan_id == new_scan.id
+        # The new scan has no scan summaries
+        assert latest_scan.summary == {}
+        assert (
+            TenantLatestScanSummary.objects.get(tenant_id=scan1.tenant_id).summary[
+                "total"
+            ]
+            == 0
+        )
+
+    def test_update_summary(self, tenants_fixture, scan_summaries_fixture):
+        tenant, *_ = tenants_fixture
+        scan = Scan.objects.get(tenant_id=tenant.id, name="overview scan")
+
+        expected = {
+            "_pass": 2,
+            "fail": 1,
+            "muted": 1,
+            "total": 4,
+            "new": 4,
+            "changed": 0,
+            "unchanged": 0,
+            "fail_new": 1,
+            "fail_changed": 0,
+            "pass_new": 2,
+            "pass_changed": 0,
+            "muted_new": 1,
+            "muted_changed": 0,
+        }
+        assert LatestScan.get_scan_summary(scan.id) == expected
+        assert (
+            LatestScan.objects.get(tenant_id=tenant.id, scan=scan).summary == expected
+        )
+        assert (
+            TenantLatestScanSummary.objects.get(tenant_id=tenant.id).summary == expected
+        )
+
+    def test_update_summary_not_latest_scan(self, scans_fixture):
+        _, scan2, _ = scans_fixture
+
+        LatestScan.update_summary(scan2.tenant_id, scan2.id)
+
+        assert not TenantLatestScanSummary.objects.filter(
+            tenant_id=scan2.tenant_id
+        ).exists()
+
+    def test_get_scan_summary_without_scan_summaries(self, scans_fixture):
+        scan1, *_ = scans_fixture
+
+        assert LatestScan.get_scan_summary(scan1.id) == {}
+
+    def test_update_tenant(self, scans_fixture):
+        scan1, _, scan3 = scans_fixture
+        LatestScan.objects.filter(tenant_id=scan1.tenant_id, scan=scan1).update(
+            summary={"total": 3, "fail": 1}
+        )
+        scan3.state = StateChoices.COMPLETED
+        scan3.save()
+        LatestScan.objects.filter(tenant_id=scan3.tenant_id, scan=scan3).update(
+            summary={"total": 2, "fail": 2}
+        )
+
+        TenantLatestScanSummary.update_tenant(scan1.tenant_id)
+
+        summary = TenantLatestScanSummary.objects.get(tenant_id=scan1.tenant_id).summary
+        assert summary["total"] == 5
+        assert summary["fail"] == 3
+        assert summary["_pass"] == 0
+
+
 @pytest.mark.django_db
 class TestSAMLConfigurationModel:
     VALID_METADATA = """<?xml version='1.0' encoding='UTF-8'?>
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, call, patch
+
+from dateutil.relativedelta import relativedelta
+from freezegun import freeze_time
+
+from api.models import Finding
+from api.partitions import apply_partitions_retention, get_expired_partitions
+from api.uuid_utils import datetime_to_uuid7
+
+
+def _partition_bounds(parent_table, using=None):
+    return [
+        (
+            f"{parent_table}_{month.strftime('%Y_%b').lower()}",
+            datetime_to_uuid7(month),
+            datetime_to_uuid7(month + relativedelta(months=1, microseconds=-1)),
+        )
+        for month in (
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 2, 1, tzinfo=timezone.utc),
+            datetime(2025, 3, 1, tzinfo=timezone.utc),
+        )
+    ] + [(f"{parent_table}_default", None, None)]
+
+
+@freeze_time("2025-04-15 00:00:00Z")
+@patch("api.partitions.get_partition_bounds", side_effect=_partition_bounds)
+class TestPartitionsRetention:
+    def test_get_expired_partitions(self, _):
+        assert get_expired_partitions(Finding, relativedelta(months=2)) == [
+            "findings_2025_jan"
+        ]
+        assert get_expired_partitions(Finding, relativedelta(months=1)) == [
+            "findings_2025_jan",
+            "findings_2025_feb",
+        ]
+
+    def test_apply_partitions_retention_dry_run(self, _):
+        with patch("api.partitions.connections") as mock_connections:
+            partitions = apply_partitions_retention(2, dry_run=True)
+
+        assert partitions == [
+            "resource_finding_mappings_2025_jan",
+            "findings_2025_jan",
+        ]
+        mock_connections.__getitem__.return_value.cursor.assert_not_called()
+
+    def test_apply_partitions_retention_drop(self, _):
+        cursor = MagicMock()
+        with (
+            patch("api.partitions.connections") as mock_connections,
+            patch("api.partitions.transaction"),
+        ):
+            admin_connection = mock_connections.__getitem__.return_value
+            admin_connection.ops.quote_name = lambda name: f'"{name}"'
+            admin_connection.cursor.return_value.__enter__.return_value = cursor
+            apply_partitions_retention(2)
+
+        assert cursor.execute.call_args_list == [
+            call(
+                'ALTER TABLE "resource_finding_mappings" DETACH PARTITION "resource_finding_mappings_2025_jan"'
+            ),
+            call('DROP TABLE "resource_finding_mappings_2025_jan"'),
+            call('ALTER TABLE "findings" DETACH PARTITION "findings_2025_jan"'),
+            call('DROP TABLE "findings_2025_jan"'),
+        ]
+
+    def test_apply_partitions_retention_detach(self, _):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("findings_fkey",)]
+        with (
+            patch("api.partitions.connections") as mock_connections,
+            patch("api.partitions.transaction"),
+        ):
+            admin_connection = mock_connections.__getitem__.return_value
+            admin_connection.ops.quote_name = lambda name: f'"{name}"'
+            admin_connection.cursor.return_value.__enter__.return_value = cursor
+            apply_partitions_retention(2, detach=True)
+
+        executed = [
+            execute_call.args[0] for execute_call in cursor.execute.call_args_list
+        ]
+        assert not any(statement.startswith("DROP TABLE") for statement in executed)
+        assert 'ALTER TABLE "findings" DETACH PARTITION "findings_2025_jan"' in executed
+        assert (
+            'ALTER TABLE "findings_2025_jan" DROP CONSTRAINT "findings_fkey"'
+            in executed
+        )
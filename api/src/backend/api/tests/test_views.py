@@ -1,3 +1,4 @@
+import csv
 import glob
 import io
 import json
@@ -30,6 +31,7 @@ from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.response import Response
 
+from api.cache import RESPONSE_CACHE_HEADER, invalidate_response_cache
 from api.compliance import get_compliance_frameworks
 from api.db_router import MainRouter
 from api.models import (
@@ -3533,6 +3535,98 @@ class TestFindingViewSet:
             == findings_fixture[0].status
         )
 
+    def test_findings_list_cursor_pagination(
+        self, authenticated_client, findings_fixture
+    ):
+        expected_ids = [
+            str(finding.id)
+            for finding in sorted(
+                findings_fixture,
+                key=lambda finding: (finding.inserted_at, finding.id),
+                reverse=True,
+            )
+        ]
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "", "page[size]": 1},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[:1]
+        next_cursor = response.json()["meta"]["pagination"]["next_cursor"]
+        assert next_cursor
+        assert response.json()["links"]["next"]
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {
+                "filter[inserted_at]": TODAY,
+                "page[cursor]": next_cursor,
+                "page[size]": 1,
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[1:2]
+        assert response.json()["meta"]["pagination"]["next_cursor"] is None
+        assert response.json()["links"]["next"] is None
+
+    def test_findings_list_cursor_pagination_invalid(
+        self, authenticated_client, findings_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "invalid"},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "", "sort": "severity"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_findings_export_ndjson(self, authenticated_client, findings_fixture):
+        response = authenticated_client.get(
+            reverse("finding-export", kwargs={"export_format": "ndjson"}),
+            {"filter[inserted_at]": TODAY},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        assert [row["id"] for row in rows] == sorted(
+            str(finding.id) for finding in findings_fixture
+        )
+        assert rows[0]["provider_type"] == findings_fixture[0].scan.provider.provider
+        assert rows[0]["resource_uids"] == [
+            resource.uid for resource in findings_fixture[0].resources.all()
+        ]
+
+    def test_findings_export_csv(self, authenticated_client, findings_fixture):
+        response = authenticated_client.get(
+            reverse("finding-export", kwargs={"export_format": "csv"}),
+            {"filter[inserted_at]": TODAY},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+
+        rows = list(
+            csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode()))
+        )
+        assert len(rows) == len(findings_fixture)
+        assert {row["uid"] for row in rows} == {
+            finding.uid for finding in findings_fixture
+        }
+
+    def test_findings_export_no_date_filter(self, authenticated_client):
+        response = authenticated_client.get(
+            reverse("finding-export", kwargs={"export_format": "csv"})
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     @pytest.mark.parametrize(
         "include_values, expected_resources",
         [
@@ -5787,6 +5881,42 @@ class TestOverviewViewSet:
         # Since we rely on completed scans, there are only 2 resources now
         assert response.json()["data"][0]["attributes"]["resources"]["total"] == 2
 
+    def test_overview_providers_list_cached(
+        self, authenticated_client, tenants_fixture, scan_summaries_fixture
+    ):
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers[RESPONSE_CACHE_HEADER] == "MISS"
+
+        cached_response = authenticated_client.get(reverse("overview-providers"))
+        assert cached_response.status_code == status.HTTP_200_OK
+        assert cached_response.headers[RESPONSE_CACHE_HEADER] == "HIT"
+        assert cached_response.json() == response.json()
+
+        invalidate_response_cache(str(tenants_fixture[0].id))
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.headers[RESPONSE_CACHE_HEADER] == "MISS"
+
+    def test_overview_findings_cache_key_by_filters(
+        self, authenticated_client, scan_summaries_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("overview-findings"),
+            {"filter[region]": "region1", "filter[provider_type]": "aws"},
+        )
+        assert response.headers[RESPONSE_CACHE_HEADER] == "MISS"
+
+        response = authenticated_client.get(
+            reverse("overview-findings"),
+            {"filter[provider_type]": "aws", "filter[region]": "region1"},
+        )
+        assert response.headers[RESPONSE_CACHE_HEADER] == "HIT"
+
+        response = authenticated_client.get(
+            reverse("overview-findings"), {"filter[region]": "region2"}
+        )
+        assert response.headers[RESPONSE_CACHE_HEADER] == "MISS"
+
     def test_overview_services_list_no_required_filters(
         self, authenticated_client, scan_summaries_fixture
     ):
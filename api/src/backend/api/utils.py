@@ -1,7 +1,12 @@
+import csv
+import io
+import json
 from datetime import datetime, timezone
+from typing import Iterator
 
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Subquery
 from rest_framework.exceptions import NotFound, ValidationError
 
@@ -21,6 +26,35 @@ from prowler.providers.github.github_provider import GithubProvider
 from prowler.providers.kubernetes.kubernetes_provider import KubernetesProvider
 from prowler.providers.m365.m365_provider import M365Provider
 
+# Columns of the findings export, besides the provider and the resources of every finding
+FINDINGS_EXPORT_FIELDS = (
+    "id",
+    "uid",
+    "inserted_at",
+    "updated_at",
+    "first_seen_at",
+    "scan_id",
+    "delta",
+    "status",
+    "status_extended",
+    "severity",
+    "impact",
+    "impact_extended",
+    "check_id",
+    "check_metadata",
+    "muted",
+    "muted_reason",
+    "resource_regions",
+    "resource_services",
+    "resource_types",
+)
+FINDINGS_EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# Rows read from the server-side cursor and written to the response at once
+FINDINGS_EXPORT_CHUNK_SIZE = 2000
+
 
 class CustomOAuth2Client(OAuth2Client):
     def __init__(self, client_id, secret, *args, **kwargs):
@@ -349,6 +383,58 @@ def get_findings_metadata_no_aggregations(tenant_id: str, filtered_queryset):
     return serializer.data
 
 
+def _to_csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+def stream_findings_export(
+    queryset, export_format: str, tenant_id: str, using: str = MainRouter.default_db
+) -> Iterator[str]:
+    """
+    Yield the rows of a findings `values()` queryset as NDJSON or CSV, in chunks of `FINDINGS_EXPORT_CHUNK_SIZE` rows.
+
+    The rows are read with a server-side cursor inside their own RLS transaction, so this can be consumed by a
+    `StreamingHttpResponse` after the view has returned and the memory used does not depend on the number of
+    findings.
+
+    Args:
+        queryset: The findings queryset, with the `values()` to export.
+        export_format (str): "ndjson" or "csv".
+        tenant_id (str): The tenant of the findings.
+        using (str): The database alias to read the findings from.
+    """
+    buffer = io.StringIO()
+    csv_writer = None
+    with rls_transaction(tenant_id, using=using):
+        for count, row in enumerate(
+            queryset.iterator(chunk_size=FINDINGS_EXPORT_CHUNK_SIZE), start=1
+        ):
+            if export_format == "csv":
+                if csv_writer is None:
+                    csv_writer = csv.DictWriter(buffer, fieldnames=list(row))
+                    csv_writer.writeheader()
+                csv_writer.writerow(
+                    {key: _to_csv_value(value) for key, value in row.items()}
+                )
+            else:
+                buffer.write(json.dumps(row, cls=DjangoJSONEncoder))
+                buffer.write("\n")
+
+            if count % FINDINGS_EXPORT_CHUNK_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+    yield buffer.getvalue()
+
+
 def initialize_prowler_integration(integration: Integration) -> Jira:
     # TODO Refactor other integrations to use this function
     if integration.integration_type == Integration.IntegrationChoices.JIRA:
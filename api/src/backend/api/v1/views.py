@@ -22,11 +22,11 @@ from config.settings.social_login import (
 from dj_rest_auth.registration.views import SocialLoginView
 from django.conf import settings as django_settings
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.expressions import ArraySubquery
 from django.contrib.postgres.search import SearchQuery
 from django.db import transaction
-from django.db.models import Count, F, Prefetch, Q, Subquery, Sum
-from django.db.models.functions import Coalesce
-from django.http import HttpResponse
+from django.db.models import Count, F, OuterRef, Prefetch, Q, Subquery, Sum
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.dateparse import parse_date
@@ -71,6 +71,7 @@ from tasks.tasks import (
 )
 
 from api.base_views import BaseRLSViewSet, BaseTenantViewset, BaseUserViewset
+from api.cache import cache_response
 from api.compliance import (
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
     get_compliance_frameworks,
@@ -110,6 +111,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScan,
     LighthouseConfiguration,
     LighthouseProviderConfiguration,
     LighthouseProviderModels,
@@ -135,15 +137,19 @@ from api.models import (
     StateChoices,
     Task,
     TenantAPIKey,
+    TenantLatestScanSummary,
     User,
     UserRoleRelationship,
 )
-from api.pagination import ComplianceOverviewPagination
+from api.pagination import ComplianceOverviewPagination, KeysetPagination
 from api.rbac.permissions import Permissions, get_providers, get_role
 from api.rls import Tenant
 from api.utils import (
+    FINDINGS_EXPORT_CONTENT_TYPES,
+    FINDINGS_EXPORT_FIELDS,
     CustomOAuth2Client,
     get_findings_metadata_no_aggregations,
+    stream_findings_export,
     validate_invitation,
 )
 from api.uuid_utils import datetime_to_uuid7, uuid7_start
@@ -2245,14 +2251,8 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         filtered_queryset = self.filter_queryset(self.get_queryset())
 
-        latest_scans = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id,
-                state=StateChoices.COMPLETED,
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values("provider_id")
+        latest_scans = LatestScan.objects.filter(tenant_id=tenant_id).values(
+            "provider_id"
         )
 
         filtered_queryset = filtered_queryset.filter(
@@ -2375,15 +2375,11 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         query_params = request.query_params
 
-        latest_scans_queryset = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-        )
-
         queryset = ResourceScanSummary.objects.filter(
             tenant_id=tenant_id,
-            scan_id__in=latest_scans_queryset.values_list("id", flat=True),
+            scan_id__in=LatestScan.objects.filter(tenant_id=tenant_id).values_list(
+                "scan_id", flat=True
+            ),
         )
 
         if service_filter := query_params.get("filter[service]") or query_params.get(
@@ -2480,6 +2476,32 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         "This is useful for dynamic filtering.",
         filters=True,
     ),
+    export=extend_schema(
+        tags=["Finding"],
+        summary="Export findings",
+        description="Stream all the findings matching the filters as NDJSON (one JSON object per line) or CSV, "
+        "ordered by ID. It is meant for bulk exports, e.g. to a SIEM, that would need too many pages of the list "
+        "endpoint.",
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                location=OpenApiParameter.PATH,
+                enum=list(FINDINGS_EXPORT_CONTENT_TYPES),
+                type=OpenApiTypes.STR,
+            ),
+            OpenApiParameter(
+                name="filter[inserted_at]",
+                description="At least one of the variations of the `filter[inserted_at]` filter must be provided.",
+                required=True,
+                type=OpenApiTypes.DATE,
+            ),
+        ],
+        filters=True,
+        responses={
+            (200, content_type): OpenApiTypes.STR
+            for content_type in FINDINGS_EXPORT_CONTENT_TYPES.values()
+        },
+    ),
 )
 @method_decorator(CACHE_DECORATOR, name="list")
 @method_decorator(CACHE_DECORATOR, name="retrieve")
@@ -2512,6 +2534,18 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
     # the provider through the provider group)
     required_permissions = []
 
+    @property
+    def pagination_class(self):
+        # Cursor pagination is opt-in, with the `page[cursor]` query parameter
+        request = getattr(self, "request", None)
+        if (
+            self.action in ["list", "latest"]
+            and request is not None
+            and KeysetPagination.is_requested(request)
+        ):
+            return KeysetPagination
+        return super().pagination_class
+
     def get_serializer_class(self):
         if self.action == "findings_services_regions":
             return FindingDynamicFilterSerializer
@@ -2553,6 +2587,12 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
             return queryset
         return super().filter_queryset(queryset)
 
+    def perform_content_negotiation(self, request, force=False):
+        # The export is not rendered, it is streamed in the requested format
+        return super().perform_content_negotiation(
+            request, force=force or self.action == "export"
+        )
+
     def list(self, request, *args, **kwargs):
         filtered_queryset = self.filter_queryset(self.get_queryset())
         return self.paginate_by_pk(
@@ -2563,6 +2603,40 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
             prefetch_related=["resources"],
         )
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_name="export",
+        url_path=r"export/(?P<export_format>ndjson|csv)",
+    )
+    def export(self, request, export_format: str):
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .using(self.db_alias)
+            .order_by("id")
+            .values(*FINDINGS_EXPORT_FIELDS)
+            .annotate(
+                provider_type=F("scan__provider__provider"),
+                provider_uid=F("scan__provider__uid"),
+                resource_uids=ArraySubquery(
+                    ResourceFindingMapping.objects.filter(
+                        tenant_id=request.tenant_id, finding_id=OuterRef("id")
+                    ).values("resource__uid")
+                ),
+            )
+        )
+        # The rows are read once the view has returned, in their own transaction
+        response = StreamingHttpResponse(
+            stream_findings_export(
+                queryset, export_format, request.tenant_id, self.db_alias
+            ),
+            content_type=FINDINGS_EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="findings.{export_format}"'
+        )
+        return response
+
     @action(detail=False, methods=["get"], url_name="findings_services_regions")
     def findings_services_regions(self, request):
         queryset = self.get_queryset()
@@ -2585,6 +2659,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         return Response(data=serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_name="metadata")
+    @cache_response
     def metadata(self, request):
         # Force filter validation
         filtered_queryset = self.filter_queryset(self.get_queryset())
@@ -2704,11 +2779,8 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         filtered_queryset = self.filter_queryset(self.get_queryset())
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
+        latest_scan_ids = LatestScan.objects.filter(tenant_id=tenant_id).values_list(
+            "scan_id", flat=True
         )
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
@@ -2728,17 +2800,14 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         url_name="metadata_latest",
         url_path="metadata/latest",
     )
+    @cache_response
     def metadata_latest(self, request):
         tenant_id = request.tenant_id
         query_params = request.query_params
 
-        latest_scans_queryset = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-        )
+        latest_scans_queryset = LatestScan.objects.filter(tenant_id=tenant_id)
         raw_latest_scans_ids = list(
-            latest_scans_queryset.values_list("id", "unique_resource_count")
+            latest_scans_queryset.values_list("scan_id", "scan__unique_resource_count")
         )
         latest_scans_ids = [
             scan_id for scan_id, count in raw_latest_scans_ids if count and count > 0
@@ -2746,7 +2815,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
 
         queryset = ResourceScanSummary.objects.filter(
             tenant_id=tenant_id,
-            scan_id__in=latest_scans_queryset.values_list("id", flat=True),
+            scan_id__in=latest_scans_queryset.values_list("scan_id", flat=True),
         )
         # ToRemove: Temporary fallback mechanism
         present_ids = set(
@@ -3769,38 +3838,24 @@ class OverviewViewSet(BaseRLSViewSet):
     def retrieve(self, request, *args, **kwargs):
         raise MethodNotAllowed(method="GET")
 
-    @action(detail=False, methods=["get"], url_name="providers")
-    def providers(self, request):
-        tenant_id = self.request.tenant_id
-        queryset = self.get_queryset()
+    def _get_latest_scans(self):
+        """Return the latest completed scan of each provider visible to the user."""
         provider_filter = (
             {"provider__in": self.allowed_providers}
             if hasattr(self, "allowed_providers")
             else {}
         )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
+        return LatestScan.objects.filter(
+            tenant_id=self.request.tenant_id, **provider_filter
         )
 
-        findings_aggregated = (
-            queryset.filter(scan_id__in=latest_scan_ids)
-            .values(
-                "scan__provider_id",
-                provider=F("scan__provider__provider"),
-            )
-            .annotate(
-                findings_passed=Coalesce(Sum("_pass"), 0),
-                findings_failed=Coalesce(Sum("fail"), 0),
-                findings_muted=Coalesce(Sum("muted"), 0),
-                total_findings=Coalesce(Sum("total"), 0),
-            )
-        )
+    @action(detail=False, methods=["get"], url_name="providers")
+    @cache_response
+    def providers(self, request):
+        tenant_id = self.request.tenant_id
+        self.get_queryset()
+
+        latest_scans = self._get_latest_scans().select_related("provider")
 
         resources_aggregated = (
             Resource.all_objects.filter(tenant_id=tenant_id)
@@ -3812,15 +3867,18 @@ class OverviewViewSet(BaseRLSViewSet):
         }
 
         overview = []
-        for row in findings_aggregated:
+        for latest_scan in latest_scans:
+            # Providers whose latest scan has no scan summaries are not part of the overview
+            if not latest_scan.summary:
+                continue
             overview.append(
                 {
-                    "provider": row["provider"],
-                    "total_resources": resource_map.get(row["scan__provider_id"], 0),
-                    "total_findings": row["total_findings"],
-                    "findings_passed": row["findings_passed"],
-                    "findings_failed": row["findings_failed"],
-                    "findings_muted": row["findings_muted"],
+                    "provider": latest_scan.provider.provider,
+                    "total_resources": resource_map.get(latest_scan.provider_id, 0),
+                    "total_findings": latest_scan.summary["total"],
+                    "findings_passed": latest_scan.summary["_pass"],
+                    "findings_failed": latest_scan.summary["fail"],
+                    "findings_muted": latest_scan.summary["muted"],
                 }
             )
 
@@ -3830,24 +3888,37 @@ class OverviewViewSet(BaseRLSViewSet):
         )
 
     @action(detail=False, methods=["get"], url_name="findings")
+    @cache_response
     def findings(self, request):
         tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
-        filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        # Without filters, the totals are the sum of the summaries of the latest scans
+        if not any(param.startswith("filter[") for param in request.query_params):
+            if hasattr(self, "allowed_providers"):
+                summaries = [
+                    summary or {}
+                    for summary in self._get_latest_scans().values_list(
+                        "summary", flat=True
+                    )
+                ]
+            else:
+                # The users that can see all the providers read the totals of the tenant
+                summaries = [
+                    TenantLatestScanSummary.objects.filter(tenant_id=tenant_id)
+                    .values_list("summary", flat=True)
+                    .first()
+                    or {}
+                ]
+            aggregated_totals = {
+                field: sum(summary.get(field, 0) for summary in summaries)
+                for field in LatestScan.SUMMARY_FIELDS
+            }
+            serializer = self.get_serializer(aggregated_totals)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        filtered_queryset = self.filter_queryset(queryset)
+        latest_scan_ids = self._get_latest_scans().values_list("scan_id", flat=True)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
         )
@@ -3876,6 +3947,7 @@ class OverviewViewSet(BaseRLSViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_name="findings_severity")
+    @cache_response
     def findings_severity(self, request):
         tenant_id = self.request.tenant_id
 
@@ -3885,20 +3957,7 @@ class OverviewViewSet(BaseRLSViewSet):
         )
 
         filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        latest_scan_ids = self._get_latest_scans().values_list("scan_id", flat=True)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
         )
@@ -3924,24 +3983,12 @@ class OverviewViewSet(BaseRLSViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_name="services")
+    @cache_response
     def services(self, request):
         tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        latest_scan_ids = self._get_latest_scans().values_list("scan_id", flat=True)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
         )
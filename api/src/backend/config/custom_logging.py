@@ -62,6 +62,8 @@ class NDJSONFormatter(logging.Formatter):
             log_record["duration"] = record.duration
         if hasattr(record, "status_code"):
             log_record["status_code"] = record.status_code
+        if hasattr(record, "response_cache"):
+            log_record["response_cache"] = record.response_cache
 
         if record.exc_info:
             log_record["exc_info"] = self.formatException(record.exc_info)
@@ -107,6 +109,8 @@ class HumanReadableFormatter(logging.Formatter):
             log_components.append(f"done in {record.duration}s:")
         if hasattr(record, "status_code"):
             log_components.append(f"{record.status_code}")
+        if hasattr(record, "response_cache"):
+            log_components.append(f"(cache {record.response_cache})")
 
         if record.exc_info:
             log_components.append(self.formatException(record.exc_info))
@@ -266,6 +266,16 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CACHE_MAX_AGE = env.int("DJANGO_CACHE_MAX_AGE", 3600)
 CACHE_STALE_WHILE_REVALIDATE = env.int("DJANGO_STALE_WHILE_REVALIDATE", 60)
 
+# Cache of the overview and findings metadata responses, shared by all the API workers
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://{VALKEY_HOST}:{VALKEY_PORT}/{env('DJANGO_CACHE_VALKEY_DB', default='1')}",  # noqa: F405
+    }
+}
+# The cached responses are invalidated when a scan is completed, this is only their maximum age
+RESPONSE_CACHE_TIMEOUT = env.int("DJANGO_RESPONSE_CACHE_TIMEOUT", 86400)
+
 
 TESTING = False
 
@@ -277,6 +287,8 @@ DJANGO_TMP_OUTPUT_DIRECTORY = env.str(
     "DJANGO_TMP_OUTPUT_DIRECTORY", "/tmp/prowler_api_output"
 )
 DJANGO_FINDINGS_BATCH_SIZE = env.str("DJANGO_FINDINGS_BATCH_SIZE", 1000)
+# Number of threads writing the output formats and the compliance CSVs of a scan
+DJANGO_OUTPUT_MAX_WORKERS = env.int("DJANGO_OUTPUT_MAX_WORKERS", 4)
 
 DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = env.str("DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET", "")
 DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID = env.str("DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID", "")
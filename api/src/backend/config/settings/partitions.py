@@ -14,3 +14,9 @@ FINDINGS_TABLE_PARTITION_COUNT = env.int("FINDINGS_TABLE_PARTITION_COUNT", 7)
 FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS = env.int(
     "FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS", None
 )
+
+# Set how the partitions older than FINDINGS_TABLE_PARTITION_MAX_AGE_MONTHS are removed by the findings_retention
+# command: "drop" deletes them and "detach" keeps them as standalone tables to be archived
+FINDINGS_TABLE_PARTITION_RETENTION_MODE = env.str(
+    "FINDINGS_TABLE_PARTITION_RETENTION_MODE", "drop"
+)
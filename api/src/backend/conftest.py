@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from allauth.socialaccount.models import SocialLogin
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection as django_connection
 from django.db import connections as django_connections
 from django.urls import reverse
@@ -21,6 +22,7 @@ from api.models import (
     Integration,
     IntegrationProviderRelationship,
     Invitation,
+    LatestScan,
     LighthouseConfiguration,
     Membership,
     Processor,
@@ -95,6 +97,12 @@ def disable_logging():
     logging.disable(logging.CRITICAL)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def create_test_user(django_db_setup, django_db_blocker):
     with django_db_blocker.unblock():
@@ -1143,6 +1151,8 @@ def scan_summaries_fixture(tenants_fixture, providers_fixture):
         muted_changed=0,
         scan=scan,
     )
+    # The scan stores the summary of its latest scan with its scan summaries
+    LatestScan.update_summary(tenant.id, scan.id)
 
 
 @pytest.fixture
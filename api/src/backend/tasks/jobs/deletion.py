@@ -1,13 +1,109 @@
 from celery.utils.log import get_task_logger
 from django.db import DatabaseError
+from django.db.models import Q
 
 from api.db_router import MainRouter
-from api.db_utils import batch_delete, rls_transaction
-from api.models import Finding, Provider, Resource, Scan, ScanSummary, Tenant
+from api.db_utils import batch_delete, get_partition_bounds, rls_transaction
+from api.models import (
+    Finding,
+    Provider,
+    Resource,
+    ResourceFindingMapping,
+    Scan,
+    ScanSummary,
+    Tenant,
+    TenantLatestScanSummary,
+)
 
 logger = get_task_logger(__name__)
 
 
+def _get_default_partition_filter(field: str, partition_ranges: list[tuple]) -> Q:
+    """
+    Returns the filter of the rows outside the ranges of the partitions, which are the rows of the default partition.
+
+    Postgres prunes the range partitions with this filter, so only the default partition is read.
+
+    Args:
+        field (str): The UUIDv7 field the table is partitioned by, e.g. "id".
+        partition_ranges (list[tuple]): (from value, to value) of every range partition, sorted by the from value.
+
+    Returns:
+        Q: The filter of the default partition, empty if the table is not partitioned.
+    """
+    if not partition_ranges:
+        return Q()
+
+    merged_ranges = [list(partition_ranges[0])]
+    for from_value, to_value in partition_ranges[1:]:
+        if from_value <= merged_ranges[-1][1]:
+            merged_ranges[-1][1] = max(merged_ranges[-1][1], to_value)
+        else:
+            merged_ranges.append([from_value, to_value])
+
+    default_filter = Q(**{f"{field}__lt": merged_ranges[0][0]}) | Q(
+        **{f"{field}__gte": merged_ranges[-1][1]}
+    )
+    # The gaps between the ranges are also stored in the default partition
+    for (_, gap_start), (gap_end, _) in zip(merged_ranges, merged_ranges[1:]):
+        default_filter |= Q(**{f"{field}__gte": gap_start, f"{field}__lt": gap_end})
+    return default_filter
+
+
+def delete_findings(tenant_id: str, queryset) -> tuple[int, dict]:
+    """
+    Deletes the findings of the queryset and their resource mappings, one partition at a time.
+
+    Every partition is cleaned with a single set-based DELETE bounded by its UUIDv7 range, so Postgres only reads
+    that partition and the findings are not loaded to be deleted in batches. The partitions are shared by all the
+    tenants, so they are cleaned instead of dropped.
+
+    Args:
+        tenant_id (str): Tenant ID the findings belong to.
+        queryset (QuerySet): The findings to delete, it must not join other tables.
+
+    Returns:
+        tuple: (total_deleted, deletion_summary)
+    """
+    partition_ranges = [
+        (from_value, to_value)
+        for _, from_value, to_value in get_partition_bounds(Finding._meta.db_table)
+        if from_value is not None
+    ]
+    partition_filters = [
+        (
+            Q(id__gte=from_value, id__lt=to_value),
+            Q(finding_id__gte=from_value, finding_id__lt=to_value),
+        )
+        for from_value, to_value in partition_ranges
+    ]
+    # The default partition, or the whole table if it is not partitioned
+    partition_filters.append(
+        (
+            _get_default_partition_filter("id", partition_ranges),
+            _get_default_partition_filter("finding_id", partition_ranges),
+        )
+    )
+
+    deletion_summary = {
+        ResourceFindingMapping._meta.label: 0,
+        Finding._meta.label: 0,
+    }
+    for findings_filter, mappings_filter in partition_filters:
+        findings = queryset.filter(findings_filter)
+        mappings = ResourceFindingMapping.all_objects.filter(
+            mappings_filter, tenant_id=tenant_id
+        )
+        with rls_transaction(tenant_id):
+            # Raw deletes skip the Django collector, the mappings are the only rows referencing the findings
+            deletion_summary[ResourceFindingMapping._meta.label] += mappings.filter(
+                finding_id__in=findings.values("id")
+            )._raw_delete(mappings.db)
+            deletion_summary[Finding._meta.label] += findings._raw_delete(findings.db)
+
+    return sum(deletion_summary.values()), deletion_summary
+
+
 def delete_provider(tenant_id: str, pk: str):
     """
     Gracefully deletes an instance of a provider along with its related data.
@@ -28,14 +124,23 @@ def delete_provider(tenant_id: str, pk: str):
         deletion_summary = {}
         deletion_steps = [
             ("Scan Summaries", ScanSummary.all_objects.filter(scan__provider=instance)),
-            ("Findings", Finding.all_objects.filter(scan__provider=instance)),
+            (
+                "Findings",
+                Finding.all_objects.filter(
+                    tenant_id=tenant_id,
+                    scan_id__in=Scan.all_objects.filter(provider=instance).values("id"),
+                ),
+            ),
             ("Resources", Resource.all_objects.filter(provider=instance)),
             ("Scans", Scan.all_objects.filter(provider=instance)),
         ]
 
     for step_name, queryset in deletion_steps:
         try:
-            _, step_summary = batch_delete(tenant_id, queryset)
+            if queryset.model is Finding:
+                _, step_summary = delete_findings(tenant_id, queryset)
+            else:
+                _, step_summary = batch_delete(tenant_id, queryset)
             deletion_summary.update(step_summary)
         except DatabaseError as db_error:
             logger.error(f"Error deleting {step_name}: {db_error}")
@@ -44,6 +149,8 @@ def delete_provider(tenant_id: str, pk: str):
     try:
         with rls_transaction(tenant_id):
             _, provider_summary = instance.delete()
+            # The latest scan of the provider is deleted with it
+            TenantLatestScanSummary.update_tenant(tenant_id)
         deletion_summary.update(provider_summary)
     except DatabaseError as db_error:
         logger.error(f"Error deleting Provider: {db_error}")
@@ -1,5 +1,6 @@
 import os
 import re
+import threading
 import zipfile
 
 import boto3
@@ -124,30 +125,81 @@ OUTPUT_FORMATS_MAPPING = {
 }
 
 
-def _compress_output_files(output_directory: str) -> str:
+class OutputArchive:
+    """
+    ZIP archive of the output files of a scan, filled while the outputs are generated.
+
+    Every output file is compressed as soon as its writer closes it, so the compression of the
+    finished files overlaps with the writers that are still running. The archive is created with the
+    first file and is thread-safe, since the writers run in a thread pool.
+    """
+
+    def __init__(self, output_directory: str):
+        self.zip_path = f"{output_directory}.zip"
+        self.parent_dir = os.path.dirname(output_directory)
+        self._zip_file = None
+        self._archived_files = set()
+        self._lock = threading.Lock()
+
+    def add(self, file_path: str | None):
+        """
+        Add a file to the archive, with its path relative to the parent of the output directory.
+
+        Files that do not exist or were already added are skipped.
+        """
+        if not isinstance(file_path, str) or not os.path.isfile(file_path):
+            return
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            if file_path in self._archived_files or file_path == os.path.abspath(
+                self.zip_path
+            ):
+                return
+            if self._zip_file is None:
+                self._zip_file = zipfile.ZipFile(
+                    self.zip_path, "w", zipfile.ZIP_DEFLATED
+                )
+            self._zip_file.write(
+                file_path, os.path.relpath(file_path, start=self.parent_dir)
+            )
+            self._archived_files.add(file_path)
+
+    def close(self) -> str:
+        """
+        Add the remaining files of the parent of the output directory and close the archive.
+
+        Returns:
+            str: The full path to the ZIP archive.
+        """
+        for foldername, _, filenames in os.walk(self.parent_dir):
+            for filename in filenames:
+                self.add(os.path.join(foldername, filename))
+        with self._lock:
+            if self._zip_file is None:
+                self._zip_file = zipfile.ZipFile(
+                    self.zip_path, "w", zipfile.ZIP_DEFLATED
+                )
+            self._zip_file.close()
+        return self.zip_path
+
+
+def _compress_output_files(
+    output_directory: str, archive: OutputArchive | None = None
+) -> str:
     """
     Compress output files from all configured output formats into a ZIP archive.
     Args:
         output_directory (str): The directory where the output files are located.
             The function looks up all known suffixes in OUTPUT_FORMATS_MAPPING
             and compresses those files into a single ZIP.
+        archive (OutputArchive, optional): The archive already filled while the
+            outputs were generated. Only the files missing in it are compressed.
     Returns:
         str: The full path to the newly created ZIP archive.
     """
-    zip_path = f"{output_directory}.zip"
-    parent_dir = os.path.dirname(output_directory)
-    zip_path_abs = os.path.abspath(zip_path)
-
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for foldername, _, filenames in os.walk(parent_dir):
-            for filename in filenames:
-                file_path = os.path.join(foldername, filename)
-                if os.path.abspath(file_path) == zip_path_abs:
-                    continue
-                arcname = os.path.relpath(file_path, start=parent_dir)
-                zipf.write(file_path, arcname)
-
-    return zip_path
+    if archive is None:
+        archive = OutputArchive(output_directory)
+    return archive.close()
 
 
 def get_s3_client():
@@ -13,6 +13,7 @@ from prowler.lib.outputs.asff.asff import ASFF
 from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
 from prowler.lib.outputs.csv.csv import CSV
 from prowler.lib.outputs.finding import Finding as FindingOutput
+from prowler.lib.outputs.finding import FindingContext
 from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.ocsf.ocsf import OCSF
 from prowler.providers.aws.aws_provider import AwsProvider
@@ -271,6 +272,7 @@ def upload_security_hub_integration(
 
             # Initialize prowler provider for finding transformation
             prowler_provider = initialize_prowler_provider(provider)
+            finding_context = FindingContext(prowler_provider)
 
         # Process each Security Hub integration
         integration_executions = 0
@@ -304,7 +306,7 @@ def upload_security_hub_integration(
                         # Transform findings for this batch
                         transformed_findings = [
                             FindingOutput.transform_api_finding(
-                                finding, prowler_provider
+                                finding, prowler_provider, context=finding_context
                             )
                             for finding in batch
                         ]
@@ -34,6 +34,7 @@ from api.models import Finding, Provider, ScanSummary, StatusChoices
 from api.utils import initialize_prowler_provider
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.outputs.finding import Finding as FindingOutput
+from prowler.lib.outputs.finding import FindingContext
 
 pdfmetrics.registerFont(
     TTFont(
@@ -524,13 +525,14 @@ def _load_findings_for_requirement_checks(
         .iterator()
     )
 
+    finding_context = FindingContext(prowler_provider)
     with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
         for batch, is_last_batch in batched(
             findings_queryset, DJANGO_FINDINGS_BATCH_SIZE
         ):
             for finding_model in batch:
                 finding_output = FindingOutput.transform_api_finding(
-                    finding_model, prowler_provider
+                    finding_model, prowler_provider, context=finding_context
                 )
                 findings_by_check_id[finding_output.check_id].append(finding_output)
 
@@ -1,4 +1,5 @@
 import csv
+import hashlib
 import io
 import json
 import time
@@ -11,8 +12,9 @@ from typing import Any
 from celery.utils.log import get_task_logger
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
 from django.db import IntegrityError, OperationalError
-from django.db.models import Case, Count, IntegerField, Prefetch, Sum, When
-from tasks.utils import CustomEncoder
+from django.db.models import Case, Count, F, IntegerField, Prefetch, Sum, When
+from django.db.models.functions import MD5
+from tasks.utils import CustomEncoder, batched
 
 from api.compliance import (
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
@@ -30,11 +32,14 @@ from api.exceptions import ProviderConnectionError
 from api.models import (
     ComplianceRequirementOverview,
     Finding,
+    LatestScan,
     Processor,
     Provider,
     Resource,
+    ResourceFindingMapping,
     ResourceScanSummary,
     ResourceTag,
+    ResourceTagMapping,
     Scan,
     ScanSummary,
     StateChoices,
@@ -69,6 +74,26 @@ COMPLIANCE_REQUIREMENT_COPY_COLUMNS = (
     "scan_id",
 )
 
+# Compliance framework whose requirements also count the passed and total findings
+THREATSCORE_COMPLIANCE_ID = "ProwlerThreatScore-1.0"
+
+# Counters of `ScanSummary`, aggregated for each check, service, severity and region
+SCAN_SUMMARY_COUNTERS = (
+    "fail",
+    "_pass",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+)
+
 
 def _create_finding_delta(
     last_status: FindingStatus | None | str, new_status: FindingStatus | None
@@ -136,6 +161,727 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _get_or_create_batch_resources(
+    tenant_id: str, provider_instance: Provider, findings: list[ProwlerFinding]
+) -> dict[str, Resource]:
+    """
+    Get or create the resources of a batch of findings with one query and one multi-row insert.
+
+    New resources are created with the fields of the first finding that references them. Resources
+    created at the same time by another scan are kept, since the resources are fetched again after
+    inserting them.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the resources.
+        provider_instance (Provider): The provider instance associated with the resources.
+        findings (list[ProwlerFinding]): The findings whose resources are not cached yet.
+
+    Returns:
+        dict[str, Resource]: The resources by UID.
+    """
+    resource_uids = {finding.resource_uid for finding in findings}
+    if not resource_uids:
+        return {}
+    resources = {
+        resource.uid: resource
+        for resource in Resource.objects.filter(
+            tenant_id=tenant_id, provider=provider_instance, uid__in=resource_uids
+        )
+    }
+
+    new_resources = {}
+    for finding in findings:
+        if finding.resource_uid in resources or finding.resource_uid in new_resources:
+            continue
+        new_resources[finding.resource_uid] = Resource(
+            tenant_id=tenant_id,
+            provider=provider_instance,
+            uid=finding.resource_uid,
+            region=finding.region,
+            service=finding.service_name,
+            type=finding.resource_type,
+            name=finding.resource_name,
+            metadata=json.dumps(finding.resource_metadata, cls=CustomEncoder),
+            details=finding.resource_details,
+            partition=finding.partition,
+        )
+    if new_resources:
+        Resource.objects.bulk_create(
+            new_resources.values(), batch_size=500, ignore_conflicts=True
+        )
+        resources.update(
+            {
+                resource.uid: resource
+                for resource in Resource.objects.filter(
+                    tenant_id=tenant_id,
+                    provider=provider_instance,
+                    uid__in=new_resources.keys(),
+                )
+            }
+        )
+    return resources
+
+
+def _get_or_create_batch_tags(
+    tenant_id: str, tag_keys: set[tuple[str, str]]
+) -> dict[tuple[str, str], ResourceTag]:
+    """
+    Get or create the given resource tags with one multi-row insert and one query.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the tags.
+        tag_keys (set[tuple[str, str]]): The (key, value) pairs of the tags.
+
+    Returns:
+        dict[tuple[str, str], ResourceTag]: The tags by (key, value).
+    """
+    if not tag_keys:
+        return {}
+    ResourceTag.objects.bulk_create(
+        [
+            ResourceTag(tenant_id=tenant_id, key=key, value=value)
+            for key, value in tag_keys
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+    return {
+        (tag.key, tag.value): tag
+        for tag in ResourceTag.objects.filter(
+            tenant_id=tenant_id,
+            key__in={key for key, _ in tag_keys},
+            value__in={value for _, value in tag_keys},
+        )
+        if (tag.key, tag.value) in tag_keys
+    }
+
+
+def _update_resource_fields(resource_instance: Resource, finding: ProwlerFinding):
+    """Update the fields of a resource with the values of one of its findings."""
+    if finding.region:
+        resource_instance.region = finding.region
+    resource_instance.service = finding.service_name
+    resource_instance.type = finding.resource_type
+    resource_instance.metadata = json.dumps(
+        finding.resource_metadata, cls=CustomEncoder
+    )
+    resource_instance.details = finding.resource_details
+    resource_instance.partition = finding.partition
+
+
+def _hash_resource_value(value: str | None) -> str | None:
+    """Return the MD5 of a resource text field, the same value returned by the PostgreSQL `md5` function."""
+    return hashlib.md5(value.encode()).hexdigest() if value is not None else None
+
+
+def _get_resource_state(resource_instance: Resource) -> tuple:
+    """Return the resource fields updated by the findings, with the metadata and details hashed."""
+    return (
+        resource_instance.region,
+        resource_instance.service,
+        resource_instance.type,
+        resource_instance.partition,
+        _hash_resource_value(resource_instance.metadata),
+        _hash_resource_value(resource_instance.details),
+    )
+
+
+def _load_provider_resources(tenant_id: str, provider_id: str) -> dict[str, tuple]:
+    """
+    Load the stored resources of a provider with the state of the fields updated by the findings.
+
+    The metadata and details are hashed by the database, so the scan can skip the resources that did
+    not change without reading their full JSON.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the resources.
+        provider_id (str): The ID of the scanned provider.
+
+    Returns:
+        dict[str, tuple]: (resource ID, failed findings count, state) by resource UID, the state as
+            returned by `_get_resource_state`.
+    """
+    # The resources are read from the primary database, since they decide which resources are inserted
+    # or updated and the read replica can lag behind the writes of the previous scan
+    with rls_transaction(tenant_id):
+        return {
+            uid: (
+                resource_id,
+                failed_findings_count,
+                (region, service, resource_type, partition, metadata, details),
+            )
+            for (
+                uid,
+                resource_id,
+                failed_findings_count,
+                region,
+                service,
+                resource_type,
+                partition,
+                metadata,
+                details,
+            ) in Resource.all_objects.filter(
+                tenant_id=tenant_id, provider_id=provider_id
+            )
+            .annotate(metadata_hash=MD5("metadata"), details_hash=MD5("details"))
+            .values_list(
+                "uid",
+                "id",
+                "failed_findings_count",
+                "region",
+                "service",
+                "type",
+                "partition",
+                "metadata_hash",
+                "details_hash",
+            )
+            .iterator(chunk_size=5000)
+        }
+
+
+def _load_provider_resource_tags(
+    tenant_id: str, provider_id: str
+) -> tuple[dict[tuple[str, str], uuid.UUID], set[tuple[uuid.UUID, uuid.UUID]]]:
+    """
+    Load the tags of the stored resources of a provider.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the resources.
+        provider_id (str): The ID of the scanned provider.
+
+    Returns:
+        tuple:
+            - dict[tuple[str, str], UUID]: Tag IDs by (key, value).
+            - set[tuple[UUID, UUID]]: The (resource ID, tag ID) mappings.
+    """
+    tag_ids = {}
+    resource_tags = set()
+    # Read from the primary database like the resources, the missing tags and mappings are inserted
+    with rls_transaction(tenant_id):
+        for resource_id, tag_id, key, value in (
+            ResourceTagMapping.objects.filter(
+                tenant_id=tenant_id, resource__provider_id=provider_id
+            )
+            .values_list("resource_id", "tag_id", "tag__key", "tag__value")
+            .iterator(chunk_size=5000)
+        ):
+            tag_ids[(key, value)] = tag_id
+            resource_tags.add((resource_id, tag_id))
+    return tag_ids, resource_tags
+
+
+def _store_resource_tags(
+    tenant_id: str,
+    scan_resource_tags: set[tuple[uuid.UUID, str, str]],
+    tag_ids: dict[tuple[str, str], uuid.UUID],
+    resource_tags: set[tuple[uuid.UUID, uuid.UUID]],
+):
+    """
+    Create the tags and the tag mappings of the resources found in a scan that are not stored yet.
+
+    Like `Resource.upsert_or_delete_tags`, the tags are only added, with one multi-row insert for the
+    missing tags and another one for the missing mappings.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the resources.
+        scan_resource_tags (set[tuple[UUID, str, str]]): (resource ID, key, value) of the resource tags
+            found in the scan.
+        tag_ids (dict[tuple[str, str], UUID]): Tag IDs by (key, value), updated in place.
+        resource_tags (set[tuple[UUID, UUID]]): The stored (resource ID, tag ID) mappings, updated in place.
+    """
+    if not scan_resource_tags:
+        return
+    missing_tags = {
+        (key, value)
+        for _, key, value in scan_resource_tags
+        if (key, value) not in tag_ids
+    }
+    with rls_transaction(tenant_id):
+        for tag_keys, _ in batched(sorted(missing_tags), 500):
+            tag_ids.update(
+                {
+                    tag_key: tag_instance.id
+                    for tag_key, tag_instance in _get_or_create_batch_tags(
+                        tenant_id, set(tag_keys)
+                    ).items()
+                }
+            )
+        new_resource_tags = {
+            (resource_id, tag_ids[(key, value)])
+            for resource_id, key, value in scan_resource_tags
+        } - resource_tags
+        ResourceTagMapping.objects.bulk_create(
+            [
+                ResourceTagMapping(
+                    tenant_id=tenant_id, resource_id=resource_id, tag_id=tag_id
+                )
+                for resource_id, tag_id in new_resource_tags
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+    resource_tags.update(new_resource_tags)
+
+
+def _load_previous_scan_findings_status(
+    tenant_id: str, provider_id: str, scan_id: str
+) -> dict[str, tuple]:
+    """
+    Load the status and first seen date of the findings of the last completed scan of a provider.
+
+    The findings are streamed from the read replica with a single query, so the delta and the first
+    seen date of the findings of a scan do not need a query for each finding UID.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the scans.
+        provider_id (str): The ID of the scanned provider.
+        scan_id (str): The ID of the running scan, which is excluded.
+
+    Returns:
+        dict[str, tuple]: (status, first_seen_at) by finding UID.
+    """
+    findings_status = {}
+    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
+        previous_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .exclude(id=scan_id)
+            .order_by(F("completed_at").desc(nulls_last=True))
+            .values_list("id", flat=True)
+            .first()
+        )
+        if previous_scan_id is None:
+            return findings_status
+
+        # Findings are ordered by ID (UUIDv7), so the latest finding of each UID is kept
+        for uid, status, first_seen_at in (
+            Finding.all_objects.filter(tenant_id=tenant_id, scan_id=previous_scan_id)
+            .order_by("id")
+            .values_list("uid", "status", "first_seen_at")
+            .iterator(chunk_size=5000)
+        ):
+            findings_status[uid] = status, first_seen_at
+    return findings_status
+
+
+def _load_findings_status(
+    tenant_id: str, finding_uids: set[str], findings_status: dict[str, tuple]
+):
+    """
+    Load the status and first seen date of the most recent finding of each UID with a single query.
+
+    It is used for the findings that were not in the last scan of the provider, e.g. findings of
+    checks that were not executed in that scan. UIDs without previous findings get (None, None).
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the findings.
+        finding_uids (set[str]): The UIDs of the findings.
+        findings_status (dict[str, tuple]): (status, first_seen_at) by finding UID, updated in place.
+    """
+    if not finding_uids:
+        return
+    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
+        for uid, status, first_seen_at in (
+            Finding.all_objects.filter(tenant_id=tenant_id, uid__in=finding_uids)
+            .order_by("uid", "-inserted_at")
+            .distinct("uid")
+            .values_list("uid", "status", "first_seen_at")
+        ):
+            findings_status[uid] = status, first_seen_at
+    for uid in finding_uids:
+        findings_status.setdefault(uid, (None, None))
+
+
+def _ingest_findings_batch(
+    tenant_id: str,
+    provider_instance: Provider,
+    scan_instance: Scan,
+    findings: list[ProwlerFinding],
+    resource_cache: dict[str, Resource],
+    stored_resources: dict[str, tuple],
+    tag_ids: dict[tuple[str, str], uuid.UUID],
+    resource_tags: set[tuple[uuid.UUID, uuid.UUID]],
+    scan_resource_tags: set[tuple[uuid.UUID, str, str]],
+    last_status_cache: dict[str, tuple],
+) -> list[tuple[Finding, Resource]]:
+    """
+    Store a batch of findings with their resources using multi-row inserts and updates.
+
+    The batch is written in a single transaction, retried on deadlocks and integrity errors, and the
+    caches are only updated once it is committed. The findings keep the resource fields they had at
+    the moment each one was processed, as if they were stored one by one.
+
+    Only the new resources are inserted and only the resources whose fields changed are updated, by
+    comparing them with their stored state, the other resources found in the scan only get their update
+    date once. The tags not stored yet are collected in `scan_resource_tags`, to be stored at the end of
+    the scan by `_store_resource_tags`.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the findings.
+        provider_instance (Provider): The provider instance that was scanned.
+        scan_instance (Scan): The scan the findings belong to.
+        findings (list[ProwlerFinding]): The findings of the batch.
+        resource_cache (dict[str, Resource]): Resources by UID already found in this scan.
+        stored_resources (dict[str, tuple]): Stored resources by UID, see `_load_provider_resources`.
+        tag_ids (dict[tuple[str, str], UUID]): Stored tag IDs by (key, value).
+        resource_tags (set[tuple[UUID, UUID]]): Stored (resource ID, tag ID) mappings.
+        scan_resource_tags (set[tuple[UUID, str, str]]): (resource ID, key, value) of the resource tags of
+            the scan that are not stored yet, updated in place.
+        last_status_cache (dict[str, tuple]): Status and first seen date of the previous finding by UID, see
+            `_load_previous_scan_findings_status`.
+
+    Returns:
+        list[tuple[Finding, Resource]]: The stored findings with their resource.
+    """
+    if not findings:
+        return []
+
+    # Get the status of the previous findings not found in the last scan of the provider
+    _load_findings_status(
+        tenant_id,
+        {finding.uid for finding in findings} - last_status_cache.keys(),
+        last_status_cache,
+    )
+
+    for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
+        try:
+            with rls_transaction(tenant_id):
+                batch_resources = _get_or_create_batch_resources(
+                    tenant_id,
+                    provider_instance,
+                    [
+                        finding
+                        for finding in findings
+                        if finding.resource_uid not in resource_cache
+                        and finding.resource_uid not in stored_resources
+                    ],
+                )
+                batch_states = {
+                    resource_uid: (
+                        resource_instance.id,
+                        resource_instance.failed_findings_count,
+                        _get_resource_state(resource_instance),
+                    )
+                    for resource_uid, resource_instance in batch_resources.items()
+                }
+                for finding in findings:
+                    resource_uid = finding.resource_uid
+                    if (
+                        resource_uid in resource_cache
+                        or resource_uid in batch_resources
+                    ):
+                        continue
+                    # Stored resource, its fields are set from the findings
+                    resource_id, failed_findings_count, state = stored_resources[
+                        resource_uid
+                    ]
+                    batch_resources[resource_uid] = Resource(
+                        id=resource_id,
+                        tenant_id=tenant_id,
+                        provider=provider_instance,
+                        uid=resource_uid,
+                        region=state[0],
+                        service=state[1],
+                        type=state[2],
+                        partition=state[3],
+                        failed_findings_count=failed_findings_count,
+                    )
+
+                updated_at = datetime.now(tz=timezone.utc)
+                changed_resources = {}
+                batch_resource_tags = set()
+                batch_findings = []
+                for finding in findings:
+                    resource_uid = finding.resource_uid
+                    resource_instance = resource_cache.get(
+                        resource_uid
+                    ) or batch_resources.get(resource_uid)
+                    _update_resource_fields(resource_instance, finding)
+                    resource_state = _get_resource_state(resource_instance)
+                    resource_id, failed_findings_count, stored_state = (
+                        batch_states.get(resource_uid) or stored_resources[resource_uid]
+                    )
+                    if resource_state != stored_state:
+                        resource_instance.updated_at = updated_at
+                        changed_resources[resource_uid] = resource_instance
+                        batch_states[resource_uid] = (
+                            resource_id,
+                            failed_findings_count,
+                            resource_state,
+                        )
+
+                    for key, value in finding.resource_tags.items():
+                        if (resource_instance.id, tag_ids.get((key, value))) not in (
+                            resource_tags
+                        ):
+                            batch_resource_tags.add((resource_instance.id, key, value))
+
+                    last_status, last_first_seen_at = last_status_cache[finding.uid]
+                    status = FindingStatus[finding.status]
+                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
+                    # assigned a current date as first_seen_at and the successive findings with the same UID will
+                    # always get the date of the previous finding.
+                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
+                    # attribute will be assigned the current date, the following findings will get that date.
+                    if not last_first_seen_at:
+                        last_first_seen_at = datetime.now(tz=timezone.utc)
+                        last_status_cache[finding.uid] = last_status, last_first_seen_at
+
+                    batch_findings.append(
+                        (
+                            Finding(
+                                tenant_id=tenant_id,
+                                uid=finding.uid,
+                                delta=_create_finding_delta(last_status, status),
+                                check_metadata=finding.get_metadata(),
+                                status=status,
+                                status_extended=finding.status_extended,
+                                severity=finding.severity,
+                                impact=finding.severity,
+                                raw_result=finding.raw,
+                                check_id=finding.check_id,
+                                scan=scan_instance,
+                                first_seen_at=last_first_seen_at,
+                                muted=finding.muted,
+                                # If the finding is muted at this time the reason must be the configured Mutelist,
+                                # with the rule muting it when it is known
+                                muted_reason=(
+                                    (finding.muted_reason or "Muted by mutelist")
+                                    if finding.muted
+                                    else None
+                                ),
+                                compliance=finding.compliance,
+                                resource_regions=[resource_instance.region],
+                                resource_services=[resource_instance.service],
+                                resource_types=[resource_instance.type],
+                            ),
+                            resource_instance,
+                        )
+                    )
+
+                Resource.objects.bulk_update(
+                    changed_resources.values(),
+                    [
+                        "region",
+                        "service",
+                        "type",
+                        "metadata",
+                        "details",
+                        "partition",
+                        "updated_at",
+                    ],
+                    batch_size=500,
+                )
+                # The unchanged resources found for the first time in the scan only get their update date
+                Resource.all_objects.filter(
+                    tenant_id=tenant_id,
+                    id__in=[
+                        resource_instance.id
+                        for resource_uid, resource_instance in batch_resources.items()
+                        if resource_uid not in changed_resources
+                    ],
+                ).update(updated_at=updated_at)
+                Finding.objects.bulk_create(
+                    [finding_instance for finding_instance, _ in batch_findings],
+                    batch_size=500,
+                )
+                ResourceFindingMapping.objects.bulk_create(
+                    [
+                        ResourceFindingMapping(
+                            tenant_id=tenant_id,
+                            resource=resource_instance,
+                            finding=finding_instance,
+                        )
+                        for finding_instance, resource_instance in batch_findings
+                    ],
+                    batch_size=500,
+                )
+        except (OperationalError, IntegrityError) as db_err:
+            if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
+                logger.warning(
+                    f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
+                    f"detected when storing {len(findings)} findings on scan {scan_instance.id}. Retrying..."
+                )
+                time.sleep(0.1 * (2**attempt))
+                continue
+            raise db_err
+        break
+
+    resource_cache.update(batch_resources)
+    stored_resources.update(batch_states)
+    scan_resource_tags.update(batch_resource_tags)
+    return batch_findings
+
+
+def _aggregate_finding(scan_summaries: dict[tuple, dict], finding_instance: Finding):
+    """
+    Add a stored finding to the `ScanSummary` counters of its check, service, severity and region.
+
+    The counters are the same ones computed by `aggregate_findings` from the database.
+
+    Args:
+        scan_summaries (dict[tuple, dict]): Counters by (check_id, service, severity, region), updated in place.
+        finding_instance (Finding): The finding, with the fields of its resource.
+    """
+    key = (
+        finding_instance.check_id,
+        finding_instance.resource_services[0],
+        finding_instance.severity,
+        finding_instance.resource_regions[0],
+    )
+    counters = scan_summaries.get(key)
+    if counters is None:
+        counters = scan_summaries[key] = dict.fromkeys(SCAN_SUMMARY_COUNTERS, 0)
+
+    counters["total"] += 1
+    delta = finding_instance.delta
+    if finding_instance.muted:
+        counters["muted"] += 1
+        if delta == Finding.DeltaChoices.NEW:
+            counters["muted_new"] += 1
+        elif delta == Finding.DeltaChoices.CHANGED:
+            counters["muted_changed"] += 1
+        return
+
+    if finding_instance.status == FindingStatus.FAIL:
+        counters["fail"] += 1
+        if delta == Finding.DeltaChoices.NEW:
+            counters["fail_new"] += 1
+        elif delta == Finding.DeltaChoices.CHANGED:
+            counters["fail_changed"] += 1
+    elif finding_instance.status == FindingStatus.PASS:
+        counters["_pass"] += 1
+        if delta == Finding.DeltaChoices.NEW:
+            counters["pass_new"] += 1
+        elif delta == Finding.DeltaChoices.CHANGED:
+            counters["pass_changed"] += 1
+
+    if delta == Finding.DeltaChoices.NEW:
+        counters["new"] += 1
+    elif delta == Finding.DeltaChoices.CHANGED:
+        counters["changed"] += 1
+    else:
+        counters["unchanged"] += 1
+
+
+def _aggregate_compliance_finding(
+    compliance_summary: dict[str, dict],
+    region: str,
+    check_id: str,
+    status: str,
+    compliance: dict | None,
+):
+    """
+    Add a non-muted finding to the compliance summary of a scan.
+
+    The compliance summary is the intermediate used by `create_compliance_requirements`, with:
+        - check_status_by_region: the status of each check by region, FAIL if any of its findings failed.
+        - findings_count_by_compliance: the passed and total findings of each ProwlerThreatScore
+          requirement by region.
+
+    Args:
+        compliance_summary (dict[str, dict]): The compliance summary, updated in place.
+        region (str): The region of the finding resource.
+        check_id (str): The check of the finding.
+        status (str): The status of the finding.
+        compliance (dict | None): The compliance requirements of the finding by framework.
+    """
+    check_status = compliance_summary["check_status_by_region"].setdefault(region, {})
+    if check_status.get(check_id) != "FAIL":
+        check_status[check_id] = str(status)
+
+    if compliance and THREATSCORE_COMPLIANCE_ID in compliance:
+        requirements_count = (
+            compliance_summary["findings_count_by_compliance"]
+            .setdefault(region, {})
+            .setdefault(THREATSCORE_COMPLIANCE_ID.lower().replace("-", ""), {})
+        )
+        for requirement_id in compliance[THREATSCORE_COMPLIANCE_ID]:
+            requirement_count = requirements_count.setdefault(
+                requirement_id, {"total": 0, "pass": 0}
+            )
+            requirement_count["total"] += 1
+            if status == "PASS":
+                requirement_count["pass"] += 1
+
+
+def _load_compliance_summary(tenant_id: str, scan_id: str) -> dict[str, dict]:
+    """
+    Build the compliance summary of a scan from its non-muted findings in the database.
+
+    It is only used for the scans stored without the compliance summary.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the scan belongs.
+        scan_id (str): The ID of the scan.
+
+    Returns:
+        dict[str, dict]: The compliance summary, see `_aggregate_compliance_finding`.
+    """
+    compliance_summary = {
+        "check_status_by_region": {},
+        "findings_count_by_compliance": {},
+    }
+    findings = (
+        Finding.all_objects.filter(scan_id=scan_id, muted=False)
+        .only("id", "check_id", "status", "compliance")
+        .prefetch_related(
+            Prefetch(
+                "resources",
+                queryset=Resource.objects.only("id", "region"),
+                to_attr="small_resources",
+            )
+        )
+        .iterator(chunk_size=1000)
+    )
+    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
+        for finding in findings:
+            for resource in finding.small_resources:
+                _aggregate_compliance_finding(
+                    compliance_summary,
+                    resource.region,
+                    finding.check_id,
+                    finding.status,
+                    finding.compliance,
+                )
+    return compliance_summary
+
+
+def _store_scan_summaries(
+    tenant_id: str, scan_id: str, scan_summaries: dict[tuple, dict]
+):
+    """
+    Store the `ScanSummary` counters aggregated during the scan in one bulk insert.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the scan belongs.
+        scan_id (str): The ID of the scan.
+        scan_summaries (dict[tuple, dict]): Counters by (check_id, service, severity, region).
+    """
+    with rls_transaction(tenant_id):
+        ScanSummary.objects.bulk_create(
+            [
+                ScanSummary(
+                    tenant_id=tenant_id,
+                    scan_id=scan_id,
+                    check_id=check_id,
+                    service=service,
+                    severity=severity,
+                    region=region,
+                    **counters,
+                )
+                for (check_id, service, severity, region), counters in (
+                    scan_summaries.items()
+                )
+            ],
+            batch_size=3000,
+        )
+        LatestScan.update_summary(tenant_id, scan_id)
+
+
 def _copy_compliance_requirement_rows(
     tenant_id: str, rows: list[dict[str, Any]]
 ) -> None:
@@ -279,6 +1025,11 @@ def perform_prowler_scan(
     exception = None
     unique_resources = set()
     scan_resource_cache: set[tuple[str, str, str, str]] = set()
+    scan_summaries: dict[tuple, dict] = {}
+    compliance_summary = {
+        "check_status_by_region": {},
+        "findings_count_by_compliance": {},
+    }
     start_time = time.time()
     exc = None
 
@@ -328,180 +1079,79 @@ def perform_prowler_scan(
         prowler_scan = ProwlerScan(provider=prowler_provider, checks=checks_to_execute)
 
         resource_cache = {}
-        tag_cache = {}
-        last_status_cache = {}
+        stored_resources = _load_provider_resources(tenant_id, provider_id)
+        tag_ids, resource_tags = _load_provider_resource_tags(tenant_id, provider_id)
+        scan_resource_tags = set()
+        last_status_cache = _load_previous_scan_findings_status(
+            tenant_id, provider_id, scan_id
+        )
         resource_failed_findings_cache = defaultdict(int)
 
         for progress, findings in prowler_scan.scan():
+            batch = []
             for finding in findings:
                 if finding is None:
                     logger.error(f"None finding detected on scan {scan_id}.")
                     continue
-                for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
-                    try:
-                        with rls_transaction(tenant_id):
-                            # Process resource
-                            resource_uid = finding.resource_uid
-                            if resource_uid not in resource_cache:
-                                # Get or create the resource
-                                resource_instance, _ = Resource.objects.get_or_create(
-                                    tenant_id=tenant_id,
-                                    provider=provider_instance,
-                                    uid=resource_uid,
-                                    defaults={
-                                        "region": finding.region,
-                                        "service": finding.service_name,
-                                        "type": finding.resource_type,
-                                        "name": finding.resource_name,
-                                    },
-                                )
-                                resource_cache[resource_uid] = resource_instance
-
-                                # Initialize all processed resources in the cache
-                                resource_failed_findings_cache[resource_uid] = 0
-                            else:
-                                resource_instance = resource_cache[resource_uid]
-
-                        # Update resource fields if necessary
-                        updated_fields = []
-                        if (
-                            finding.region
-                            and resource_instance.region != finding.region
-                        ):
-                            resource_instance.region = finding.region
-                            updated_fields.append("region")
-                        if resource_instance.service != finding.service_name:
-                            resource_instance.service = finding.service_name
-                            updated_fields.append("service")
-                        if resource_instance.type != finding.resource_type:
-                            resource_instance.type = finding.resource_type
-                            updated_fields.append("type")
-                        if resource_instance.metadata != finding.resource_metadata:
-                            resource_instance.metadata = json.dumps(
-                                finding.resource_metadata, cls=CustomEncoder
-                            )
-                            updated_fields.append("metadata")
-                        if resource_instance.details != finding.resource_details:
-                            resource_instance.details = finding.resource_details
-                            updated_fields.append("details")
-                        if resource_instance.partition != finding.partition:
-                            resource_instance.partition = finding.partition
-                            updated_fields.append("partition")
-                        if updated_fields:
-                            with rls_transaction(tenant_id):
-                                resource_instance.save(update_fields=updated_fields)
-                    except (OperationalError, IntegrityError) as db_err:
-                        if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
-                            logger.warning(
-                                f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
-                                f"detected when processing resource {resource_uid} on scan {scan_id}. Retrying..."
-                            )
-                            time.sleep(0.1 * (2**attempt))
-                            continue
-                        else:
-                            raise db_err
-
-                # Update tags
-                tags = []
-                with rls_transaction(tenant_id):
-                    for key, value in finding.resource_tags.items():
-                        tag_key = (key, value)
-                        if tag_key not in tag_cache:
-                            tag_instance, _ = ResourceTag.objects.get_or_create(
-                                tenant_id=tenant_id, key=key, value=value
-                            )
-                            tag_cache[tag_key] = tag_instance
-                        else:
-                            tag_instance = tag_cache[tag_key]
-                        tags.append(tag_instance)
-                    resource_instance.upsert_or_delete_tags(tags=tags)
-
-                unique_resources.add((resource_instance.uid, resource_instance.region))
-
-                # Process finding
-                with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
-                    finding_uid = finding.uid
-                    last_first_seen_at = None
-                    if finding_uid not in last_status_cache:
-                        most_recent_finding = (
-                            Finding.all_objects.filter(
-                                tenant_id=tenant_id, uid=finding_uid
-                            )
-                            .order_by("-inserted_at")
-                            .values("status", "first_seen_at")
-                            .first()
-                        )
-                        last_status = None
-                        if most_recent_finding:
-                            last_status = most_recent_finding["status"]
-                            last_first_seen_at = most_recent_finding["first_seen_at"]
-                        last_status_cache[finding_uid] = last_status, last_first_seen_at
-                    else:
-                        last_status, last_first_seen_at = last_status_cache[finding_uid]
-
-                    status = FindingStatus[finding.status]
-                    delta = _create_finding_delta(last_status, status)
-                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
-                    # assigned a current date as first_seen_at and the successive findings with the same UID will
-                    # always get the date of the previous finding.
-                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
-                    # attribute will be assigned the current date, the following findings will get that date.
-                    if not last_first_seen_at:
-                        last_first_seen_at = datetime.now(tz=timezone.utc)
-
-                    # If the finding is muted at this time the reason must be the configured Mutelist
-                    muted_reason = "Muted by mutelist" if finding.muted else None
-
-                    # Increment failed_findings_count cache if the finding status is FAIL and not muted
-                    if status == FindingStatus.FAIL and not finding.muted:
-                        resource_uid = finding.resource_uid
-                        resource_failed_findings_cache[resource_uid] += 1
-
-                with rls_transaction(tenant_id):
-                    # Create the finding
-                    finding_instance = Finding.objects.create(
-                        tenant_id=tenant_id,
-                        uid=finding_uid,
-                        delta=delta,
-                        check_metadata=finding.get_metadata(),
-                        status=status,
-                        status_extended=finding.status_extended,
-                        severity=finding.severity,
-                        impact=finding.severity,
-                        raw_result=finding.raw,
-                        check_id=finding.check_id,
-                        scan=scan_instance,
-                        first_seen_at=last_first_seen_at,
-                        muted=finding.muted,
-                        muted_reason=muted_reason,
-                        compliance=finding.compliance,
-                    )
-                    finding_instance.add_resources([resource_instance])
+                batch.append(finding)
+
+            for finding_instance, resource_instance in _ingest_findings_batch(
+                tenant_id,
+                provider_instance,
+                scan_instance,
+                batch,
+                resource_cache,
+                stored_resources,
+                tag_ids,
+                resource_tags,
+                scan_resource_tags,
+                last_status_cache,
+            ):
+                region = finding_instance.resource_regions[0]
+                service = finding_instance.resource_services[0]
+                resource_type = finding_instance.resource_types[0]
+                unique_resources.add((resource_instance.uid, region))
+
+                # Increment failed_findings_count cache if the finding status is FAIL and not muted
+                if (
+                    finding_instance.status == FindingStatus.FAIL
+                    and not finding_instance.muted
+                ):
+                    resource_failed_findings_cache[resource_instance.uid] += 1
 
                 # Update scan resource summaries
                 scan_resource_cache.add(
-                    (
-                        str(resource_instance.id),
-                        resource_instance.service,
-                        resource_instance.region,
-                        resource_instance.type,
-                    )
+                    (str(resource_instance.id), service, region, resource_type)
                 )
+                _aggregate_finding(scan_summaries, finding_instance)
+                if not finding_instance.muted:
+                    _aggregate_compliance_finding(
+                        compliance_summary,
+                        region,
+                        finding_instance.check_id,
+                        finding_instance.status,
+                        finding_instance.compliance,
+                    )
 
             # Update scan progress
             with rls_transaction(tenant_id):
                 scan_instance.progress = progress
                 scan_instance.save()
 
+        _store_resource_tags(tenant_id, scan_resource_tags, tag_ids, resource_tags)
+
         scan_instance.state = StateChoices.COMPLETED
+        scan_instance.compliance_summary = compliance_summary
 
-        # Update failed_findings_count for all resources in batches if scan completed successfully
-        if resource_failed_findings_cache:
+        # Update failed_findings_count for the resources of the scan whose count changed, if scan completed successfully
+        if resource_cache:
             resources_to_update = []
-            for resource_uid, failed_count in resource_failed_findings_cache.items():
-                if resource_uid in resource_cache:
-                    resource_instance = resource_cache[resource_uid]
-                    resource_instance.failed_findings_count = failed_count
+            for resource_uid, resource_instance in resource_cache.items():
+                failed_findings_count = resource_failed_findings_cache.get(
+                    resource_uid, 0
+                )
+                if failed_findings_count != stored_resources[resource_uid][1]:
+                    resource_instance.failed_findings_count = failed_findings_count
                     resources_to_update.append(resource_instance)
 
             if resources_to_update:
@@ -528,6 +1178,17 @@ def perform_prowler_scan(
     if exception is not None:
         raise exception
 
+    # If they cannot be stored, the scan summaries are aggregated from the database by `aggregate_findings`
+    try:
+        _store_scan_summaries(tenant_id, scan_id, scan_summaries)
+    except Exception as summary_exception:
+        import sentry_sdk
+
+        sentry_sdk.capture_exception(summary_exception)
+        logger.error(
+            f"Error storing the scan summaries for scan {scan_id}: {summary_exception}"
+        )
+
     try:
         resource_scan_summaries = [
             ResourceScanSummary(
@@ -560,6 +1221,10 @@ def aggregate_findings(tenant_id: str, scan_id: str):
     """
     Aggregates findings for a given scan and stores the results in the ScanSummary table.
 
+    The scan summaries are aggregated while the findings are stored by `perform_prowler_scan`, so this
+    function only aggregates them from the database for the scans without them, e.g. scans stored
+    before that or scans whose summaries could not be stored.
+
     This function retrieves all findings associated with a given `scan_id` and calculates various
     metrics such as counts of failed, passed, and muted findings, as well as their deltas (new,
     changed, unchanged). The results are grouped by `check_id`, `service`, `severity`, and `region`.
@@ -587,6 +1252,13 @@ def aggregate_findings(tenant_id: str, scan_id: str):
         - muted_new: Muted findings with a delta of 'new'.
         - muted_changed: Muted findings with a delta of 'changed'.
     """
+    with rls_transaction(tenant_id):
+        if ScanSummary.all_objects.filter(
+            tenant_id=tenant_id, scan_id=scan_id
+        ).exists():
+            logger.info(f"Scan summaries already stored for scan {scan_id}")
+            return
+
     with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
         findings = Finding.objects.filter(tenant_id=tenant_id, scan_id=scan_id)
 
@@ -709,6 +1381,7 @@ def aggregate_findings(tenant_id: str, scan_id: str):
             for agg in aggregation
         }
         ScanSummary.objects.bulk_create(scan_aggregations, batch_size=3000)
+        LatestScan.update_summary(tenant_id, scan_id)
 
 
 def create_compliance_requirements(tenant_id: str, scan_id: str):
@@ -738,11 +1411,8 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
         compliance_template = PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE[
             provider_instance.provider
         ]
-        modeled_threatscore_compliance_id = "ProwlerThreatScore-1.0"
         threatscore_requirements_by_check: dict[str, set[str]] = {}
-        threatscore_framework = compliance_template.get(
-            modeled_threatscore_compliance_id
-        )
+        threatscore_framework = compliance_template.get(THREATSCORE_COMPLIANCE_ID)
         if threatscore_framework:
             for requirement_id, requirement in threatscore_framework[
                 "requirements"
@@ -752,50 +1422,14 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
                         requirement_id
                     )
 
-        # Get check status data by region from findings
-        findings = (
-            Finding.all_objects.filter(scan_id=scan_id, muted=False)
-            .only("id", "check_id", "status", "compliance")
-            .prefetch_related(
-                Prefetch(
-                    "resources",
-                    queryset=Resource.objects.only("id", "region"),
-                    to_attr="small_resources",
-                )
-            )
-            .iterator(chunk_size=1000)
-        )
-
-        findings_count_by_compliance = {}
-        check_status_by_region = {}
-        with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
-            for finding in findings:
-                for resource in finding.small_resources:
-                    region = resource.region
-                    current_status = check_status_by_region.setdefault(region, {})
-                    if current_status.get(finding.check_id) != "FAIL":
-                        current_status[finding.check_id] = finding.status
-                    if modeled_threatscore_compliance_id in finding.compliance:
-                        for requirement_id in finding.compliance[
-                            modeled_threatscore_compliance_id
-                        ]:
-                            compliance_key = findings_count_by_compliance.setdefault(
-                                region, {}
-                            ).setdefault(
-                                modeled_threatscore_compliance_id.lower().replace(
-                                    "-", ""
-                                ),
-                                {},
-                            )
-                            if requirement_id not in compliance_key:
-                                compliance_key[requirement_id] = {
-                                    "total": 0,
-                                    "pass": 0,
-                                }
-
-                            compliance_key[requirement_id]["total"] += 1
-                            if finding.status == "PASS":
-                                compliance_key[requirement_id]["pass"] += 1
+        # Get check status data by region from the summary stored with the scan
+        compliance_summary = scan_instance.compliance_summary
+        if compliance_summary is None:
+            compliance_summary = _load_compliance_summary(tenant_id, scan_id)
+        check_status_by_region = compliance_summary["check_status_by_region"]
+        findings_count_by_compliance = compliance_summary[
+            "findings_count_by_compliance"
+        ]
 
         try:
             # Try to get regions from provider
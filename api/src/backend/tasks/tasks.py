@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from shutil import rmtree
@@ -6,7 +7,11 @@ from shutil import rmtree
 from celery import chain, group, shared_task
 from celery.utils.log import get_task_logger
 from config.celery import RLSTask
-from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from config.django.base import (
+    DJANGO_FINDINGS_BATCH_SIZE,
+    DJANGO_OUTPUT_MAX_WORKERS,
+    DJANGO_TMP_OUTPUT_DIRECTORY,
+)
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.backfill import backfill_resource_scan_summaries
 from tasks.jobs.connection import (
@@ -18,6 +23,7 @@ from tasks.jobs.deletion import delete_provider, delete_tenant
 from tasks.jobs.export import (
     COMPLIANCE_CLASS_MAP,
     OUTPUT_FORMATS_MAPPING,
+    OutputArchive,
     _compress_output_files,
     _generate_output_directory,
     _upload_to_s3,
@@ -39,6 +45,7 @@ from tasks.jobs.scan import (
 )
 from tasks.utils import batched, get_next_execution_datetime
 
+from api.cache import invalidate_response_cache
 from api.compliance import get_compliance_frameworks
 from api.db_router import READ_REPLICA_ALIAS
 from api.db_utils import rls_transaction
@@ -47,8 +54,9 @@ from api.models import Finding, Integration, Provider, Scan, ScanSummary, StateC
 from api.utils import initialize_prowler_provider
 from api.v1.serializers import ScanTaskSerializer
 from prowler.lib.check.compliance_models import Compliance
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.compliance_writers import ComplianceFanOut
 from prowler.lib.outputs.finding import Finding as FindingOutput
+from prowler.lib.outputs.finding import FindingContext
 
 logger = get_task_logger(__name__)
 
@@ -67,6 +75,7 @@ def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str)
     )
     chain(
         perform_scan_summary_task.si(tenant_id=tenant_id, scan_id=scan_id),
+        invalidate_response_cache_task.si(tenant_id=tenant_id),
         generate_outputs_task.si(
             scan_id=scan_id, provider_id=provider_id, tenant_id=tenant_id
         ),
@@ -131,7 +140,9 @@ def delete_provider_task(provider_id: str, tenant_id: str):
             - A dictionary with the count of deleted instances per model,
               including related models if cascading deletes were triggered.
     """
-    return delete_provider(tenant_id=tenant_id, pk=provider_id)
+    deletion_summary = delete_provider(tenant_id=tenant_id, pk=provider_id)
+    invalidate_response_cache(tenant_id)
+    return deletion_summary
 
 
 @shared_task(base=RLSTask, name="scan-perform", queue="scans")
@@ -276,6 +287,17 @@ def perform_scan_summary_task(tenant_id: str, scan_id: str):
     return aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
 
 
+@shared_task(name="response-cache-invalidation", queue="overview")
+def invalidate_response_cache_task(tenant_id: str):
+    """
+    Task to invalidate the cached overview and findings metadata responses of a tenant.
+
+    Args:
+        tenant_id (str): The tenant ID whose cached responses are invalidated.
+    """
+    invalidate_response_cache(tenant_id)
+
+
 @shared_task(name="tenant-deletion", queue="deletion", autoretry_for=(Exception,))
 def delete_tenant_task(tenant_id: str):
     return delete_tenant(pk=tenant_id)
@@ -334,7 +356,14 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         return w, initialization
 
     output_writers = {}
-    compliance_writers = {}
+    # The findings of every batch are routed to the compliance frameworks of their checks in a single pass
+    compliance_fan_out = ComplianceFanOut(
+        provider_type,
+        {name: frameworks_bulk[name] for name in frameworks_avail},
+        file_path=comp_dir,
+        from_cli=False,
+        compliance_output_classes=COMPLIANCE_CLASS_MAP,
+    )
 
     scan_summary = FindingOutput._transform_findings_stats(
         ScanSummary.objects.filter(scan_id=scan_id)
@@ -350,17 +379,46 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         )
         generate_asff = security_hub_integrations.exists()
 
+    def write_batch(writer, transform_args, write_kwargs, is_last):
+        """
+        Write a batch of findings with the given writer, which is already transformed if
+        `transform_args` is None, and add its file to the archive after the last batch.
+        """
+        if transform_args is not None:
+            writer.transform(*transform_args)
+        writer.batch_write_data_to_file(**write_kwargs)
+        writer._data.clear()
+        if is_last:
+            archive.add(getattr(writer, "file_path", None))
+
+    archive = OutputArchive(out_dir)
+    finding_context = FindingContext(prowler_provider)
     qs = (
         Finding.all_objects.filter(tenant_id=tenant_id, scan_id=scan_id)
         .order_by("uid")
         .iterator()
     )
-    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
+    # Each batch is transformed once and written by every writer in the thread pool, while the next
+    # batch is fetched and transformed. A writer only gets a new batch when the previous one is written.
+    pending_writes = []
+    with (
+        ThreadPoolExecutor(
+            max_workers=DJANGO_OUTPUT_MAX_WORKERS, thread_name_prefix="outputs"
+        ) as executor,
+        rls_transaction(tenant_id, using=READ_REPLICA_ALIAS),
+    ):
         for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
             fos = [
-                FindingOutput.transform_api_finding(f, prowler_provider) for f in batch
+                FindingOutput.transform_api_finding(
+                    f, prowler_provider, context=finding_context
+                )
+                for f in batch
             ]
 
+            for pending_write in pending_writes:
+                pending_write.result()
+            pending_writes = []
+
             # Outputs
             for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
                 # Skip ASFF generation if not needed
@@ -384,40 +442,35 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
                     ),
                     is_last,
                 )
-                if not initialization:
-                    writer.transform(fos)
-                writer.batch_write_data_to_file(**extra)
-                writer._data.clear()
+                pending_writes.append(
+                    executor.submit(
+                        write_batch,
+                        writer,
+                        None if initialization else (fos,),
+                        extra,
+                        is_last,
+                    )
+                )
 
             # Compliance CSVs
-            for name in frameworks_avail:
-                compliance_obj = frameworks_bulk[name]
-
-                klass = GenericCompliance
-                for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
-                    if condition(name):
-                        klass = cls
-                        break
-
-                filename = f"{comp_dir}_{name}.csv"
-
-                writer, initialization = get_writer(
-                    compliance_writers,
-                    name,
-                    lambda klass=klass, fos=fos: klass(
-                        findings=fos,
-                        compliance=compliance_obj,
-                        file_path=filename,
-                        from_cli=False,
-                    ),
-                    is_last,
+            for writer, transform_args in compliance_fan_out.get_transform_args(fos):
+                if not writer.file_descriptor:
+                    writer.create_file_descriptor(writer.file_path)
+                writer.close_file = is_last
+                pending_writes.append(
+                    executor.submit(
+                        write_batch,
+                        writer,
+                        transform_args,
+                        {},
+                        is_last,
+                    )
                 )
-                if not initialization:
-                    writer.transform(fos, compliance_obj, name)
-                writer.batch_write_data_to_file()
-                writer._data.clear()
 
-    compressed = _compress_output_files(out_dir)
+        for pending_write in pending_writes:
+            pending_write.result()
+
+    compressed = _compress_output_files(out_dir, archive)
 
     upload_uri = _upload_to_s3(
         tenant_id,
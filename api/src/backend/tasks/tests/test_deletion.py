@@ -1,8 +1,115 @@
+from unittest.mock import patch
+from uuid import UUID
+
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
-from tasks.jobs.deletion import delete_provider, delete_tenant
+from django.db.models import Q
+from tasks.jobs.deletion import (
+    _get_default_partition_filter,
+    delete_findings,
+    delete_provider,
+    delete_tenant,
+)
+
+from api.models import Finding, Provider, ResourceFindingMapping, Tenant
+from api.uuid_utils import datetime_to_uuid7
+
+
+@pytest.mark.django_db
+class TestDeleteFindings:
+    def test_delete_findings(self, findings_fixture):
+        finding1, finding2 = findings_fixture
+        tenant_id = str(finding1.tenant_id)
+
+        total_deleted, summary = delete_findings(
+            tenant_id, Finding.all_objects.filter(id=finding1.id)
+        )
+
+        assert total_deleted == 2
+        assert summary == {"api.ResourceFindingMapping": 1, "api.Finding": 1}
+        assert list(Finding.objects.all()) == [finding2]
+        assert list(
+            ResourceFindingMapping.objects.values_list("finding_id", flat=True)
+        ) == [finding2.id]
+
+    def test_delete_findings_by_partition(self, findings_fixture):
+        finding1, _ = findings_fixture
+        tenant_id = str(finding1.tenant_id)
+        partition_start = datetime_to_uuid7(
+            finding1.inserted_at.replace(day=1, hour=0, minute=0, second=0)
+        )
+        partition_end = datetime_to_uuid7(
+            finding1.inserted_at.replace(year=finding1.inserted_at.year + 1)
+        )
+
+        with patch(
+            "tasks.jobs.deletion.get_partition_bounds",
+            return_value=[
+                ("findings_partition", partition_start, partition_end),
+                ("findings_default", None, None),
+            ],
+        ):
+            total_deleted, summary = delete_findings(
+                tenant_id, Finding.all_objects.filter(tenant_id=tenant_id)
+            )
+
+        assert total_deleted == 4
+        assert summary == {"api.ResourceFindingMapping": 2, "api.Finding": 2}
+        assert not Finding.objects.exists()
+        assert not ResourceFindingMapping.objects.exists()
+
+    def test_delete_findings_in_default_partition(self, findings_fixture):
+        finding1, _ = findings_fixture
+        tenant_id = str(finding1.tenant_id)
+        # The findings are older than the only range partition, so they are in the default one
+        partition_start = datetime_to_uuid7(
+            finding1.inserted_at.replace(year=finding1.inserted_at.year + 1)
+        )
+        partition_end = datetime_to_uuid7(
+            finding1.inserted_at.replace(year=finding1.inserted_at.year + 2)
+        )
 
-from api.models import Provider, Tenant
+        with patch(
+            "tasks.jobs.deletion.get_partition_bounds",
+            return_value=[
+                ("findings_partition", partition_start, partition_end),
+                ("findings_default", None, None),
+            ],
+        ):
+            total_deleted, summary = delete_findings(
+                tenant_id, Finding.all_objects.filter(tenant_id=tenant_id)
+            )
+
+        assert total_deleted == 4
+        assert summary == {"api.ResourceFindingMapping": 2, "api.Finding": 2}
+        assert not Finding.objects.exists()
+
+
+class TestGetDefaultPartitionFilter:
+    def test_not_partitioned(self):
+        assert _get_default_partition_filter("id", []) == Q()
+
+    def test_contiguous_ranges(self):
+        ranges = [
+            (UUID(int=1), UUID(int=2)),
+            (UUID(int=2), UUID(int=3)),
+        ]
+
+        assert _get_default_partition_filter("id", ranges) == Q(id__lt=UUID(int=1)) | Q(
+            id__gte=UUID(int=3)
+        )
+
+    def test_ranges_with_gap(self):
+        ranges = [
+            (UUID(int=1), UUID(int=2)),
+            (UUID(int=4), UUID(int=5)),
+        ]
+
+        assert _get_default_partition_filter("finding_id", ranges) == (
+            Q(finding_id__lt=UUID(int=1))
+            | Q(finding_id__gte=UUID(int=5))
+            | Q(finding_id__gte=UUID(int=2), finding_id__lt=UUID(int=4))
+        )
 
 
 @pytest.mark.django_db
@@ -16,6 +123,16 @@ class TestDeleteProvider:
         with pytest.raises(ObjectDoesNotExist):
             Provider.objects.get(pk=instance.id)
 
+    def test_delete_provider_with_findings(self, findings_fixture):
+        instance = findings_fixture[0].scan.provider
+        tenant_id = str(instance.tenant_id)
+
+        delete_provider(tenant_id, instance.id)
+
+        assert not Finding.all_objects.filter(tenant_id=tenant_id).exists()
+        assert not ResourceFindingMapping.objects.exists()
+        assert not Provider.objects.filter(pk=instance.id).exists()
+
     def test_delete_provider_does_not_exist(self, tenants_fixture):
         tenant_id = str(tenants_fixture[0].id)
         non_existent_pk = "babf6796-cfcc-4fd3-9dcf-88d012247645"
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from botocore.exceptions import ClientError
 from tasks.jobs.export import (
+    OutputArchive,
     _compress_output_files,
     _generate_output_directory,
     _upload_to_s3,
@@ -31,6 +32,32 @@ class TestOutputs:
         with zipfile.ZipFile(zip_path, "r") as zipf:
             assert "output/result.csv" in zipf.namelist()
 
+    def test_compress_output_files_with_archive(self, tmpdir):
+        base_tmp = Path(str(tmpdir.mkdir("compress_output_archive")))
+        output_dir = base_tmp / "output"
+        output_dir.mkdir()
+        streamed_file = output_dir / "result.csv"
+        streamed_file.write_text("data")
+        compliance_dir = base_tmp / "compliance"
+        compliance_dir.mkdir()
+        remaining_file = compliance_dir / "cis.csv"
+        remaining_file.write_text("compliance data")
+
+        archive = OutputArchive(str(output_dir))
+        archive.add(str(streamed_file))
+        archive.add(str(streamed_file))
+        archive.add(str(output_dir / "missing.csv"))
+        archive.add(None)
+
+        zip_path = _compress_output_files(str(output_dir), archive)
+
+        assert zip_path == f"{output_dir}.zip"
+        with zipfile.ZipFile(zip_path, "r") as zipf:
+            assert sorted(zipf.namelist()) == [
+                "compliance/cis.csv",
+                "output/result.csv",
+            ]
+
     @patch("tasks.jobs.export.boto3.client")
     @patch("tasks.jobs.export.settings")
     def test_get_s3_client_success(self, mock_settings, mock_boto_client):
@@ -7,10 +7,20 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from tasks.jobs.scan import (
+    _aggregate_compliance_finding,
+    _aggregate_finding,
     _copy_compliance_requirement_rows,
     _create_finding_delta,
+    _get_resource_state,
+    _ingest_findings_batch,
+    _load_findings_status,
+    _load_previous_scan_findings_status,
+    _load_provider_resource_tags,
+    _load_provider_resources,
     _persist_compliance_requirement_rows,
+    _store_resource_tags,
     _store_resources,
+    aggregate_findings,
     create_compliance_requirements,
     perform_prowler_scan,
 )
@@ -18,7 +28,15 @@ from tasks.utils import CustomEncoder
 
 from api.db_router import MainRouter
 from api.exceptions import ProviderConnectionError
-from api.models import Finding, Provider, Resource, Scan, StateChoices, StatusChoices
+from api.models import (
+    Finding,
+    Provider,
+    Resource,
+    Scan,
+    ScanSummary,
+    StateChoices,
+    StatusChoices,
+)
 from prowler.lib.check.models import Severity
 
 
@@ -117,6 +135,7 @@ class TestPerformScan:
             finding.resource_details = {"details": "test"}
             finding.partition = "partition"
             finding.muted = True
+            finding.muted_reason = "Muted by the mutelist rule */check1"
             finding.compliance = {"compliance1": "PASS"}
 
             # Mock the ProwlerScan instance
@@ -157,7 +176,7 @@ class TestPerformScan:
         assert scan_finding.raw_result == finding.raw
         assert scan_finding.muted
         assert scan_finding.compliance == finding.compliance
-        assert scan_finding.muted_reason == "Muted by mutelist"
+        assert scan_finding.muted_reason == "Muted by the mutelist rule */check1"
 
         assert scan_resource.tenant == tenant
         assert scan_resource.uid == finding.resource_uid
@@ -182,6 +201,21 @@ class TestPerformScan:
         # Assert that failed_findings_count is 0 (finding is PASS and muted)
         assert scan_resource.failed_findings_count == 0
 
+        # Assert that the scan summary has been aggregated during the scan
+        scan_summary = ScanSummary.objects.get(scan=scan)
+        assert scan_summary.check_id == finding.check_id
+        assert scan_summary.service == finding.service_name
+        assert scan_summary.region == finding.region
+        assert scan_summary.total == 1
+        assert scan_summary.muted == 1
+        assert scan_summary.muted_new == 1
+        assert scan_summary._pass == 0
+        # The finding is muted, so it is not part of the compliance summary
+        assert scan.compliance_summary == {
+            "check_status_by_region": {},
+            "findings_count_by_compliance": {},
+        }
+
     @patch("tasks.jobs.scan.ProwlerScan")
     @patch(
         "tasks.jobs.scan.initialize_prowler_provider",
@@ -626,6 +660,7 @@ class TestPerformScan:
             muted_fail_finding.resource_type = "instance"
             muted_fail_finding.resource_tags = {}
             muted_fail_finding.muted = True
+            muted_fail_finding.muted_reason = None
             muted_fail_finding.raw = {}
             muted_fail_finding.resource_metadata = {}
             muted_fail_finding.resource_details = {}
@@ -739,6 +774,455 @@ class TestPerformScan:
         # Assert that failed_findings_count was reset to 0 during the scan
         assert resource.failed_findings_count == 0
 
+    @staticmethod
+    def _mock_finding(uid, resource_uid, status, region="us-east-1", tags=None):
+        finding = MagicMock()
+        finding.uid = uid
+        finding.status = status
+        finding.status_extended = f"{uid} status extended"
+        finding.severity = Severity.medium
+        finding.check_id = "check1"
+        finding.get_metadata.return_value = {"key": "value"}
+        finding.resource_uid = resource_uid
+        finding.resource_name = resource_uid
+        finding.region = region
+        finding.service_name = "ec2"
+        finding.resource_type = "instance"
+        finding.resource_tags = tags or {}
+        finding.muted = False
+        finding.raw = {}
+        finding.resource_metadata = {"test": "metadata"}
+        finding.resource_details = "details"
+        finding.partition = "aws"
+        finding.compliance = {}
+        return finding
+
+    def test_ingest_findings_batch(self, tenants_fixture, providers_fixture):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        scan = Scan.objects.create(
+            name="Batch Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+        tenant_id = str(tenant.id)
+        findings = [
+            self._mock_finding(
+                "finding1",
+                "resource1",
+                StatusChoices.FAIL,
+                tags={"env": "prod", "team": "a"},
+            ),
+            self._mock_finding(
+                "finding2", "resource1", StatusChoices.PASS, tags={"env": "prod"}
+            ),
+            self._mock_finding(
+                "finding3",
+                "resource2",
+                StatusChoices.PASS,
+                region="eu-west-1",
+                tags={"env": "prod"},
+            ),
+        ]
+        resource_cache = {}
+        stored_resources = {}
+        tag_ids = {}
+        resource_tags = set()
+        scan_resource_tags = set()
+        last_status_cache = {}
+
+        stored = _ingest_findings_batch(
+            tenant_id,
+            provider,
+            scan,
+            findings,
+            resource_cache,
+            stored_resources,
+            tag_ids,
+            resource_tags,
+            scan_resource_tags,
+            last_status_cache,
+        )
+
+        assert [finding.uid for finding, _ in stored] == [
+            "finding1",
+            "finding2",
+            "finding3",
+        ]
+        assert Resource.objects.filter(provider=provider).count() == 2
+        assert set(resource_cache) == {"resource1", "resource2"}
+        assert set(stored_resources) == {"resource1", "resource2"}
+        assert len(scan_resource_tags) == 3
+
+        # The tags are stored at the end of the scan
+        resource1 = Resource.objects.get(provider=provider, uid="resource1")
+        assert resource1.get_tags(tenant_id) == {}
+        _store_resource_tags(tenant_id, scan_resource_tags, tag_ids, resource_tags)
+        assert set(tag_ids) == {("env", "prod"), ("team", "a")}
+        assert len(resource_tags) == 3
+        assert resource1.get_tags(tenant_id) == {"env": "prod", "team": "a"}
+        assert resource1.metadata == json.dumps({"test": "metadata"}, cls=CustomEncoder)
+        assert resource1.partition == "aws"
+
+        scan_findings = Finding.objects.filter(scan=scan).order_by("uid")
+        assert scan_findings.count() == 3
+        for scan_finding in scan_findings:
+            assert scan_finding.delta == Finding.DeltaChoices.NEW
+            assert scan_finding.first_seen_at is not None
+            assert scan_finding.resources.count() == 1
+        finding3 = scan_findings.get(uid="finding3")
+        assert finding3.resource_regions == ["eu-west-1"]
+        assert finding3.resources.first().uid == "resource2"
+
+        # A second batch reuses the cached resources and tags
+        stored = _ingest_findings_batch(
+            tenant_id,
+            provider,
+            scan,
+            [
+                self._mock_finding(
+                    "finding4",
+                    "resource2",
+                    StatusChoices.FAIL,
+                    region="eu-west-2",
+                    tags={"env": "prod"},
+                )
+            ],
+            resource_cache,
+            stored_resources,
+            tag_ids,
+            resource_tags,
+            set(),
+            last_status_cache,
+        )
+
+        assert stored[0][1] is resource_cache["resource2"]
+        assert Resource.objects.filter(provider=provider).count() == 2
+        assert (
+            Resource.objects.get(provider=provider, uid="resource2").region
+            == "eu-west-2"
+        )
+        assert Finding.objects.get(scan=scan, uid="finding4").resource_regions == [
+            "eu-west-2"
+        ]
+        assert len(resource_tags) == 3
+
+    def test_ingest_findings_batch_existing_resource_and_finding(
+        self, tenants_fixture, providers_fixture, resources_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        resource = resources_fixture[0]
+        tenant_id = str(tenant.id)
+        previous_scan = Scan.objects.create(
+            name="Previous Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=tenant.id,
+        )
+        first_seen_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        Finding.objects.create(
+            tenant_id=tenant.id,
+            uid="existing_finding",
+            status=StatusChoices.PASS,
+            severity=Severity.medium,
+            impact=Severity.medium,
+            check_id="check1",
+            scan=previous_scan,
+            first_seen_at=first_seen_at,
+        )
+        scan = Scan.objects.create(
+            name="Batch Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+        resource_cache = {}
+
+        _ingest_findings_batch(
+            tenant_id,
+            provider,
+            scan,
+            [
+                self._mock_finding(
+                    "existing_finding",
+                    resource.uid,
+                    StatusChoices.FAIL,
+                    region=resource.region,
+                )
+            ],
+            resource_cache,
+            _load_provider_resources(tenant_id, str(provider.id)),
+            {},
+            set(),
+            set(),
+            {},
+        )
+
+        assert resource_cache[resource.uid].id == resource.id
+        assert Resource.objects.filter(provider=provider, uid=resource.uid).count() == 1
+        scan_finding = Finding.objects.get(scan=scan)
+        assert scan_finding.delta == Finding.DeltaChoices.CHANGED
+        assert scan_finding.first_seen_at == first_seen_at
+        assert list(scan_finding.resources.all()) == [resource]
+
+    def test_load_provider_resources(
+        self, tenants_fixture, providers_fixture, resources_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        provider = providers_fixture[0]
+
+        stored_resources = _load_provider_resources(tenant_id, str(provider.id))
+
+        provider_resources = Resource.objects.filter(provider=provider)
+        assert set(stored_resources) == {
+            resource.uid for resource in provider_resources
+        }
+        for resource in provider_resources:
+            assert stored_resources[resource.uid] == (
+                resource.id,
+                resource.failed_findings_count,
+                _get_resource_state(resource),
+            )
+
+    def test_load_provider_resources_from_primary_database(
+        self, tenants_fixture, providers_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        provider = providers_fixture[0]
+
+        with patch("tasks.jobs.scan.rls_transaction") as mock_rls_transaction:
+            _load_provider_resources(tenant_id, str(provider.id))
+            _load_provider_resource_tags(tenant_id, str(provider.id))
+
+        # The resources are not read from the read replica, which can lag behind the previous scan
+        assert mock_rls_transaction.call_count == 2
+        for call in mock_rls_transaction.call_args_list:
+            assert call.args == (tenant_id,)
+            assert call.kwargs == {}
+
+    def test_ingest_findings_batch_unchanged_resource(
+        self, tenants_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        tenant_id = str(tenant.id)
+        scan = Scan.objects.create(
+            name="Batch Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+        finding = self._mock_finding("finding1", "resource1", StatusChoices.PASS)
+        _ingest_findings_batch(
+            tenant_id, provider, scan, [finding], {}, {}, {}, set(), set(), {}
+        )
+        stored_resources = _load_provider_resources(tenant_id, str(provider.id))
+
+        with patch("tasks.jobs.scan.Resource.objects.bulk_update") as bulk_update:
+            _ingest_findings_batch(
+                tenant_id,
+                provider,
+                scan,
+                [self._mock_finding("finding2", "resource1", StatusChoices.PASS)],
+                {},
+                stored_resources,
+                {},
+                set(),
+                set(),
+                {},
+            )
+            _ingest_findings_batch(
+                tenant_id,
+                provider,
+                scan,
+                [
+                    self._mock_finding(
+                        "finding3", "resource1", StatusChoices.PASS, region="eu-west-1"
+                    )
+                ],
+                {},
+                stored_resources,
+                {},
+                set(),
+                set(),
+                {},
+            )
+
+        unchanged_call, changed_call = bulk_update.call_args_list
+        assert list(unchanged_call.args[0]) == []
+        assert [resource.region for resource in changed_call.args[0]] == ["eu-west-1"]
+        assert stored_resources["resource1"][2][0] == "eu-west-1"
+
+    def test_load_previous_scan_findings_status(
+        self, tenants_fixture, providers_fixture, findings_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        scan = Scan.objects.create(
+            name="New Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+
+        findings_status = _load_previous_scan_findings_status(
+            str(tenant.id), str(provider.id), str(scan.id)
+        )
+
+        assert findings_status == {
+            finding.uid: (finding.status, finding.first_seen_at)
+            for finding in Finding.objects.filter(scan=findings_fixture[0].scan)
+        }
+        assert "test_finding_uid_1" in findings_status
+
+    def test_load_previous_scan_findings_status_no_previous_scan(
+        self, tenants_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[1]
+        scan = Scan.objects.create(
+            name="First Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+
+        assert (
+            _load_previous_scan_findings_status(
+                str(tenant.id), str(provider.id), str(scan.id)
+            )
+            == {}
+        )
+
+    def test_load_findings_status(self, tenants_fixture, findings_fixture):
+        tenant_id = str(tenants_fixture[0].id)
+        finding = Finding.objects.get(id=findings_fixture[0].id)
+        findings_status = {}
+
+        _load_findings_status(
+            tenant_id, {finding.uid, "unknown_finding_uid"}, findings_status
+        )
+
+        assert findings_status == {
+            finding.uid: (finding.status, finding.first_seen_at),
+            "unknown_finding_uid": (None, None),
+        }
+
+    def test_aggregate_finding(self):
+        def finding(status, delta, muted=False, region="us-east-1"):
+            return Finding(
+                check_id="check1",
+                status=status,
+                delta=delta,
+                muted=muted,
+                severity=Severity.high,
+                resource_services=["ec2"],
+                resource_regions=[region],
+                resource_types=["instance"],
+            )
+
+        scan_summaries = {}
+        for finding_instance in [
+            finding(StatusChoices.FAIL, Finding.DeltaChoices.NEW),
+            finding(StatusChoices.FAIL, None),
+            finding(StatusChoices.PASS, Finding.DeltaChoices.CHANGED),
+            finding(StatusChoices.MANUAL, None),
+            finding(StatusChoices.FAIL, Finding.DeltaChoices.NEW, muted=True),
+            finding(StatusChoices.PASS, None, region="eu-west-1"),
+        ]:
+            _aggregate_finding(scan_summaries, finding_instance)
+
+        assert scan_summaries == {
+            ("check1", "ec2", Severity.high, "us-east-1"): {
+                "fail": 2,
+                "_pass": 1,
+                "muted": 1,
+                "total": 5,
+                "new": 1,
+                "changed": 1,
+                "unchanged": 2,
+                "fail_new": 1,
+                "fail_changed": 0,
+                "pass_new": 0,
+                "pass_changed": 1,
+                "muted_new": 1,
+                "muted_changed": 0,
+            },
+            ("check1", "ec2", Severity.high, "eu-west-1"): {
+                "fail": 0,
+                "_pass": 1,
+                "muted": 0,
+                "total": 1,
+                "new": 0,
+                "changed": 0,
+                "unchanged": 1,
+                "fail_new": 0,
+                "fail_changed": 0,
+                "pass_new": 0,
+                "pass_changed": 0,
+                "muted_new": 0,
+                "muted_changed": 0,
+            },
+        }
+
+    def test_aggregate_compliance_finding(self):
+        compliance_summary = {
+            "check_status_by_region": {},
+            "findings_count_by_compliance": {},
+        }
+        threatscore = {"ProwlerThreatScore-1.0": ["1.1.1"]}
+
+        _aggregate_compliance_finding(
+            compliance_summary, "us-east-1", "check1", StatusChoices.FAIL, threatscore
+        )
+        _aggregate_compliance_finding(
+            compliance_summary, "us-east-1", "check1", StatusChoices.PASS, threatscore
+        )
+        _aggregate_compliance_finding(
+            compliance_summary, "eu-west-1", "check2", StatusChoices.PASS, None
+        )
+
+        assert compliance_summary == {
+            "check_status_by_region": {
+                "us-east-1": {"check1": "FAIL"},
+                "eu-west-1": {"check2": "PASS"},
+            },
+            "findings_count_by_compliance": {
+                "us-east-1": {
+                    "prowlerthreatscore1.0": {"1.1.1": {"total": 2, "pass": 1}}
+                },
+            },
+        }
+
+    def test_aggregate_findings_skips_stored_scan_summaries(
+        self, tenants_fixture, scans_fixture
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        ScanSummary.objects.create(
+            tenant_id=tenant.id,
+            scan=scan,
+            check_id="check1",
+            service="ec2",
+            severity=Severity.high,
+            region="us-east-1",
+            total=1,
+        )
+
+        with patch("tasks.jobs.scan.Finding.objects.filter") as mock_findings:
+            aggregate_findings(str(tenant.id), str(scan.id))
+
+        mock_findings.assert_not_called()
+        assert ScanSummary.objects.filter(scan=scan).count() == 1
+
 
 # TODO Add tests for aggregations
 
@@ -836,6 +1320,37 @@ class TestCreateComplianceRequirements:
 
             assert "requirements_created" in result
 
+    def test_create_compliance_requirements_from_compliance_summary(
+        self, tenants_fixture, scans_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+        scan.compliance_summary = {
+            "check_status_by_region": {"us-east-1": {"check1": "FAIL"}},
+            "findings_count_by_compliance": {},
+        }
+        scan.save()
+
+        with (
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
+            ) as mock_compliance_template,
+            patch("tasks.jobs.scan.generate_scan_compliance") as mock_generate,
+            patch("tasks.jobs.scan.return_prowler_provider") as mock_provider,
+            patch("tasks.jobs.scan._load_compliance_summary") as mock_load_summary,
+            patch("tasks.jobs.scan._persist_compliance_requirement_rows"),
+        ):
+            mock_compliance_template.__getitem__.return_value = {}
+            mock_provider.return_value.get_regions.return_value = ["us-east-1"]
+
+            result = create_compliance_requirements(tenant_id, str(scan.id))
+
+        mock_load_summary.assert_not_called()
+        mock_generate.assert_called_once_with(
+            {}, scan.provider.provider, "check1", "FAIL"
+        )
+        assert result["regions_processed"] == ["us-east-1"]
+
     def test_create_compliance_requirements_kubernetes_provider(
         self,
         tenants_fixture,
@@ -80,7 +80,7 @@ class TestGenerateOutputs:
             ),
             patch(
                 "tasks.tasks.FindingOutput.transform_api_finding",
-                return_value={"transformed": "f1"},
+                return_value=MagicMock(name="transformed-f1"),
             ),
             patch(
                 "tasks.tasks.OUTPUT_FORMATS_MAPPING",
@@ -319,10 +319,14 @@ class TestGenerateOutputs:
         writer = writer_instances[0]
         assert writer.transform_called == 1
 
-    def test_compliance_transform_called_on_second_batch(self):
-        raw1 = MagicMock()
-        raw2 = MagicMock()
-        compliance_obj = MagicMock()
+    def test_compliance_transform_called_on_every_batch(self):
+        raw1 = MagicMock(check_id="check_in_framework")
+        raw2 = MagicMock(check_id="check_not_in_framework")
+        compliance_obj = MagicMock(
+            Framework="CIS",
+            Version="1.4",
+            Requirements=[MagicMock(Id="1.1", Checks=["check_in_framework"])],
+        )
         writer_instances = []
 
         class TrackingComplianceWriter:
@@ -330,8 +334,13 @@ class TestGenerateOutputs:
                 self.transform_calls = []
                 self._data = []
                 self.close_file = False
+                self.file_path = kwargs["file_path"]
+                self.file_descriptor = None
                 writer_instances.append(self)
 
+            def create_file_descriptor(self, file_path):
+                self.file_descriptor = MagicMock(name=file_path)
+
             def transform(self, fos, comp_obj, name):
                 self.transform_calls.append((fos, comp_obj, name))
 
@@ -366,7 +375,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.FindingOutput._transform_findings_stats"),
             patch(
                 "tasks.tasks.FindingOutput.transform_api_finding",
-                side_effect=lambda f, prov: f,
+                side_effect=lambda f, prov, context=None: f,
             ),
             patch("tasks.tasks._compress_output_files", return_value="outdir.zip"),
             patch("tasks.tasks._upload_to_s3", return_value="s3://bucket/outdir.zip"),
@@ -392,7 +401,13 @@ class TestGenerateOutputs:
 
         assert len(writer_instances) == 1
         writer = writer_instances[0]
-        assert writer.transform_calls == [([raw2], compliance_obj, "cis")]
+        assert writer.file_path == "/tmp/test/compdir_cis.csv"
+        assert writer.file_descriptor
+        # Every batch is transformed with the findings routed to the framework
+        assert writer.transform_calls == [
+            ([raw1], compliance_obj, "CIS-1.4"),
+            ([], compliance_obj, "CIS-1.4"),
+        ]
         assert result == {"upload": True}
 
     # TODO: We need to add a periodic task to delete old output files
@@ -526,6 +541,7 @@ class TestGenerateOutputs:
 class TestScanCompleteTasks:
     @patch("tasks.tasks.create_compliance_requirements_task.apply_async")
     @patch("tasks.tasks.perform_scan_summary_task.si")
+    @patch("tasks.tasks.invalidate_response_cache_task.si")
     @patch("tasks.tasks.generate_outputs_task.si")
     @patch("tasks.tasks.generate_threatscore_report_task.si")
     @patch("tasks.tasks.check_integrations_task.si")
@@ -534,6 +550,7 @@ class TestScanCompleteTasks:
         mock_check_integrations_task,
         mock_threatscore_task,
         mock_outputs_task,
+        mock_invalidate_cache_task,
         mock_scan_summary_task,
         mock_compliance_tasks,
     ):
@@ -545,6 +562,7 @@ class TestScanCompleteTasks:
             scan_id="scan-id",
             tenant_id="tenant-id",
         )
+        mock_invalidate_cache_task.assert_called_once_with(tenant_id="tenant-id")
         mock_outputs_task.assert_called_once_with(
             scan_id="scan-id",
             provider_id="provider-id",
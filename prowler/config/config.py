@@ -70,7 +70,12 @@ csv_file_suffix = ".csv"
 json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 json_ocsf_file_suffix = ".ocsf.json"
+json_ocsf_ndjson_file_suffix = ".ocsf.ndjson"
+# Compression of the json-ocsf-ndjson output -> suffix added to its file
+ndjson_compression_file_suffixes = {"gzip": ".gz", "zstd": ".zst"}
 html_file_suffix = ".html"
+parquet_file_suffix = ".parquet"
+json_aws_api_retries_file_suffix = ".aws_api_retries.json"
 default_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 )
@@ -80,8 +85,18 @@ default_fixer_config_file_path = (
 default_redteam_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/llm_config.yaml"
 )
+default_catalogs_directory = (
+    f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/catalogs"
+)
 encoding_format_utf_8 = "utf-8"
-available_output_formats = ["csv", "json-asff", "json-ocsf", "html"]
+available_output_formats = [
+    "csv",
+    "json-asff",
+    "json-ocsf",
+    "json-ocsf-ndjson",
+    "html",
+    "parquet",
+]
 
 
 def get_default_mute_file_path(provider: str):
@@ -0,0 +1,257 @@
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from typing import Optional
+
+from prowler.config.config import (
+    Provider,
+    default_catalogs_directory,
+    prowler_version,
+)
+from prowler.lib.check.utils import recover_checks_from_provider
+from prowler.lib.logger import logger
+
+# Increase it every time the content of the catalog changes
+CATALOG_VERSION = 3
+# Set it to skip the prebuilt catalogs and always load the checks metadata and the compliance frameworks from their files
+CATALOG_DISABLED_ENV_VAR = "PROWLER_CATALOG_DISABLED"
+
+prowler_directory = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+)
+# Map CLI provider names to directory names (for cases where they differ)
+provider_directory_map = {
+    "oci": "oraclecloud",  # OCI SDK conflict avoidance
+}
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+# File path -> (modification time and size of the file, digest of its content)
+_file_digests = {}
+_file_digests_lock = threading.Lock()
+
+
+def get_catalog_file(provider: str, catalogs_directory: str = None) -> str:
+    """get_catalog_file returns the path of the catalog of the given provider"""
+    return os.path.join(
+        catalogs_directory or default_catalogs_directory, f"{provider}.pickle"
+    )
+
+
+def get_file_digest(file_path: str, file_stat: os.stat_result) -> str:
+    """
+    get_file_digest returns the digest of the content of the given file, reading it again only
+    if its modification time or its size changed since the last call.
+    """
+    file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    with _file_digests_lock:
+        entry = _file_digests.get(file_path)
+    if entry and entry[0] == file_key:
+        return entry[1]
+    with open(file_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    with _file_digests_lock:
+        _file_digests[file_path] = (file_key, digest)
+    return digest
+
+
+def get_catalog_fingerprint(provider: str) -> dict:
+    """
+    get_catalog_fingerprint returns the checks and the compliance frameworks files of the provider,
+    scanning their directories without importing or parsing them.
+
+    A catalog is only used if its fingerprint matches the current one, so custom checks copied
+    into the provider, custom compliance frameworks or metadata and compliance files edited in place
+    make Prowler read the files again.
+
+    The metadata and compliance files are identified by their size and the digest of their content,
+    not by their modification time, since pip and poetry do not keep it when they install a wheel.
+
+    Example:
+        get_catalog_fingerprint("aws") -> {
+            "checks": ["accessanalyzer/accessanalyzer_enabled", ...],
+            "metadata": [("accessanalyzer/accessanalyzer_enabled", 2345, "9f86d081..."), ...],
+            "compliance": [("cis_2.0_aws.json", 123456, "60303ae2..."), ...],
+        }
+    """
+    checks = []
+    # Check -> size and digest of its metadata file
+    metadata = []
+    services_directory = os.path.join(
+        prowler_directory,
+        "providers",
+        provider_directory_map.get(provider, provider),
+        "services",
+    )
+    if os.path.isdir(services_directory):
+        with os.scandir(services_directory) as services:
+            for service in services:
+                if not service.is_dir():
+                    continue
+                with os.scandir(service.path) as service_checks:
+                    for check in service_checks:
+                        if check.is_dir() and os.path.isfile(
+                            os.path.join(check.path, f"{check.name}.py")
+                        ):
+                            checks.append(f"{service.name}/{check.name}")
+                            metadata_file = os.path.join(
+                                check.path, f"{check.name}.metadata.json"
+                            )
+                            try:
+                                metadata_stat = os.stat(metadata_file)
+                            except OSError:
+                                continue
+                            metadata.append(
+                                (
+                                    f"{service.name}/{check.name}",
+                                    metadata_stat.st_size,
+                                    get_file_digest(metadata_file, metadata_stat),
+                                )
+                            )
+
+    compliance = []
+    compliance_directory = os.path.join(prowler_directory, "compliance", provider)
+    if os.path.isdir(compliance_directory):
+        with os.scandir(compliance_directory) as files:
+            for file in files:
+                if file.is_file() and file.name.endswith(".json"):
+                    file_stat = file.stat()
+                    compliance.append(
+                        (
+                            file.name,
+                            file_stat.st_size,
+                            get_file_digest(file.path, file_stat),
+                        )
+                    )
+
+    return {
+        "checks": sorted(checks),
+        "metadata": sorted(metadata),
+        "compliance": sorted(compliance),
+    }
+
+
+def build_catalog(provider: str) -> dict:
+    """
+    build_catalog loads the checks metadata and the compliance frameworks of the provider from their
+    files and returns the catalog with them.
+
+    The catalog sections are stored pickled, so every load returns new objects that can be modified.
+
+    Args:
+        provider (str): The provider type, e.g. aws
+
+    Returns:
+        dict: The catalog of the provider
+    """
+    # Imported here since the models load the catalogs
+    from prowler.lib.check.compliance_models import Compliance
+    from prowler.lib.check.models import CheckMetadata
+
+    checks_metadata = CheckMetadata.get_bulk(provider, use_catalog=False)
+    compliance_frameworks = Compliance.get_bulk(provider, use_catalog=False)
+
+    # Check ID -> metadata file relative to the Prowler directory
+    metadata_files = {}
+    for check_name, check_path in recover_checks_from_provider(provider):
+        metadata_file = os.path.join(check_path, f"{check_name}.metadata.json")
+        if check_name in checks_metadata and os.path.isfile(metadata_file):
+            metadata_files[check_name] = os.path.relpath(
+                metadata_file, prowler_directory
+            )
+
+    return {
+        "version": CATALOG_VERSION,
+        "prowler_version": prowler_version,
+        "provider": provider,
+        "fingerprint": get_catalog_fingerprint(provider),
+        "checks_metadata": pickle.dumps(
+            checks_metadata, protocol=pickle.HIGHEST_PROTOCOL
+        ),
+        "compliance_frameworks": pickle.dumps(
+            compliance_frameworks, protocol=pickle.HIGHEST_PROTOCOL
+        ),
+        "metadata_files": metadata_files,
+    }
+
+
+def save_catalog(provider: str, catalogs_directory: str = None) -> str:
+    """
+    save_catalog builds the catalog of the given provider and saves it in the catalogs directory
+
+    Returns:
+        str: The path of the catalog file
+    """
+    catalog_file = get_catalog_file(provider, catalogs_directory)
+    os.makedirs(os.path.dirname(catalog_file), exist_ok=True)
+    catalog = build_catalog(provider)
+    with open(catalog_file, "wb") as f:
+        pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return catalog_file
+
+
+def load_catalog(provider: str, catalogs_directory: str = None) -> Optional[dict]:
+    """
+    load_catalog returns the prebuilt catalog of the given provider, or None if there is no valid catalog for it.
+
+    A catalog is valid if it was built with the same catalog format and Prowler version and the checks, their
+    metadata files and the compliance frameworks of the provider did not change since then. Catalogs are cached for the whole process.
+
+    Args:
+        provider (str): The provider type, e.g. aws
+        catalogs_directory (str): The directory of the catalogs, the Prowler one by default
+
+    Returns:
+        dict: The catalog of the provider or None
+    """
+    if os.environ.get(CATALOG_DISABLED_ENV_VAR, "").lower() in ("1", "true"):
+        return None
+    catalog_file = get_catalog_file(provider, catalogs_directory)
+    with _catalogs_lock:
+        if catalog_file not in _catalogs:
+            _catalogs[catalog_file] = _read_catalog(catalog_file)
+        catalog = _catalogs[catalog_file]
+    # The fingerprint is checked every time since custom checks can be added while running
+    if catalog and catalog["fingerprint"] != get_catalog_fingerprint(provider):
+        logger.info(
+            f"The {provider} catalog does not match the installed checks and compliance frameworks, it will not be used."
+        )
+        return None
+    return catalog
+
+
+def _read_catalog(catalog_file: str) -> Optional[dict]:
+    if not os.path.isfile(catalog_file):
+        return None
+    try:
+        with open(catalog_file, "rb") as f:
+            catalog = pickle.load(f)
+        if (
+            catalog.get("version") != CATALOG_VERSION
+            or catalog.get("prowler_version") != prowler_version
+        ):
+            logger.info(f"The catalog {catalog_file} is outdated, it will not be used.")
+            return None
+        return catalog
+    except Exception as error:
+        logger.warning(
+            f"{catalog_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def clear_catalogs_cache() -> None:
+    """clear_catalogs_cache removes the catalogs loaded by load_catalog and the digests of their files"""
+    with _catalogs_lock:
+        _catalogs.clear()
+    with _file_digests_lock:
+        _file_digests.clear()
+
+
+if __name__ == "__main__":
+    # Build the catalogs of all the providers, e.g. python -m prowler.lib.check.catalog [catalogs_directory]
+    output_directory = sys.argv[1] if len(sys.argv) > 1 else None
+    for provider in Provider:
+        print(f"Catalog saved in {save_catalog(provider.value, output_directory)}")
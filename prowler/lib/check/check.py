@@ -1,12 +1,14 @@
 import importlib
 import json
 import os
+import queue
 import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -15,6 +17,10 @@ import prowler
 from prowler.config.config import orange_color
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
 from prowler.lib.check.models import Check
+from prowler.lib.check.services_loader import (
+    get_service_clients_to_load,
+    load_service_clients,
+)
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
@@ -298,6 +304,137 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
+# Map CLI provider names to directory names (for cases where they differ)
+provider_directory_map = {
+    "oci": "oraclecloud",  # oci SDK conflict avoidance
+}
+
+
+def load_check(check_name: str, provider_type: str) -> Check:
+    """
+    Import the check module and return an instance of the check
+
+    Args:
+        check_name (str): check name
+        provider_type (str): provider type, e.g. aws
+
+    Returns:
+        Check: the check instance
+
+    Raises:
+        ModuleNotFoundError: If the check does not exist in the provider or is from another provider.
+    """
+    # Recover service from check name
+    service = check_name.split("_")[0]
+    provider_directory = provider_directory_map.get(provider_type, provider_type)
+    check_module_path = f"prowler.providers.{provider_directory}.services.{service}.{check_name}.{check_name}"
+    lib = import_check(check_module_path)
+    # Recover functions from check
+    check_to_execute = getattr(lib, check_name)
+    return check_to_execute()
+
+
+def run_checks(
+    checks_to_execute: list,
+    global_provider: Any,
+    custom_checks_metadata: Any,
+    output_options: Any = None,
+    max_workers: int = 1,
+    group_by_service: bool = False,
+    on_check_completed: Callable = None,
+) -> Generator[tuple[str, Check, list], None, None]:
+    """
+    Run the given checks and yield their findings in the order of checks_to_execute.
+
+    Checks only read from the already populated service clients, so with max_workers
+    greater than 1 they are evaluated in a thread pool. If group_by_service is set,
+    each worker runs all the checks of one service in order so the service client
+    is built once by the first of them instead of having several workers waiting on it.
+
+    Args:
+        checks_to_execute (list): check names to execute
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        output_options (Any): output options, depending on the provider
+        max_workers (int): number of worker threads, 1 runs the checks serially
+        group_by_service (bool): schedule the checks of the same service in the same worker
+        on_check_completed (Callable): called as on_check_completed(check_name, check, findings) as soon as
+            each check finishes, in completion order, to keep the progress up to date
+
+    Yields:
+        tuple[str, Check, list]: the check name, the check and its findings. Checks that could not be loaded are skipped.
+    """
+
+    def _run_check(index: int, check_name: str) -> tuple:
+        try:
+            check = load_check(check_name, global_provider.type)
+        # If check does not exists in the provider or is from another provider
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+            )
+            return index, check_name, None, []
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return index, check_name, None, []
+        check_findings = execute(
+            check,
+            global_provider,
+            custom_checks_metadata,
+            output_options,
+        )
+        return index, check_name, check, check_findings
+
+    if max_workers <= 1:
+        for index, check_name in enumerate(checks_to_execute):
+            _, _, check, check_findings = _run_check(index, check_name)
+            if check is None:
+                continue
+            if on_check_completed:
+                on_check_completed(check_name, check, check_findings)
+            yield check_name, check, check_findings
+        return
+
+    if group_by_service:
+        batches = {}
+        for index, check_name in enumerate(checks_to_execute):
+            batches.setdefault(check_name.split("_")[0], []).append((index, check_name))
+        batches = list(batches.values())
+    else:
+        batches = [[item] for item in enumerate(checks_to_execute)]
+
+    results = queue.Queue()
+
+    def _run_batch(batch: list):
+        for index, check_name in batch:
+            try:
+                results.put(_run_check(index, check_name))
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                results.put((index, check_name, None, []))
+
+    # Results arrive in completion order, they are buffered until all the previous checks are done
+    pending = {}
+    next_index = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in batches:
+            executor.submit(_run_batch, batch)
+        for _ in range(len(checks_to_execute)):
+            index, check_name, check, check_findings = results.get()
+            if check is not None and on_check_completed:
+                on_check_completed(check_name, check, check_findings)
+            pending[index] = (check_name, check, check_findings)
+            while next_index in pending:
+                check_name, check, check_findings = pending.pop(next_index)
+                next_index += 1
+                if check is not None:
+                    yield check_name, check, check_findings
+
+
 def run_fixer(check_findings: list) -> int:
     """
     Run the fixer for the check if it exists and there are any FAIL findings
@@ -389,9 +526,32 @@ def execute_checks(
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    on_check_findings: Callable[[list], None] = None,
 ) -> list:
+    """
+    Execute the checks and report their findings
+
+    Args:
+        checks_to_execute (list): The checks to execute
+        global_provider (Any): The provider object
+        custom_checks_metadata (Any): The custom checks metadata
+        config_file (str): The config file path
+        output_options (Any): The output options, depending on the provider
+        on_check_findings (Callable): Called with the findings of every check as soon as it finishes. If set, the
+            findings are not kept and an empty list is returned.
+
+    Returns:
+        list: The findings of all the checks
+    """
     # List to store all the check's findings
     all_findings = []
+
+    def add_check_findings(check_findings: list):
+        if on_check_findings:
+            on_check_findings(check_findings)
+        else:
+            all_findings.extend(check_findings)
+
     # Services and checks executed for the Audit Status
     services_executed = set()
     checks_executed = set()
@@ -431,49 +591,43 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
+    # Set the check execution mode
+    max_workers = getattr(output_options, "checks_workers", None) or 1
+    group_by_service = getattr(output_options, "group_checks_by_service", False)
+    services_workers = getattr(output_options, "services_workers", None) or 1
+
+    def update_audit_status(check_name: str, check: Check, check_findings: list):
+        # Update Audit Status
+        services_executed.add(check_name.split("_")[0])
+        checks_executed.add(check_name)
+        global_provider.audit_metadata = update_audit_metadata(
+            global_provider.audit_metadata, services_executed, checks_executed
+        )
+
     # Execution with the --only-logs flag
     if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
+        # Build the service clients concurrently before executing the checks
+        if services_workers > 1:
+            load_service_clients(
+                get_service_clients_to_load(global_provider.type, checks_to_execute),
+                services_workers,
+            )
+        for check_name, check, check_findings in run_checks(
+            checks_to_execute,
+            global_provider,
+            custom_checks_metadata,
+            output_options,
+            max_workers=max_workers,
+            group_by_service=group_by_service,
+            on_check_completed=update_audit_status,
+        ):
             try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
                 if verbose:
                     print(
                         f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
                     )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
-                )
                 report(check_findings, global_provider, output_options)
-                all_findings.extend(check_findings)
-
-                # Update Audit Status
-                services_executed.add(service)
-                checks_executed.add(check_name)
-                global_provider.audit_metadata = update_audit_metadata(
-                    global_provider.audit_metadata, services_executed, checks_executed
-                )
-
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
+                add_check_findings(check_findings)
             except Exception as error:
                 logger.error(
                     f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -489,6 +643,14 @@ def execute_checks(
             messages.append(
                 f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
             )
+        if max_workers > 1:
+            messages.append(
+                f"Check workers: {Fore.YELLOW}{max_workers}{Style.RESET_ALL}"
+            )
+        if services_workers > 1:
+            messages.append(
+                f"Service workers: {Fore.YELLOW}{services_workers}{Style.RESET_ALL}"
+            )
         report_title = (
             f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
         )
@@ -499,6 +661,33 @@ def execute_checks(
         singular_string = "check"
 
         check_noun = plural_string if checks_num > 1 else singular_string
+        # Build the service clients concurrently before executing the checks
+        if services_workers > 1:
+            service_clients = get_service_clients_to_load(
+                global_provider.type, checks_to_execute
+            )
+            print(
+                f"{Style.BRIGHT}Loading {len(service_clients)} services, please wait...{Style.RESET_ALL}"
+            )
+            with alive_bar(
+                total=len(service_clients),
+                ctrl_c=False,
+                bar="blocks",
+                spinner="classic",
+                stats=False,
+                enrich_print=False,
+            ) as bar:
+
+                def update_services_progress(client_module: str):
+                    bar.title = f"-> Loading {orange_color}{client_module.split('.')[-2]}{Style.RESET_ALL} service"
+                    bar()
+
+                load_service_clients(
+                    service_clients,
+                    services_workers,
+                    on_client_loaded=update_services_progress,
+                )
+                bar.title = f"-> {Fore.GREEN}Services loaded!{Style.RESET_ALL}"
         print(
             f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}"
         )
@@ -510,69 +699,34 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
-                # Recover service from check name
-                service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
-                )
-                try:
-                    try:
-                        # Map CLI provider names to directory names (for cases where they differ)
-                        provider_directory_map = {
-                            "oci": "oraclecloud",  # oci SDK conflict avoidance
-                        }
-                        provider_directory = provider_directory_map.get(
-                            global_provider.type, global_provider.type
-                        )
 
-                        # Import check module
-                        check_module_path = f"prowler.providers.{provider_directory}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                        )
-                        continue
+            def update_progress(check_name: str, check: Check, check_findings: list):
+                update_audit_status(check_name, check, check_findings)
+                bar.title = f"-> Scanning {orange_color}{check_name.split('_')[0]}{Style.RESET_ALL} service"
+                bar()
+
+            for check_name, check, check_findings in run_checks(
+                checks_to_execute,
+                global_provider,
+                custom_checks_metadata,
+                output_options,
+                max_workers=max_workers,
+                group_by_service=group_by_service,
+                on_check_completed=update_progress,
+            ):
+                try:
                     if verbose:
                         print(
                             f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
                         )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
                     report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
+                    add_check_findings(check_findings)
                 except Exception as error:
                     # TODO: add more loggin here, we need the original exception -- traceback.print_last()
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
-                bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
-
     return all_findings
 
 
@@ -649,15 +803,22 @@ def execute(
                 is_finding_muted_args["organization_id"] = (
                     global_provider.identity.organization_id
                 )
-            for finding in check_findings:
-                if global_provider.type == "azure":
-                    is_finding_muted_args["subscription_id"] = (
-                        global_provider.identity.subscriptions.get(finding.subscription)
-                    )
-                is_finding_muted_args["finding"] = finding
-                finding.muted = global_provider.mutelist.is_finding_muted(
-                    **is_finding_muted_args
+            elif global_provider.type == "azure":
+                is_finding_muted_args["subscriptions"] = (
+                    global_provider.identity.subscriptions
                 )
+            # The findings of the check are evaluated at once, grouped by account and region
+            muted, rules = global_provider.mutelist.mute_findings(
+                check_findings, **is_finding_muted_args
+            )
+            for finding, finding_muted, rule in zip(check_findings, muted, rules):
+                finding.muted = finding_muted
+                if rule:
+                    # The muting rule is kept in the finding to audit the muted findings
+                    finding.muted_reason = f"Muted by the mutelist rule {rule}"
+                    logger.debug(
+                        f"{check.CheckID} finding muted by the mutelist rule {rule}: {finding.status_extended}"
+                    )
 
     except ModuleNotFoundError:
         logger.error(
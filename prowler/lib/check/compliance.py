@@ -4,6 +4,105 @@ from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 
 
+class ComplianceIndex:
+    """
+    ComplianceIndex is an inverted index of the compliance frameworks, from each check ID to the
+    requirements that include it, built in a single pass over the frameworks requirements.
+
+    Example:
+        compliance_index = ComplianceIndex(Compliance.get_bulk("aws"))
+        compliance_index.get_requirements("iam_root_mfa_enabled") -> [("cis_2.0_aws", Compliance_Requirement(Id="1.5", ...)), ...]
+    """
+
+    def __init__(self, bulk_compliance_frameworks: dict):
+        self.bulk_compliance_frameworks = bulk_compliance_frameworks
+        # Check ID -> [(framework name, requirement)], in the frameworks and requirements order
+        self._check_requirements = {}
+        # Framework name -> requirement ID -> positions of the requirements with that ID
+        self._requirement_positions = {}
+        for framework_name, framework in bulk_compliance_frameworks.items():
+            requirement_positions = self._requirement_positions.setdefault(
+                framework_name, {}
+            )
+            for position, requirement in enumerate(framework.Requirements):
+                requirement_positions.setdefault(requirement.Id, []).append(position)
+                # A check could be repeated in the same requirement
+                for check in dict.fromkeys(requirement.Checks):
+                    self._check_requirements.setdefault(check, []).append(
+                        (framework_name, requirement)
+                    )
+
+    def get_requirements(self, check_id: str, framework_name: str = None) -> list:
+        """
+        get_requirements returns the requirements that include the given check
+
+        Args:
+            check_id (str): The check ID
+            framework_name (str): Only return the requirements of this framework, e.g. cis_2.0_aws
+
+        Returns:
+            list: (framework name, requirement) tuples
+        """
+        check_requirements = self._check_requirements.get(check_id, [])
+        if framework_name:
+            return [
+                (name, requirement)
+                for name, requirement in check_requirements
+                if name == framework_name
+            ]
+        return list(check_requirements)
+
+    def get_frameworks(self, check_id: str) -> set:
+        """get_frameworks returns the names of the frameworks with requirements that include the given check"""
+        return {
+            framework_name
+            for framework_name, _ in self._check_requirements.get(check_id, [])
+        }
+
+    def get_check_compliance(self, check_id: str, provider_type: str) -> dict:
+        """
+        get_check_compliance returns the same map as prowler.lib.outputs.compliance.compliance.get_check_compliance
+        for the given check, with the framework and version as key and the requirements IDs that include the check.
+
+        Example:
+            {"CIS-1.4": ["2.1.3"], "CIS-1.5": ["2.1.3"]}
+        """
+        check_compliance = {}
+        for framework_name, requirement in self._check_requirements.get(check_id, []):
+            framework = self.bulk_compliance_frameworks[framework_name]
+            if framework.Provider.upper() != provider_type.upper():
+                continue
+            compliance_fw = framework.Framework
+            if framework.Version:
+                compliance_fw = f"{compliance_fw}-{framework.Version}"
+            check_compliance.setdefault(compliance_fw, []).append(requirement.Id)
+        return check_compliance
+
+    def get_requirements_by_id(
+        self, framework_name: str, requirement_ids: list
+    ) -> list:
+        """
+        get_requirements_by_id returns the requirements of the framework with the given IDs, in the framework order
+
+        Args:
+            framework_name (str): The framework name
+            requirement_ids (list): The requirements IDs, e.g. the finding requirements of the framework
+
+        Returns:
+            list: The requirements
+        """
+        requirement_positions = self._requirement_positions.get(framework_name, {})
+        positions = sorted(
+            {
+                position
+                for requirement_id in requirement_ids
+                for position in requirement_positions.get(requirement_id, [])
+            }
+        )
+        requirements = self.bulk_compliance_frameworks[framework_name].Requirements
+        return [requirements[position] for position in positions]
+
+
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
 ) -> dict:
@@ -17,26 +116,22 @@ def update_checks_metadata_with_compliance(
         dict: The checks metadata with the compliance frameworks
     """
     try:
+        compliance_index = ComplianceIndex(bulk_compliance_frameworks)
         for check in bulk_checks_metadata:
             check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Name=framework.Name,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
+            for framework_name, requirement in compliance_index.get_requirements(check):
+                framework = bulk_compliance_frameworks[framework_name]
+                # Create the Compliance with the check's requirement, the framework and its requirements are already validated
+                compliance = Compliance.construct(
+                    Framework=framework.Framework,
+                    Name=framework.Name,
+                    Provider=framework.Provider,
+                    Version=framework.Version,
+                    Description=framework.Description,
+                    Requirements=[requirement],
+                )
+                # Include the compliance framework for the check
+                check_compliance.append(compliance)
             # Save it into the check's metadata
             bulk_checks_metadata[check].Compliance = check_compliance
         return bulk_checks_metadata
@@ -1,10 +1,12 @@
 import os
+import pickle
 import sys
 from enum import Enum
 from typing import Optional, Union
 
 from pydantic.v1 import BaseModel, ValidationError, root_validator
 
+from prowler.lib.check.catalog import load_catalog
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
 
@@ -372,8 +374,12 @@ class Compliance(BaseModel):
         return requirement
 
     @staticmethod
-    def get_bulk(provider: str) -> dict:
-        """Bulk load all compliance frameworks specification into a dict"""
+    def get_bulk(provider: str, use_catalog: bool = True) -> dict:
+        """Bulk load all compliance frameworks specification into a dict, from the prebuilt catalog of the provider if there is a valid one"""
+        if use_catalog:
+            catalog = load_catalog(provider)
+            if catalog:
+                return pickle.loads(catalog["compliance_frameworks"])
         try:
             bulk_compliance_frameworks = {}
             available_compliance_framework_modules = list_compliance_modules()
@@ -1,7 +1,9 @@
 import functools
 import os
+import pickle
 import re
 import sys
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
@@ -11,6 +13,7 @@ from pydantic.v1 import BaseModel, Field, ValidationError, validator
 from pydantic.v1.error_wrappers import ErrorWrapper
 
 from prowler.config.config import Provider
+from prowler.lib.check.catalog import load_catalog, prowler_directory
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
@@ -204,14 +207,20 @@ class CheckMetadata(BaseModel):
         return additional_urls
 
     @staticmethod
-    def get_bulk(provider: str) -> dict[str, "CheckMetadata"]:
+    def get_bulk(provider: str, use_catalog: bool = True) -> dict[str, "CheckMetadata"]:
         """
         Load the metadata of all checks for a given provider reading the check's metadata files.
         Args:
             provider (str): The name of the provider.
+            use_catalog (bool): Load the metadata from the prebuilt catalog of the provider, if there is a valid one.
         Returns:
             dict[str, CheckMetadata]: A dictionary containing the metadata of all checks, with the CheckID as the key.
         """
+        if use_catalog:
+            catalog = load_catalog(provider)
+            if catalog:
+                CheckMetadataRegistry.register_catalog(catalog)
+                return pickle.loads(catalog["checks_metadata"])
 
         bulk_check_metadata = {}
         checks = recover_checks_from_provider(provider)
@@ -447,12 +456,12 @@ class Check(ABC, CheckMetadata):
         """Check's init function. Calls the CheckMetadataModel init."""
         file_path = os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
 
-        # Parse the Check's metadata file
+        # Get the Check's metadata from the registry, parsed only once per process
         metadata_file = file_path + ".metadata.json"
-        # Store it to validate them with Pydantic
-        data = CheckMetadata.parse_file(metadata_file).dict()
-        # Calls parents init function
-        super().__init__(**data)
+        check_metadata = CheckMetadataRegistry.get(metadata_file).copy(deep=True)
+        # Same as CheckMetadata.construct, since the registry already validated it
+        object.__setattr__(self, "__dict__", check_metadata.__dict__)
+        object.__setattr__(self, "__fields_set__", check_metadata.__fields_set__)
 
         # Verify names consistency
         check_id = self.CheckID
@@ -491,6 +500,7 @@ class Check_Report:
     resource_details: str
     resource_tags: list
     muted: bool
+    muted_reason: Optional[str]
 
     def __init__(self, metadata: Dict, resource: Any) -> None:
         """Initialize the Check's finding information.
@@ -501,7 +511,7 @@ class Check_Report:
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
+        self.check_metadata = CheckMetadataRegistry.parse_raw(metadata)
         if isinstance(resource, dict):
             self.resource = resource
         elif hasattr(resource, "dict"):
@@ -519,6 +529,7 @@ class Check_Report:
         self.resource_details = ""
         self.resource_tags = getattr(resource, "tags", []) if resource else []
         self.muted = False
+        self.muted_reason = None
 
 
 @dataclass
@@ -843,9 +854,155 @@ def load_check_metadata(metadata_file: str) -> CheckMetadata:
     """
 
     try:
-        check_metadata = CheckMetadata.parse_file(metadata_file)
+        check_metadata = CheckMetadataRegistry.get(metadata_file).copy(deep=True)
     except ValidationError as error:
         logger.critical(f"Metadata from {metadata_file} is not valid: {error}")
         raise error
     else:
         return check_metadata
+
+
+class CheckMetadataRegistry:
+    """
+    Process-wide registry of the checks metadata, so each metadata file and each serialized
+    metadata given to the findings is parsed and validated only once.
+
+    The registry entries are shared, callers that need to modify them must use a copy.
+    """
+
+    # Metadata file -> (metadata file mtime, CheckMetadata)
+    _metadata_files: dict = {}
+    # Providers whose catalog was added to the registry
+    _catalogs: set = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_mtime(metadata_file: str) -> Optional[int]:
+        try:
+            return os.stat(metadata_file).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def get(cls, metadata_file: str) -> CheckMetadata:
+        """
+        get returns the shared metadata of the given metadata file, parsing it the first time
+        or if the file changed since it was parsed.
+
+        Args:
+            metadata_file (str): The path to the metadata file.
+
+        Returns:
+            CheckMetadata: The shared check metadata, it must not be modified.
+
+        Raises:
+            ValidationError: If the metadata file is not valid.
+        """
+        mtime = cls._get_mtime(metadata_file)
+        with cls._lock:
+            entry = cls._metadata_files.get(metadata_file)
+        if entry and entry[0] == mtime:
+            return entry[1]
+        check_metadata = CheckMetadata.parse_file(metadata_file)
+        with cls._lock:
+            cls._metadata_files[metadata_file] = (mtime, check_metadata)
+        return check_metadata
+
+    @classmethod
+    def register_catalog(cls, catalog: dict) -> None:
+        """
+        register_catalog adds to the registry the checks metadata of the given prebuilt catalog,
+        see prowler.lib.check.catalog, so the checks do not parse their metadata files.
+
+        Args:
+            catalog (dict): The catalog of a provider.
+        """
+        with cls._lock:
+            if catalog["provider"] in cls._catalogs:
+                return
+            cls._catalogs.add(catalog["provider"])
+        checks_metadata = pickle.loads(catalog["checks_metadata"])
+        entries = {}
+        # The catalog matches the content of the metadata files, so the entries take their current
+        # modification time and the files edited from now on are parsed again
+        for check_id, metadata_file in catalog["metadata_files"].items():
+            if check_id in checks_metadata:
+                metadata_file = os.path.join(prowler_directory, metadata_file)
+                entries[metadata_file] = (
+                    cls._get_mtime(metadata_file),
+                    checks_metadata[check_id],
+                )
+        with cls._lock:
+            cls._metadata_files.update(entries)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_raw(metadata: str) -> CheckMetadata:
+        return CheckMetadata.parse_raw(metadata)
+
+    @classmethod
+    def parse_raw(cls, metadata) -> CheckMetadata:
+        """
+        parse_raw returns the CheckMetadata of the given serialized metadata, e.g. Check.metadata().
+
+        Every finding of a check is created with the same serialized metadata, so it is parsed once
+        and each finding gets a shallow copy, allowing checks to set fields like the Severity per finding.
+
+        Args:
+            metadata (str): The JSON metadata of the check.
+
+        Returns:
+            CheckMetadata: A copy of the check metadata.
+        """
+        if isinstance(metadata, CheckMetadata):
+            return metadata.copy()
+        if isinstance(metadata, (str, bytes)):
+            return cls._parse_raw(metadata).copy()
+        return CheckMetadata.parse_raw(metadata)
+
+    @classmethod
+    def save_index(cls, index_file: str) -> None:
+        """
+        save_index persists the parsed metadata files of the registry, to be loaded with load_index.
+
+        Args:
+            index_file (str): The path to the index file.
+        """
+        with cls._lock:
+            metadata_files = dict(cls._metadata_files)
+        with open(index_file, "wb") as f:
+            pickle.dump(metadata_files, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load_index(cls, index_file: str) -> bool:
+        """
+        load_index adds to the registry the metadata files persisted with save_index. Each entry is
+        only used while its metadata file keeps the same modification time.
+
+        Only index files created by Prowler must be loaded, since they are pickle files.
+
+        Args:
+            index_file (str): The path to the index file.
+
+        Returns:
+            bool: True if the index was loaded, False otherwise.
+        """
+        try:
+            with open(index_file, "rb") as f:
+                metadata_files = pickle.load(f)
+            with cls._lock:
+                cls._metadata_files.update(metadata_files)
+            return True
+        except Exception as error:
+            logger.warning(
+                f"{index_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return False
+
+    @classmethod
+    def clear(cls) -> None:
+        """clear removes all the metadata from the registry"""
+        with cls._lock:
+            cls._metadata_files = {}
+            cls._catalogs = set()
+        cls._parse_raw.cache_clear()
@@ -0,0 +1,162 @@
+import ast
+import importlib
+import importlib.util
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable
+
+from prowler.lib.check.utils import recover_checks_from_provider
+from prowler.lib.logger import logger
+
+
+def get_imported_clients(file_path: str) -> set:
+    """
+    get_imported_clients returns the *_client modules imported by the given Python file
+
+    Example:
+        get_imported_clients(".../iam_root_mfa_enabled.py") -> {"prowler.providers.aws.services.iam.iam_client"}
+    """
+    imported_clients = set()
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=file_path)
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module
+                and node.module.endswith("_client")
+            ):
+                imported_clients.add(node.module)
+    except Exception as error:
+        logger.error(
+            f"{file_path} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return imported_clients
+
+
+def get_client_dependencies(client_module: str) -> set:
+    """
+    get_client_dependencies returns the *_client modules that have to be loaded before the given one,
+    since they are imported by the client itself or by the service module it instantiates
+
+    Example:
+        get_client_dependencies("prowler.providers.azure.services.app.app_client") -> {"prowler.providers.azure.services.monitor.monitor_client"}
+    """
+    dependencies = set()
+    try:
+        client_spec = importlib.util.find_spec(client_module)
+        if not client_spec or not client_spec.origin:
+            return dependencies
+        dependencies.update(get_imported_clients(client_spec.origin))
+        with open(client_spec.origin, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=client_spec.origin)
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module
+                and node.module.endswith("_service")
+            ):
+                service_spec = importlib.util.find_spec(node.module)
+                if service_spec and service_spec.origin:
+                    dependencies.update(get_imported_clients(service_spec.origin))
+    except Exception as error:
+        logger.error(
+            f"{client_module} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    dependencies.discard(client_module)
+    return dependencies
+
+
+def get_service_clients_to_load(provider: str, checks_to_execute: list) -> dict:
+    """
+    get_service_clients_to_load returns the service clients needed by the given checks with their dependencies
+
+    Args:
+        provider (str): provider type, e.g. aws
+        checks_to_execute (list): check names to execute
+
+    Returns:
+        dict: client module -> set of client modules it depends on
+
+    Example:
+        get_service_clients_to_load("aws", ["iam_root_mfa_enabled"])
+        -> {"prowler.providers.aws.services.iam.iam_client": set()}
+    """
+    service_clients = {}
+    try:
+        checks_to_execute = set(checks_to_execute)
+        pending_clients = set()
+        for check_name, check_path in recover_checks_from_provider(provider):
+            if check_name in checks_to_execute:
+                pending_clients.update(
+                    get_imported_clients(os.path.join(check_path, f"{check_name}.py"))
+                )
+        # Add the clients needed to build the clients imported by the checks
+        while pending_clients:
+            client_module = pending_clients.pop()
+            if client_module in service_clients:
+                continue
+            service_clients[client_module] = get_client_dependencies(client_module)
+            pending_clients.update(
+                service_clients[client_module] - service_clients.keys()
+            )
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return service_clients
+
+
+def load_service_clients(
+    service_clients: dict,
+    max_workers: int,
+    on_client_loaded: Callable = None,
+) -> set:
+    """
+    load_service_clients builds the given service clients concurrently, before the checks import them
+
+    A client is only scheduled once all the clients it depends on are loaded and at most
+    max_workers clients are built at the same time. Clients that fail to load are logged
+    and left to be imported again by the checks, as it happens without prefetching.
+
+    Args:
+        service_clients (dict): client module -> set of client modules it depends on, see get_service_clients_to_load
+        max_workers (int): number of clients that can be built concurrently
+        on_client_loaded (Callable): called as on_client_loaded(client_module) once each client is processed
+
+    Returns:
+        set: the client modules loaded successfully
+    """
+    loaded_clients = set()
+    pending_clients = dict(service_clients)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        while pending_clients or running:
+            ready_clients = [
+                client_module
+                for client_module, dependencies in pending_clients.items()
+                if not (dependencies & pending_clients.keys())
+                and not (dependencies & set(running.values()))
+            ]
+            # Circular dependencies are left to the import system
+            if not ready_clients and not running:
+                ready_clients = list(pending_clients)
+            for client_module in sorted(ready_clients):
+                pending_clients.pop(client_module)
+                running[executor.submit(importlib.import_module, client_module)] = (
+                    client_module
+                )
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                client_module = running.pop(future)
+                try:
+                    future.result()
+                    loaded_clients.add(client_module)
+                except Exception as error:
+                    logger.error(
+                        f"{client_module} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                if on_client_loaded:
+                    on_client_loaded(client_module)
+    return loaded_clients
@@ -1,6 +1,7 @@
 import argparse
 import sys
 from argparse import RawTextHelpFormatter
+from importlib.util import find_spec
 
 from dashboard.lib.arguments.arguments import init_dashboard_parser
 from prowler.config.config import (
@@ -10,6 +11,7 @@ from prowler.config.config import (
     default_config_file_path,
     default_fixer_config_file_path,
     default_output_directory,
+    ndjson_compression_file_suffixes,
 )
 from prowler.lib.check.models import Severity
 from prowler.lib.outputs.common import Status
@@ -132,6 +134,20 @@ Detailed documentation at https://docs.prowler.com
         if not valid:
             self.parser.error(f"{args.provider}: {message}")
 
+        # The outputs with an optional dependency need its extra installed
+        if "parquet" in (getattr(args, "output_formats", None) or []) and not find_spec(
+            "pyarrow"
+        ):
+            self.parser.error(
+                "The parquet output requires pyarrow, install it with: pip install 'prowler[parquet]'"
+            )
+        if getattr(args, "ndjson_compression", None) == "zstd" and not find_spec(
+            "zstandard"
+        ):
+            self.parser.error(
+                "The zstd compression requires zstandard, install it with: pip install 'prowler[zstd]'"
+            )
+
         return args
 
     def __set_default_provider__(self, args: list) -> list:
@@ -201,6 +217,18 @@ Detailed documentation at https://docs.prowler.com
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--ndjson-compression",
+            choices=ndjson_compression_file_suffixes.keys(),
+            default=None,
+            help="Compress the json-ocsf-ndjson output with gzip or zstd",
+        )
+        common_outputs_parser.add_argument(
+            "--streaming-outputs",
+            action="store_true",
+            default=False,
+            help="Write the findings of every check to the outputs as soon as it finishes, keeping the memory usage constant. Not compatible with --fixer. With --security-hub the ASFF findings are still kept in memory until they are sent at the end of the scan.",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -303,6 +331,23 @@ Detailed documentation at https://docs.prowler.com
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--checks-workers",
+            type=int,
+            default=1,
+            help="Number of threads used to execute the checks once the services are loaded. By default the checks are executed one after another.",
+        )
+        common_checks_parser.add_argument(
+            "--group-checks-by-service",
+            action="store_true",
+            help="Execute all the checks of the same service in the same thread when --checks-workers is greater than 1.",
+        )
+        common_checks_parser.add_argument(
+            "--services-workers",
+            type=int,
+            default=1,
+            help="Number of services loaded concurrently before executing the checks. By default each service is loaded by the first check that needs it.",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
@@ -0,0 +1,467 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.utils import unroll_dict
+
+# Items with inline flags, named groups or numbered backreferences do not keep their meaning
+# once they are joined with others in a single regex, so they are matched one by one
+_NOT_COMBINABLE_ITEM = re.compile(r"\(\?|\\[1-9]")
+# Characters matched literally in the tag items that can be evaluated tag by tag
+_TAG_LITERAL_CHARACTERS = re.compile(r"[\w\-=:/@+,]")
+_TAG_ITEM_CHARACTERS = re.compile(r"[\w\-=:/@+,()|.*]*")
+
+# Number of tag sets cached by the tags unrolling and by each tag rule
+MUTELIST_TAGS_CACHE_SIZE = 4096
+MUTELIST_TAG_RULE_CACHE_SIZE = 1024
+
+
+class ItemsMatcher:
+    """
+    ItemsMatcher matches a finding value against the items of a mutelist field, e.g. Regions or Resources,
+    with the same logic as Mutelist.is_item_matched but with the regexes compiled once.
+
+    - The items are ORed, using a single alternation regex when possible.
+    - The tag items are ANDed, each of them can contain its own ORed tags, e.g. 'Environment=Dev | Environment=Test'.
+    """
+
+    __slots__ = ("items", "tag", "_regex", "_regexes")
+
+    def __init__(self, items, tag: bool = False):
+        self.items = list(items or [])
+        self.tag = tag
+        self._regex = None
+        self._regexes = None
+        patterns = [
+            item.replace("*", ".*") if "*" in item else item for item in self.items
+        ]
+        try:
+            if (
+                not tag
+                and len(patterns) > 1
+                and not any(_NOT_COMBINABLE_ITEM.search(p) for p in patterns)
+            ):
+                self._regex = re.compile("|".join(f"(?:{p})" for p in patterns))
+            else:
+                self._regexes = [re.compile(pattern) for pattern in patterns]
+        except re.error:
+            # Invalid items are left to Mutelist.is_item_matched, that logs them when matching
+            self._regex = None
+            self._regexes = None
+
+    def matches(self, finding_items) -> bool:
+        """matches returns True if the finding value matches the items, see Mutelist.is_item_matched"""
+        if not self.items or not (finding_items or finding_items == ""):
+            return False
+        try:
+            if self._regex is not None:
+                return self._regex.search(finding_items) is not None
+            if self._regexes is not None:
+                if self.tag:
+                    return all(regex.search(finding_items) for regex in self._regexes)
+                return any(regex.search(finding_items) for regex in self._regexes)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+        # Imported here to avoid a circular import
+        from prowler.lib.mutelist.mutelist import Mutelist
+
+        return Mutelist.is_item_matched(self.items, finding_items, tag=self.tag)
+
+
+def get_tags_key(tags: dict) -> Optional[tuple]:
+    """
+    get_tags_key returns a hashable key of the given tags, with the list values joined as unroll_dict does,
+    or None if the tags cannot be used as a key.
+
+    Example:
+        get_tags_key({"environment": "dev", "owners": ["a", "b"]}) -> (("environment", "dev"), ("owners", "a, b"))
+    """
+    try:
+        tags_key = tuple(
+            (key, ", ".join(value) if isinstance(value, list) else value)
+            for key, value in tags.items()
+        )
+        hash(tags_key)
+        return tags_key
+    except TypeError:
+        return None
+
+
+@lru_cache(maxsize=MUTELIST_TAGS_CACHE_SIZE)
+def unroll_tags_key(tags_key: tuple) -> str:
+    """unroll_tags_key returns the tags of the given key unrolled as unroll_dict does, e.g. 'environment=dev | owners=a, b'"""
+    return unroll_dict(dict(tags_key))
+
+
+def is_tag_item_structured(item: str) -> bool:
+    """
+    is_tag_item_structured returns True if the tag item can only match within a single 'key=value' tag,
+    so evaluating it tag by tag is the same as searching it in the unrolled tags.
+
+    That is the case for items made of literal characters, groups and alternations where:
+    - '.' is between literal characters
+    - '*' is at the beginning or at the end of an alternative of the item
+
+    Example:
+        is_tag_item_structured("environment=dev|project=(test|stage)") -> True
+        is_tag_item_structured("environment=dev.*project=test") -> False
+    """
+    if not _TAG_ITEM_CHARACTERS.fullmatch(item):
+        return False
+    depth = 0
+    for position, character in enumerate(item):
+        previous_character = item[position - 1] if position > 0 else ""
+        next_character = item[position + 1] if position + 1 < len(item) else ""
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == ".":
+            if not (
+                _TAG_LITERAL_CHARACTERS.fullmatch(previous_character)
+                and _TAG_LITERAL_CHARACTERS.fullmatch(next_character)
+            ):
+                return False
+        elif character == "*":
+            at_alternative_boundary = previous_character in (
+                "",
+                "|",
+            ) or next_character in ("", "|")
+            if depth != 0 or not at_alternative_boundary:
+                return False
+    return depth == 0
+
+
+class TagsMatcher:
+    """
+    TagsMatcher matches the finding tags against the Tags of a mutelist rule, see Mutelist.is_item_matched with tag=True.
+
+    The finding tags can be the tags unrolled as a string or the tags dict, e.g. {"environment": "dev"}:
+    - If every tag item can only match within a single tag, the tags dict is evaluated tag by tag
+      without unrolling it, otherwise it is unrolled once per tag set.
+    - The outcome is cached per tag set, since many findings share the same resource or the same tags.
+    """
+
+    __slots__ = ("items", "_matcher", "_structured_regexes", "_cached_matches")
+
+    def __init__(self, items):
+        self.items = list(items or [])
+        self._matcher = ItemsMatcher(self.items, tag=True)
+        self._structured_regexes = None
+        if self.items and all(is_tag_item_structured(item) for item in self.items):
+            try:
+                self._structured_regexes = [
+                    re.compile(item.replace("*", ".*")) for item in self.items
+                ]
+            except re.error:
+                self._structured_regexes = None
+        # Every finding matches a rule with the '*' tag, so there is nothing to cache
+        if self.items == ["*"]:
+            self._cached_matches = self._matches
+        else:
+            self._cached_matches = lru_cache(maxsize=MUTELIST_TAG_RULE_CACHE_SIZE)(
+                self._matches
+            )
+
+    def matches(self, finding_tags) -> bool:
+        """matches returns True if the finding tags match all the tag items"""
+        if not self.items:
+            return False
+        try:
+            if isinstance(finding_tags, dict):
+                tags_key = get_tags_key(finding_tags)
+                if tags_key is None:
+                    return self._matcher.matches(unroll_dict(finding_tags))
+                return self._cached_matches(tags_key, True)
+            return self._cached_matches(finding_tags, False)
+        except TypeError:
+            # Unhashable finding tags are not cached
+            return self._matcher.matches(finding_tags)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+
+    def _matches(self, finding_tags, is_tags_key: bool) -> bool:
+        if not is_tags_key:
+            return self._matcher.matches(finding_tags)
+        if finding_tags and self._structured_regexes is not None:
+            tags = [f"{key}={value}" for key, value in finding_tags]
+            return all(
+                any(regex.search(tag) for tag in tags)
+                for regex in self._structured_regexes
+            )
+        return self._matcher.matches(unroll_tags_key(finding_tags))
+
+
+class ExceptionsMatcher:
+    """ExceptionsMatcher evaluates the Exceptions of a muted check, see Mutelist.is_excepted"""
+
+    __slots__ = ("accounts", "regions", "resources", "tags")
+
+    def __init__(self, exceptions: dict):
+        self.accounts = ItemsMatcher(exceptions.get("Accounts", []))
+        self.regions = ItemsMatcher(exceptions.get("Regions", []))
+        self.resources = ItemsMatcher(exceptions.get("Resources", []))
+        self.tags = TagsMatcher(exceptions.get("Tags", []))
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        is_account_excepted = self.accounts.matches(audited_account)
+        is_region_excepted = self.regions.matches(finding_region)
+        is_resource_excepted = self.resources.matches(finding_resource)
+        is_tag_excepted = self.tags.matches(finding_tags)
+        if not (
+            is_account_excepted
+            or is_region_excepted
+            or is_resource_excepted
+            or is_tag_excepted
+        ):
+            return False
+        return (
+            (is_account_excepted or not self.accounts.items)
+            and (is_region_excepted or not self.regions.items)
+            and (is_resource_excepted or not self.resources.items)
+            and (is_tag_excepted or not self.tags.items)
+        )
+
+
+class MutedCheck:
+    """MutedCheck is a compiled entry of the Checks of a mutelist account"""
+
+    __slots__ = ("key", "name", "_check", "regions", "resources", "tags", "exceptions")
+
+    def __init__(self, name: str, muted_check_info: dict):
+        self.key = name
+        # map lambda to awslambda
+        if name.startswith("lambda"):
+            name = f"aws{name}"
+        self.name = name
+        self._check = ItemsMatcher([name])
+        self.regions = ItemsMatcher(muted_check_info.get("Regions"))
+        self.resources = ItemsMatcher(muted_check_info.get("Resources"))
+        # We need to set the muted tags if None, "" or [], so the falsy helps
+        self.tags = TagsMatcher(muted_check_info.get("Tags") or ["*"])
+        exceptions = muted_check_info.get("Exceptions")
+        self.exceptions = ExceptionsMatcher(exceptions) if exceptions else None
+
+    def matches_check(self, check: str) -> bool:
+        return self.name == "*" or self.name == check or self._check.matches(check)
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        return self.exceptions is not None and self.exceptions.is_excepted(
+            audited_account, finding_region, finding_resource, finding_tags
+        )
+
+
+class MutedChecks:
+    """
+    MutedChecks holds the compiled Checks of a mutelist account.
+
+    Check names are matched as regexes, so the entries that apply to each check and region are
+    resolved the first time they are evaluated and then reused for all their findings.
+    """
+
+    __slots__ = ("entries", "_entries_by_check", "_entries_by_group")
+
+    def __init__(self, muted_checks: dict):
+        self.entries = [
+            MutedCheck(muted_check, muted_check_info or {})
+            for muted_check, muted_check_info in (muted_checks or {}).items()
+        ]
+        self._entries_by_check = {}
+        self._entries_by_group = {}
+
+    def get_entries(self, check: str) -> list:
+        """get_entries returns the entries that apply to the given check, in the mutelist order"""
+        entries = self._entries_by_check.get(check)
+        if entries is None:
+            entries = [entry for entry in self.entries if entry.matches_check(check)]
+            self._entries_by_check[check] = entries
+        return entries
+
+    def get_group_entries(self, check: str, finding_region) -> list:
+        """
+        get_group_entries returns the entries to evaluate for the findings of the given check and region,
+        as (entry, muted_in_region) in the mutelist order.
+
+        Entries not muting the region are only kept if they have exceptions, since an exception stops
+        the evaluation of the next entries.
+        """
+        group = (check, finding_region)
+        entries = self._entries_by_group.get(group)
+        if entries is None:
+            entries = []
+            for entry in self.get_entries(check):
+                muted_in_region = entry.regions.matches(finding_region)
+                if muted_in_region or entry.exceptions is not None:
+                    entries.append((entry, muted_in_region))
+            self._entries_by_group[group] = entries
+        return entries
+
+    def get_muting_entry(
+        self,
+        audited_account,
+        check,
+        finding_region,
+        finding_resource,
+        finding_tags,
+    ) -> Optional[MutedCheck]:
+        """get_muting_entry returns the entry muting the finding or None, see the get_muting_entry function"""
+        return get_muting_entry(
+            self.get_group_entries(check, finding_region),
+            audited_account,
+            finding_region,
+            finding_resource,
+            finding_tags,
+        )
+
+    def is_muted(
+        self,
+        audited_account,
+        check,
+        finding_region,
+        finding_resource,
+        finding_tags,
+    ) -> bool:
+        """is_muted returns True if an entry mutes the finding, see get_muting_entry"""
+        return (
+            self.get_muting_entry(
+                audited_account, check, finding_region, finding_resource, finding_tags
+            )
+            is not None
+        )
+
+
+def get_muting_entry(
+    group_entries: list,
+    audited_account,
+    finding_region,
+    finding_resource,
+    finding_tags,
+) -> Optional[MutedCheck]:
+    """
+    get_muting_entry returns the first entry muting the finding, unless a previous entry
+    excepts it, as Mutelist.is_muted_in_check does. None if the finding is not muted.
+
+    Args:
+        group_entries (list): The entries of the finding check and region, see MutedChecks.get_group_entries
+    """
+    for entry, muted_in_region in group_entries:
+        if entry.is_excepted(
+            audited_account, finding_region, finding_resource, finding_tags
+        ):
+            return None
+        if (
+            muted_in_region
+            and entry.resources.matches(finding_resource)
+            and entry.tags.matches(finding_tags)
+        ):
+            return entry
+    return None
+
+
+class CompiledMutelist:
+    """
+    CompiledMutelist is the mutelist converted into an indexed structure to evaluate findings:
+    - Accounts indexed by their exact ID, with the '*' account as the wildcard bucket
+    - Checks of each account compiled into MutedChecks
+    - Regions, Resources and Tags precompiled into regexes
+
+    Attributes:
+        source (dict): The mutelist it was compiled from.
+        accounts (dict): Account -> MutedChecks.
+    """
+
+    __slots__ = ("source", "accounts")
+
+    def __init__(self, mutelist: dict):
+        self.source = mutelist
+        self.accounts = {}
+        for account, account_info in ((mutelist or {}).get("Accounts") or {}).items():
+            self.accounts[account] = MutedChecks((account_info or {}).get("Checks"))
+
+    def get_muting_rules(
+        self,
+        audited_account,
+        check,
+        finding_region,
+        resources_and_tags: list,
+    ) -> list:
+        """
+        get_muting_rules returns the ID of the mutelist rule muting each finding of the same account, check and region,
+        evaluating the audited account and the '*' account. None for the findings that are not muted.
+
+        The rules applying to the group are resolved once, so groups without them are not evaluated per finding.
+        The rule ID is the account and the check of the rule as they are in the mutelist, e.g. '*/ec2_*'.
+
+        Args:
+            audited_account: The account of the findings.
+            check (str): The check of the findings.
+            finding_region (str): The region of the findings.
+            resources_and_tags (list): The (resource, tags) of each finding.
+
+        Returns:
+            list: The rule ID or None for each finding.
+        """
+        accounts_entries = []
+        for account in dict.fromkeys((audited_account, "*")):
+            muted_checks = self.accounts.get(account)
+            if muted_checks:
+                group_entries = muted_checks.get_group_entries(check, finding_region)
+                if group_entries:
+                    accounts_entries.append((account, group_entries))
+
+        rules = [None] * len(resources_and_tags)
+        if not accounts_entries:
+            return rules
+        for index, (finding_resource, finding_tags) in enumerate(resources_and_tags):
+            for account, group_entries in accounts_entries:
+                entry = get_muting_entry(
+                    group_entries,
+                    audited_account,
+                    finding_region,
+                    finding_resource,
+                    finding_tags,
+                )
+                if entry:
+                    rules[index] = f"{account}/{entry.key}"
+                    break
+        return rules
+
+    def get_muting_rule(
+        self,
+        audited_account,
+        check,
+        finding_region,
+        finding_resource,
+        finding_tags,
+    ) -> Optional[str]:
+        """get_muting_rule returns the ID of the mutelist rule muting the finding or None, see get_muting_rules"""
+        return self.get_muting_rules(
+            audited_account, check, finding_region, [(finding_resource, finding_tags)]
+        )[0]
+
+    def is_muted(
+        self,
+        audited_account,
+        check,
+        finding_region,
+        finding_resource,
+        finding_tags,
+    ) -> bool:
+        """is_muted returns True if the finding is muted by the audited account or by the '*' account"""
+        return (
+            self.get_muting_rule(
+                audited_account, check, finding_region, finding_resource, finding_tags
+            )
+            is not None
+        )
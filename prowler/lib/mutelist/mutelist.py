@@ -1,12 +1,14 @@
 import re
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import yaml
 from jsonschema import validate
 
 from prowler.lib.logger import logger
+from prowler.lib.mutelist.matcher import CompiledMutelist, MutedChecks
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 mutelist_schema = {
     "type": "object",
@@ -90,21 +92,27 @@ class Mutelist(ABC):
     Attributes:
         _mutelist (dict): Dictionary containing information about muted checks for different accounts.
         _mutelist_file_path (str): Path to the mutelist file.
+        _compiled_mutelist (CompiledMutelist): The mutelist compiled to evaluate the findings.
         MUTELIST_KEY (str): Key used to access the mutelist in the mutelist file.
 
     Methods:
         __init__: Initializes a Mutelist object.
         mutelist: Property that returns the mutelist dictionary.
         mutelist_file_path: Property that returns the mutelist file path.
+        compiled_mutelist: Property that returns the compiled mutelist.
         is_finding_muted: Abstract method to check if a finding is muted.
         get_mutelist_file_from_local_file: Retrieves the mutelist file from a local file.
+        get_finding_mutelist_fields: Returns the fields of a finding evaluated by the mutelist.
         is_muted: Checks if a finding is muted for the audited account, check, region, resource, and tags.
+        get_muting_rule: Returns the ID of the mutelist rule muting a finding.
+        mute_findings: Evaluates a list of findings returning the mute mask and the muting rules.
         is_muted_in_check: Checks if a check is muted.
         is_excepted: Checks if the account, region, resource, and tags are excepted based on the exceptions.
     """
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    _compiled_mutelist: CompiledMutelist = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -119,6 +127,7 @@ class Mutelist(ABC):
 
         if self._mutelist:
             self._mutelist = Mutelist.validate_mutelist(self._mutelist)
+        self._compiled_mutelist = CompiledMutelist(self._mutelist)
 
     @property
     def mutelist(self) -> dict:
@@ -128,10 +137,33 @@ class Mutelist(ABC):
     def mutelist_file_path(self) -> dict:
         return self._mutelist_file_path
 
+    @property
+    def compiled_mutelist(self) -> CompiledMutelist:
+        """
+        compiled_mutelist returns the mutelist compiled to evaluate the findings.
+
+        It is compiled again if the mutelist was replaced after being compiled.
+        """
+        if (
+            self._compiled_mutelist is None
+            or self._compiled_mutelist.source is not self._mutelist
+        ):
+            self._compiled_mutelist = CompiledMutelist(self._mutelist)
+        return self._compiled_mutelist
+
     @abstractmethod
     def is_finding_muted(self) -> bool:
         raise NotImplementedError
 
+    def get_finding_mutelist_fields(self, finding, **kwargs) -> list:
+        """
+        get_finding_mutelist_fields returns the (audited_account, check, region, resource, tags) evaluated by the mutelist
+        for the given finding, the finding is muted if any of them is muted.
+
+        Providers implement it with the same arguments as is_finding_muted to support mute_findings.
+        """
+        raise NotImplementedError
+
     def get_mutelist_file_from_local_file(self, mutelist_path: str):
         try:
             with open(mutelist_path) as f:
@@ -178,37 +210,114 @@ class Mutelist(ABC):
             check (str): The check to be evaluated for muting.
             finding_region (str): The region where the finding occurred.
             finding_resource (str): The resource related to the finding.
-            finding_tags: The tags associated with the finding.
+            finding_tags: The tags associated with the finding, as a dict or unrolled as a string, e.g. "environment=dev | project=prowler".
 
         Returns:
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
-            # By default is not muted
-            is_finding_muted = False
-
-            # We always check all the accounts present in the mutelist
-            # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
-
-            return is_finding_muted
+            # The accounts are indexed, so only the audited account and '*' are evaluated
+            # if one mutes the finding it is muted
+            return self.compiled_mutelist.is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
             )
             return False
 
+    def get_muting_rule(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> Optional[str]:
+        """
+        Get the ID of the mutelist rule muting the provided finding, see is_muted.
+
+        The rule ID is the account and the check of the rule as they are in the mutelist, e.g. '*/ec2_*'.
+
+        Returns:
+            str: The ID of the rule muting the finding or None if it is not muted.
+        """
+        try:
+            return self.compiled_mutelist.get_muting_rule(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return None
+
+    def mute_findings(self, findings: list, **is_finding_muted_args) -> tuple:
+        """
+        Evaluate the mutelist for a list of findings, e.g. all the findings of a check.
+
+        The findings are grouped by account, check and region, so the mutelist rules applying to each
+        group are resolved once and only the resources and tags are evaluated per finding.
+        Providers without get_finding_mutelist_fields fall back to is_finding_muted for each finding.
+
+        Args:
+            findings (list): The findings to be evaluated for muting.
+            is_finding_muted_args: The provider arguments of is_finding_muted, e.g. aws_account_id.
+
+        Returns:
+            tuple: (muted, rules), the mute mask and the ID of the rule muting each finding or None.
+        """
+        muted = [False] * len(findings)
+        rules = [None] * len(findings)
+        groups = {}
+        for index, finding in enumerate(findings):
+            try:
+                finding_fields = self.get_finding_mutelist_fields(
+                    finding, **is_finding_muted_args
+                )
+            except NotImplementedError:
+                muted[index] = self.is_finding_muted(
+                    finding=finding, **is_finding_muted_args
+                )
+                continue
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+                )
+                continue
+            for audited_account, check, region, resource, tags in finding_fields:
+                groups.setdefault((audited_account, check, region), []).append(
+                    (index, resource, tags)
+                )
+
+        for (audited_account, check, region), group_findings in groups.items():
+            try:
+                group_rules = self.compiled_mutelist.get_muting_rules(
+                    audited_account,
+                    check,
+                    region,
+                    [(resource, tags) for _, resource, tags in group_findings],
+                )
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+                )
+                continue
+            for (index, _, _), rule in zip(group_findings, group_rules):
+                if rule and not muted[index]:
+                    muted[index] = True
+                    rules[index] = rule
+        return muted, rules
+
     def is_muted_in_check(
         self,
         muted_checks,
@@ -227,75 +336,27 @@ class Mutelist(ABC):
             check (str): The check to be evaluated for muting.
             finding_region (str): The region where the finding occurred.
             finding_resource (str): The resource related to the finding.
-            finding_tags (str): The tags associated with the finding.
+            finding_tags (str): The tags associated with the finding, as a dict or unrolled as a string.
 
         Returns:
             bool: True if the check is muted, otherwise False.
         """
         try:
-            # Default value is not muted
-            is_check_muted = False
-
-            for muted_check, muted_check_info in muted_checks.items():
-                # map lambda to awslambda
-                muted_check = re.sub("^lambda", "awslambda", muted_check)
-
-                check_match = (
-                    "*" == muted_check
-                    or check == muted_check
-                    or self.is_item_matched([muted_check], check)
-                )
-
-                # Check if the finding is excepted
-                exceptions = muted_check_info.get("Exceptions")
-                if (
-                    self.is_excepted(
-                        exceptions,
-                        audited_account,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    )
-                    and check_match
-                ):
-                    # Break loop and return default value since is excepted
-                    break
-
-                muted_regions = muted_check_info.get("Regions")
-                muted_resources = muted_check_info.get("Resources")
-                muted_tags = muted_check_info.get("Tags", "*")
-                # We need to set the muted_tags if None, "" or [], so the falsy helps
-                if not muted_tags:
-                    muted_tags = "*"
-                # If there is a *, it affects to all checks
-                if check_match:
-                    muted_in_check = True
-                    muted_in_region = self.is_item_matched(
-                        muted_regions, finding_region
-                    )
-                    muted_in_resource = self.is_item_matched(
-                        muted_resources, finding_resource
-                    )
-                    muted_in_tags = self.is_item_matched(
-                        muted_tags, finding_tags, tag=True
-                    )
-
-                    # For a finding to be muted requires the following set to True:
-                    # - muted_in_check -> True
-                    # - muted_in_region -> True
-                    # - muted_in_tags -> True
-                    # - muted_in_resource -> True
-                    # - excepted -> False
-
-                    if (
-                        muted_in_check
-                        and muted_in_region
-                        and muted_in_tags
-                        and muted_in_resource
-                    ):
-                        is_check_muted = True
-
-            return is_check_muted
+            # The entries are evaluated in order, the finding is muted by the first entry muting it
+            # unless a previous entry of the same check excepts it.
+            # For a finding to be muted requires the following set to True:
+            # - muted_in_check -> True
+            # - muted_in_region -> True
+            # - muted_in_tags -> True
+            # - muted_in_resource -> True
+            # - excepted -> False
+            return MutedChecks(muted_checks).is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -319,7 +380,7 @@ class Mutelist(ABC):
                 finding.metadata.CheckID,
                 finding.region,
                 finding.resource_uid,
-                unroll_dict(unroll_tags(finding.resource_tags)),
+                unroll_tags(finding.resource_tags),
             ):
                 finding.raw["status"] = finding.status
                 finding.status = Status.MUTED
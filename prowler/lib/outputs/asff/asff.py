@@ -126,7 +126,7 @@ class ASFF(Output):
         """
         Writes the findings data to a file in JSON ASFF format.
 
-        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
+        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. The first batch starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing the last batch, it writes the closing ']' to complete the JSON array structure and closes the file descriptor.
 
         Returns:
             None
@@ -137,8 +137,9 @@ class ASFF(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                # Write JSON opening/header [
-                self._file_descriptor.write("[")
+                # Write JSON opening/header [ with the first batch
+                if self._file_descriptor.tell() == 0:
+                    self._file_descriptor.write("[")
 
                 # Write findings
                 for finding in self._data:
@@ -149,17 +150,15 @@ class ASFF(Output):
                     )
                     self._file_descriptor.write(",")
 
-                # Write footer/closing ]
-                if self._file_descriptor.tell() > 0:
+                # Write footer/closing ] and close the file descriptor with the last batch
+                if self.close_file or self._from_cli:
                     if self._file_descriptor.tell() != 1:
                         self._file_descriptor.seek(
                             self._file_descriptor.tell() - 1, SEEK_SET
                         )
                     self._file_descriptor.truncate()
                     self._file_descriptor.write("]")
-
-                # Close file descriptor
-                self._file_descriptor.close()
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -18,11 +18,14 @@ def get_c5_table(
         "Status": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    # Finding index -> number of findings
+    pass_findings = {}
+    fail_findings = {}
+    muted_findings = {}
     sections = {}
     for index, finding in enumerate(findings):
+        # The check results of the streaming outputs stand for several findings
+        count = getattr(finding, "count", 1)
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
         for compliance in check_compliances:
@@ -35,16 +38,22 @@ def get_c5_table(
                             sections[section] = {"FAIL": 0, "PASS": 0, "Muted": 0}
 
                         if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                sections[section]["Muted"] += 1
+                            if index not in muted_findings:
+                                muted_findings[index] = count
+                                sections[section]["Muted"] += count
                         else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                                sections[section]["FAIL"] += 1
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                                sections[section]["PASS"] += 1
+                            if finding.status == "FAIL" and index not in fail_findings:
+                                fail_findings[index] = count
+                                sections[section]["FAIL"] += count
+                            elif (
+                                finding.status == "PASS" and index not in pass_findings
+                            ):
+                                pass_findings[index] = count
+                                sections[section]["PASS"] += count
+
+    pass_count = sum(pass_findings.values())
+    fail_count = sum(fail_findings.values())
+    muted_count = sum(muted_findings.values())
 
     sections = dict(sorted(sections.items()))
     for section in sections:
@@ -66,22 +75,22 @@ def get_c5_table(
         )
 
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
         if not compliance_overview:
-            if len(fail_count) > 0 and len(section_table["Section"]) > 0:
+            if fail_count > 0 and len(section_table["Section"]) > 0:
                 print(
                     f"\nFramework {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Results:"
                 )
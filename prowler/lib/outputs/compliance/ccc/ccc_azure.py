@@ -34,36 +34,36 @@ class CCC_Azure(ComplianceOutput):
             - None
         """
         for finding in findings:
-            # Get the compliance requirements for the finding
-            finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = CCC_AzureModel(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            SubscriptionId=finding.account_uid,
-                            Location=finding.region,
-                            AssessmentDate=str(finding.timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_FamilyName=attribute.FamilyName,
-                            Requirements_Attributes_FamilyDescription=attribute.FamilyDescription,
-                            Requirements_Attributes_Section=attribute.Section,
-                            Requirements_Attributes_SubSection=attribute.SubSection,
-                            Requirements_Attributes_SubSectionObjective=attribute.SubSectionObjective,
-                            Requirements_Attributes_Applicability=attribute.Applicability,
-                            Requirements_Attributes_Recommendation=attribute.Recommendation,
-                            Requirements_Attributes_SectionThreatMappings=attribute.SectionThreatMappings,
-                            Requirements_Attributes_SectionGuidelineMappings=attribute.SectionGuidelineMappings,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                        )
-                        self._data.append(compliance_row)
+            # Get the compliance requirements that include the finding
+            for requirement in self.get_finding_requirements(
+                finding, compliance, compliance_name
+            ):
+                for attribute in requirement.Attributes:
+                    compliance_row = CCC_AzureModel(
+                        Provider=finding.provider,
+                        Description=compliance.Description,
+                        SubscriptionId=finding.account_uid,
+                        Location=finding.region,
+                        AssessmentDate=str(finding.timestamp),
+                        Requirements_Id=requirement.Id,
+                        Requirements_Description=requirement.Description,
+                        Requirements_Attributes_FamilyName=attribute.FamilyName,
+                        Requirements_Attributes_FamilyDescription=attribute.FamilyDescription,
+                        Requirements_Attributes_Section=attribute.Section,
+                        Requirements_Attributes_SubSection=attribute.SubSection,
+                        Requirements_Attributes_SubSectionObjective=attribute.SubSectionObjective,
+                        Requirements_Attributes_Applicability=attribute.Applicability,
+                        Requirements_Attributes_Recommendation=attribute.Recommendation,
+                        Requirements_Attributes_SectionThreatMappings=attribute.SectionThreatMappings,
+                        Requirements_Attributes_SectionGuidelineMappings=attribute.SectionGuidelineMappings,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        ResourceName=finding.resource_name,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
+                    )
+                    self._data.append(compliance_row)
         # Add manual requirements to the compliance output
         for requirement in compliance.Requirements:
             if not requirement.Checks:
@@ -1,5 +1,6 @@
 import sys
 
+from prowler.lib.check.compliance import ComplianceIndex
 from prowler.lib.check.models import Check_Report
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance.c5.c5 import get_c5_table
@@ -29,7 +30,7 @@ def display_compliance_table(
     display_compliance_table generates the compliance table for the given compliance framework.
 
     Args:
-        findings (list): The list of findings
+        findings (list): The list of findings, or of CheckResult with the number of findings as their count
         bulk_checks_metadata (dict): The bulk checks metadata
         compliance_framework (str): The compliance framework to generate the table
         output_filename (str): The output filename
@@ -112,7 +113,10 @@ def display_compliance_table(
 
 # TODO: this should be in the Check class
 def get_check_compliance(
-    finding: Check_Report, provider_type: str, bulk_checks_metadata: dict
+    finding: Check_Report,
+    provider_type: str,
+    bulk_checks_metadata: dict,
+    compliance_index: ComplianceIndex = None,
 ) -> dict:
     """get_check_compliance returns a map with the compliance framework as key and the requirements where the finding's check is present.
 
@@ -127,11 +131,16 @@ def get_check_compliance(
         finding (Any): The Check_Report finding
         provider_type (str): The provider type
         bulk_checks_metadata (dict): The bulk checks metadata
+        compliance_index (ComplianceIndex): If passed, the requirements are queried from it instead of the checks metadata
 
     Returns:
         dict: The compliance framework as key and the requirements where the finding's check is present.
     """
     try:
+        if compliance_index:
+            return compliance_index.get_check_compliance(
+                finding.check_metadata.CheckID, provider_type
+            )
         check_compliance = {}
         # We have to retrieve all the check's compliance requirements
         if finding.check_metadata.CheckID in bulk_checks_metadata:
@@ -2,6 +2,7 @@ from csv import DictWriter
 from pathlib import Path
 from typing import List
 
+from prowler.lib.check.compliance import ComplianceIndex
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
@@ -21,6 +22,7 @@ class ComplianceOutput(Output):
         data: Property to access the transformed data.
         file_descriptor: Property to access the file descriptor.
         transform: Abstract method to transform findings into a specific format.
+        get_finding_requirements: Method to get the compliance requirements that include a finding.
         batch_write_data_to_file: Abstract method to write data to a file in batches.
         create_file_descriptor: Method to create a file descriptor for writing data to a file.
     """
@@ -61,6 +63,36 @@ class ComplianceOutput(Output):
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
+    def get_finding_requirements(
+        self, finding: Finding, compliance: Compliance, compliance_name: str
+    ) -> list:
+        """
+        Returns the requirements of the compliance framework that include the finding, in the framework order.
+
+        Parameters:
+            - finding (Finding): The finding.
+            - compliance (Compliance): The compliance model.
+            - compliance_name (str): The name of the compliance model, e.g. CIS-2.0.
+
+        Returns:
+            - list: The compliance requirements.
+        """
+        compliance_index = getattr(self, "_compliance_index", None)
+        if (
+            not compliance_index
+            or compliance_index.bulk_compliance_frameworks.get(compliance_name)
+            is not compliance
+        ):
+            compliance_index = ComplianceIndex({compliance_name: compliance})
+            self._compliance_index = compliance_index
+        finding_requirements = finding.compliance.get(compliance_name, [])
+        # A single requirement can be stored without a list
+        if isinstance(finding_requirements, str):
+            finding_requirements = [finding_requirements]
+        return compliance_index.get_requirements_by_id(
+            compliance_name, finding_requirements
+        )
+
     def batch_write_data_to_file(self) -> None:
         """
         Writes the findings data to a CSV file in the specific compliance format.
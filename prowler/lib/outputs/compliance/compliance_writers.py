@@ -0,0 +1,259 @@
+from prowler.lib.check.compliance import ComplianceIndex
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.c5.c5_aws import AWSC5
+from prowler.lib.outputs.compliance.ccc.ccc_aws import CCC_AWS
+from prowler.lib.outputs.compliance.ccc.ccc_azure import CCC_Azure
+from prowler.lib.outputs.compliance.ccc.ccc_gcp import CCC_GCP
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+from prowler.lib.outputs.compliance.cis.cis_oci import OCICIS
+from prowler.lib.outputs.compliance.compliance_output import ComplianceOutput
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+    KubernetesISO27001,
+)
+from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+    ProwlerThreatScoreAWS,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+    ProwlerThreatScoreAzure,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+    ProwlerThreatScoreGCP,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+    ProwlerThreatScoreM365,
+)
+from prowler.lib.outputs.finding import Finding
+
+# Provider -> (condition on the compliance framework name, compliance output class), the first match is used
+COMPLIANCE_OUTPUT_CLASSES = {
+    "aws": [
+        (lambda name: name.startswith("cis_"), AWSCIS),
+        (lambda name: name == "mitre_attack_aws", AWSMitreAttack),
+        (lambda name: name.startswith("ens_"), AWSENS),
+        (
+            lambda name: name.startswith("aws_well_architected_framework"),
+            AWSWellArchitected,
+        ),
+        (lambda name: name.startswith("iso27001_"), AWSISO27001),
+        (lambda name: name.startswith("kisa"), AWSKISAISMSP),
+        (lambda name: name == "prowler_threatscore_aws", ProwlerThreatScoreAWS),
+        (lambda name: name.startswith("ccc_"), CCC_AWS),
+        (lambda name: name == "c5_aws", AWSC5),
+    ],
+    "azure": [
+        (lambda name: name.startswith("cis_"), AzureCIS),
+        (lambda name: name == "mitre_attack_azure", AzureMitreAttack),
+        (lambda name: name.startswith("ens_"), AzureENS),
+        (lambda name: name.startswith("iso27001_"), AzureISO27001),
+        (lambda name: name == "prowler_threatscore_azure", ProwlerThreatScoreAzure),
+        (lambda name: name.startswith("ccc_"), CCC_Azure),
+    ],
+    "gcp": [
+        (lambda name: name.startswith("cis_"), GCPCIS),
+        (lambda name: name == "mitre_attack_gcp", GCPMitreAttack),
+        (lambda name: name.startswith("ens_"), GCPENS),
+        (lambda name: name.startswith("iso27001_"), GCPISO27001),
+        (lambda name: name == "prowler_threatscore_gcp", ProwlerThreatScoreGCP),
+        (lambda name: name.startswith("ccc_"), CCC_GCP),
+    ],
+    "kubernetes": [
+        (lambda name: name.startswith("cis_"), KubernetesCIS),
+        (lambda name: name.startswith("iso27001_"), KubernetesISO27001),
+    ],
+    "m365": [
+        (lambda name: name.startswith("cis_"), M365CIS),
+        (lambda name: name == "prowler_threatscore_m365", ProwlerThreatScoreM365),
+        (lambda name: name.startswith("iso27001_"), M365ISO27001),
+    ],
+    "nhn": [
+        (lambda name: name.startswith("iso27001_"), NHNISO27001),
+    ],
+    "github": [
+        (lambda name: name.startswith("cis_"), GithubCIS),
+    ],
+    "oci": [
+        (lambda name: name.startswith("cis_"), OCICIS),
+    ],
+}
+
+
+def get_compliance_output_class(
+    provider: str,
+    compliance_name: str,
+    compliance_output_classes: dict = COMPLIANCE_OUTPUT_CLASSES,
+) -> type[ComplianceOutput]:
+    """
+    get_compliance_output_class returns the output class of the compliance framework for the given provider.
+
+    Args:
+        provider (str): The provider type, e.g. aws
+        compliance_name (str): The compliance framework name, e.g. cis_2.0_aws
+        compliance_output_classes (dict): The compliance output classes by provider, see COMPLIANCE_OUTPUT_CLASSES
+
+    Returns:
+        type[ComplianceOutput]: The compliance output class, GenericCompliance if the framework has no specific one
+
+    Example:
+        get_compliance_output_class("aws", "cis_2.0_aws") -> AWSCIS
+    """
+    for condition, compliance_output_class in compliance_output_classes.get(
+        provider, []
+    ):
+        if condition(compliance_name):
+            return compliance_output_class
+    return GenericCompliance
+
+
+class ComplianceFanOut:
+    """
+    ComplianceFanOut feeds the findings to the outputs of all the compliance frameworks in a single pass over the
+    findings, instead of every compliance output going through all the findings.
+
+    - Every finding is routed only to the frameworks with requirements that include its check, using a ComplianceIndex
+      of the frameworks. The frameworks of every check are looked up once.
+    - Every compliance output transforms only the findings routed to it.
+    - The rows of the manual requirements are added by the first transform of every output only, so the findings can
+      be transformed in batches.
+
+    Example:
+        compliance_fan_out = ComplianceFanOut("aws", {"cis_2.0_aws": Compliance, ...}, f"{output_directory}/compliance/{output_filename}")
+        compliance_fan_out.transform(findings)
+        for compliance_output in compliance_fan_out.outputs.values():
+            compliance_output.batch_write_data_to_file()
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        compliance_frameworks: dict,
+        file_path: str = None,
+        from_cli: bool = True,
+        compliance_output_classes: dict = COMPLIANCE_OUTPUT_CLASSES,
+    ) -> None:
+        """
+        Args:
+            provider (str): The provider type, e.g. aws
+            compliance_frameworks (dict): The compliance frameworks by name, e.g. {"cis_2.0_aws": Compliance}
+            file_path (str): The path of the outputs without the framework name, the output of every framework is
+                written to f"{file_path}_{framework name}.csv"
+            from_cli (bool): Whether the outputs are written once by the CLI or in batches
+            compliance_output_classes (dict): The compliance output classes by provider, see COMPLIANCE_OUTPUT_CLASSES
+        """
+        self._compliance_index = ComplianceIndex(compliance_frameworks)
+        # Check ID -> names of the frameworks with requirements that include the check
+        self._check_frameworks = {}
+        # Framework name -> compliance output
+        self.outputs = {}
+        # Framework name -> [compliance framework, compliance name], without the manual requirements once they are added
+        self._frameworks = {}
+        for framework_name, compliance in compliance_frameworks.items():
+            self.outputs[framework_name] = get_compliance_output_class(
+                provider, framework_name, compliance_output_classes
+            )(
+                findings=[],
+                compliance=compliance,
+                file_path=f"{file_path}_{framework_name}.csv" if file_path else None,
+                from_cli=from_cli,
+            )
+            self._frameworks[framework_name] = [
+                compliance,
+                (
+                    f"{compliance.Framework}-{compliance.Version}"
+                    if compliance.Version
+                    else compliance.Framework
+                ),
+            ]
+
+    def route(self, findings: list[Finding]) -> dict:
+        """
+        route returns the findings of every framework, walking the findings once
+
+        Args:
+            findings (list[Finding]): The findings
+
+        Returns:
+            dict: The findings routed to every framework by name, in the findings order
+        """
+        routed_findings = {framework_name: [] for framework_name in self.outputs}
+        for finding in findings:
+            check_id = finding.check_id
+            framework_names = self._check_frameworks.get(check_id)
+            if framework_names is None:
+                framework_names = [
+                    framework_name
+                    for framework_name in self._compliance_index.get_frameworks(
+                        check_id
+                    )
+                    if framework_name in routed_findings
+                ]
+                self._check_frameworks[check_id] = framework_names
+            for framework_name in framework_names:
+                routed_findings[framework_name].append(finding)
+        return routed_findings
+
+    def get_transform_args(self, findings: list[Finding]) -> list:
+        """
+        get_transform_args routes the findings and returns every compliance output with the arguments of its transform,
+        to transform the outputs separately, e.g. in a thread pool
+
+        Args:
+            findings (list[Finding]): The findings of the batch
+
+        Returns:
+            list: (compliance output, (findings, compliance, compliance name)) tuples, one per framework
+        """
+        routed_findings = self.route(findings)
+        transform_args = []
+        for framework_name, compliance_output in self.outputs.items():
+            compliance, compliance_name = self._frameworks[framework_name]
+            transform_args.append(
+                (
+                    compliance_output,
+                    (routed_findings[framework_name], compliance, compliance_name),
+                )
+            )
+            # The rows of the manual requirements are added by every transform, so only the first one adds them
+            if any(not requirement.Checks for requirement in compliance.Requirements):
+                self._frameworks[framework_name][0] = compliance.copy(
+                    update={
+                        "Requirements": [
+                            requirement
+                            for requirement in compliance.Requirements
+                            if requirement.Checks
+                        ]
+                    }
+                )
+        return transform_args
+
+    def transform(self, findings: list[Finding]) -> None:
+        """transform transforms the findings with every compliance output and creates their files"""
+        for compliance_output, transform_args in self.get_transform_args(findings):
+            compliance_output.transform(*transform_args)
+            if (
+                findings
+                and not compliance_output.file_descriptor
+                and compliance_output.file_path
+            ):
+                compliance_output.create_file_descriptor(compliance_output.file_path)
@@ -23,10 +23,13 @@ def get_ens_table(
         "Opcional": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    # Finding index -> number of findings
+    pass_findings = {}
+    fail_findings = {}
+    muted_findings = {}
     for index, finding in enumerate(findings):
+        # The check results of the streaming outputs stand for several findings
+        count = getattr(finding, "count", 1)
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
         for compliance in check_compliances:
@@ -45,29 +48,35 @@ def get_ens_table(
                                 "Muted": 0,
                             }
                         if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                marcos[marco_categoria]["Muted"] += 1
+                            if index not in muted_findings:
+                                muted_findings[index] = count
+                                marcos[marco_categoria]["Muted"] += count
                         else:
                             if finding.status == "FAIL":
                                 if (
                                     attribute.Tipo != "recomendacion"
-                                    and index not in fail_count
+                                    and index not in fail_findings
                                 ):
-                                    fail_count.append(index)
+                                    fail_findings[index] = count
                                     marcos[marco_categoria][
                                         "Estado"
                                     ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+                            elif (
+                                finding.status == "PASS" and index not in pass_findings
+                            ):
+                                pass_findings[index] = count
                         if attribute.Nivel == "opcional":
-                            marcos[marco_categoria]["Opcional"] += 1
+                            marcos[marco_categoria]["Opcional"] += count
                         elif attribute.Nivel == "alto":
-                            marcos[marco_categoria]["Alto"] += 1
+                            marcos[marco_categoria]["Alto"] += count
                         elif attribute.Nivel == "medio":
-                            marcos[marco_categoria]["Medio"] += 1
+                            marcos[marco_categoria]["Medio"] += count
                         elif attribute.Nivel == "bajo":
-                            marcos[marco_categoria]["Bajo"] += 1
+                            marcos[marco_categoria]["Bajo"] += count
+
+    pass_count = sum(pass_findings.values())
+    fail_count = sum(fail_findings.values())
+    muted_count = sum(muted_findings.values())
 
     # Add results to table
     for marco in sorted(marcos):
@@ -90,17 +99,17 @@ def get_ens_table(
             f"{orange_color}{marcos[marco]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nEstado de Cumplimiento de {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL}:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) NO CUMPLE{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) CUMPLE{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) NO CUMPLE{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) CUMPLE{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -12,10 +12,13 @@ def get_generic_compliance_table(
     output_directory: str,
     compliance_overview: bool,
 ):
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    # Finding index -> number of findings
+    pass_findings = {}
+    fail_findings = {}
+    muted_findings = {}
     for index, finding in enumerate(findings):
+        # The check results of the streaming outputs stand for several findings
+        count = getattr(finding, "count", 1)
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
         for compliance in check_compliances:
@@ -26,25 +29,30 @@ def get_generic_compliance_table(
                 and compliance.Provider.upper() in compliance_framework.upper()
             ):
                 if finding.muted:
-                    if index not in muted_count:
-                        muted_count.append(index)
+                    if index not in muted_findings:
+                        muted_findings[index] = count
                 else:
-                    if finding.status == "FAIL" and index not in fail_count:
-                        fail_count.append(index)
-                    elif finding.status == "PASS" and index not in pass_count:
-                        pass_count.append(index)
+                    if finding.status == "FAIL" and index not in fail_findings:
+                        fail_findings[index] = count
+                    elif finding.status == "PASS" and index not in pass_findings:
+                        pass_findings[index] = count
+
+    pass_count = sum(pass_findings.values())
+    fail_count = sum(fail_findings.values())
+    muted_count = sum(muted_findings.values())
+
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
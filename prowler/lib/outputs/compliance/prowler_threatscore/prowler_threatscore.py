@@ -20,9 +20,10 @@ def get_prowler_threatscore_table(
         "Score": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    # Finding index -> number of findings
+    pass_findings = {}
+    fail_findings = {}
+    muted_findings = {}
     pillars = {}
     generic_score = 0
     max_generic_score = 0
@@ -31,6 +32,8 @@ def get_prowler_threatscore_table(
     max_score_per_pillar = {}
     counted_findings_per_pillar = {}
     for index, finding in enumerate(findings):
+        # The check results of the streaming outputs stand for several findings
+        count = getattr(finding, "count", 1)
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
         for compliance in check_compliances:
@@ -56,10 +59,10 @@ def get_prowler_threatscore_table(
                         ):
                             if finding.status == "PASS":
                                 score_per_pillar[pillar] += (
-                                    attribute.LevelOfRisk * attribute.Weight
+                                    attribute.LevelOfRisk * attribute.Weight * count
                                 )
                             max_score_per_pillar[pillar] += (
-                                attribute.LevelOfRisk * attribute.Weight
+                                attribute.LevelOfRisk * attribute.Weight * count
                             )
                             counted_findings_per_pillar[pillar].append(index)
 
@@ -67,28 +70,34 @@ def get_prowler_threatscore_table(
                             pillars[pillar] = {"FAIL": 0, "PASS": 0, "Muted": 0}
 
                         if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                pillars[pillar]["Muted"] += 1
+                            if index not in muted_findings:
+                                muted_findings[index] = count
+                                pillars[pillar]["Muted"] += count
                         else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                                pillars[pillar]["FAIL"] += 1
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                                pillars[pillar]["PASS"] += 1
+                            if finding.status == "FAIL" and index not in fail_findings:
+                                fail_findings[index] = count
+                                pillars[pillar]["FAIL"] += count
+                            elif (
+                                finding.status == "PASS" and index not in pass_findings
+                            ):
+                                pass_findings[index] = count
+                                pillars[pillar]["PASS"] += count
 
                         # Generic score
                         if index not in counted_findings_generic and not finding.muted:
                             if finding.status == "PASS":
                                 generic_score += (
-                                    attribute.LevelOfRisk * attribute.Weight
+                                    attribute.LevelOfRisk * attribute.Weight * count
                                 )
                             max_generic_score += (
-                                attribute.LevelOfRisk * attribute.Weight
+                                attribute.LevelOfRisk * attribute.Weight * count
                             )
                             counted_findings_generic.append(index)
 
+    pass_count = sum(pass_findings.values())
+    fail_count = sum(fail_findings.values())
+    muted_count = sum(muted_findings.values())
+
     no_findings_pillars = []
     bulk_compliance = Compliance.get_bulk(provider=compliance.Provider.lower()).get(
         compliance_framework
@@ -129,22 +138,22 @@ def get_prowler_threatscore_table(
     pillar_table["Pillar"] = sorted(pillar_table["Pillar"])
 
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
         if not compliance_overview:
-            if len(fail_count) > 0 and len(pillar_table["Pillar"]) > 0:
+            if fail_count > 0 and len(pillar_table["Pillar"]) > 0:
                 print(
                     f"\nFramework {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Results:"
                 )
@@ -5,7 +5,7 @@ from typing import Optional, Union
 
 from pydantic.v1 import BaseModel, Field, ValidationError
 
-from prowler.config.config import prowler_version
+from prowler.config.config import prowler_version, timestamp
 from prowler.lib.check.models import (
     Check_Report,
     CheckMetadata,
@@ -14,10 +14,14 @@ from prowler.lib.check.models import (
     Remediation,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.common import Status, fill_common_finding_data
+from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.compliance.compliance import get_check_compliance
 from prowler.lib.outputs.utils import unroll_tags
-from prowler.lib.utils.utils import dict_to_lowercase, get_nested_attribute
+from prowler.lib.utils.utils import (
+    dict_to_lowercase,
+    get_nested_attribute,
+    outputs_unix_timestamp,
+)
 from prowler.providers.common.provider import Provider
 from prowler.providers.github.models import GithubAppIdentityInfo, GithubIdentityInfo
 
@@ -44,6 +48,7 @@ class Finding(BaseModel):
     status: Status
     status_extended: str
     muted: bool = False
+    muted_reason: Optional[str] = None
     resource_uid: str
     resource_metadata: dict = Field(default_factory=dict)
     resource_name: str
@@ -100,7 +105,11 @@ class Finding(BaseModel):
 
     @classmethod
     def generate_output(
-        cls, provider: Provider, check_output: Check_Report, output_options
+        cls,
+        provider: Provider,
+        check_output: Check_Report,
+        output_options,
+        context: "FindingContext" = None,
     ) -> "Finding":
         """Generates the output for a finding based on the provider and output options
 
@@ -108,240 +117,41 @@ class Finding(BaseModel):
             provider (Provider): the provider object
             check_output (Check_Report): the check output object
             output_options: the output options object, depending on the provider
+            context (FindingContext): the values of the run shared by all the findings, pass the same context to
+                convert the findings of a run faster
         Returns:
             finding_output (Finding): the finding output object
 
         """
-        # TODO: move fill_common_finding_data
-        unix_timestamp = False
-        if hasattr(output_options, "unix_timestamp"):
-            unix_timestamp = output_options.unix_timestamp
-
-        common_finding_data = fill_common_finding_data(check_output, unix_timestamp)
-        output_data = {}
-        output_data.update(common_finding_data)
-
-        try:
-            output_data["compliance"] = check_output.compliance
-        except AttributeError:
-            bulk_checks_metadata = {}
-            if hasattr(output_options, "bulk_checks_metadata"):
-                bulk_checks_metadata = output_options.bulk_checks_metadata
-
-            output_data["compliance"] = get_check_compliance(
-                check_output, provider.type, bulk_checks_metadata
-            )
+        if context is None:
+            context = FindingContext(provider, output_options)
+
+        output_data = {
+            "metadata": check_output.check_metadata,
+            "timestamp": context.timestamp,
+            "status": check_output.status,
+            "status_extended": check_output.status_extended,
+            "muted": check_output.muted,
+            "muted_reason": check_output.muted_reason,
+            "resource_details": check_output.resource_details,
+            "resource_tags": unroll_tags(check_output.resource_tags),
+            "compliance": context.get_compliance(check_output),
+        }
         try:
-            output_data["provider"] = provider.type
             output_data["resource_metadata"] = check_output.resource
-
-            if provider.type == "aws":
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.account"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_name"
-                )
-                output_data["account_email"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_email"
-                )
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_arn"
-                )
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_id"
-                )
-                output_data["account_tags"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_tags"
-                )
-                output_data["partition"] = get_nested_attribute(
-                    provider, "identity.partition"
-                )
-
-                # TODO: probably Organization UID is without the account id
-                output_data["auth_method"] = (
-                    f"profile: {get_nested_attribute(provider, 'identity.profile')}"
-                )
-                output_data["resource_name"] = check_output.resource_id
-                output_data["resource_uid"] = check_output.resource_arn
-                output_data["region"] = check_output.region
-
-            elif provider.type == "azure":
-                # TODO: we should show the authentication method used I think
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                # Get the first tenant domain ID, just in case
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_ids"
-                )[0]
-                output_data["account_uid"] = (
-                    output_data["account_organization_uid"]
-                    if "Tenant:" in check_output.subscription
-                    else provider.identity.subscriptions[check_output.subscription]
-                )
-                output_data["account_name"] = check_output.subscription
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-                # TODO: check the tenant_ids
-                # TODO: we have to get the account organization, the tenant is not that
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-
-                output_data["partition"] = get_nested_attribute(
-                    provider, "region_config.name"
-                )
-                # TODO: pending to get the subscription tags
-                # "account_tags": "organizations_metadata.account_details_tags",
-                # TODO: store subscription_name + id pairs
-                # "account_name": "organizations_metadata.account_details_name",
-                # "account_email": "organizations_metadata.account_details_email",
-
-            elif provider.type == "gcp":
-                output_data["auth_method"] = (
-                    f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
-                )
-                output_data["account_uid"] = provider.projects[
-                    check_output.project_id
-                ].id
-                output_data["account_name"] = provider.projects[
-                    check_output.project_id
-                ].name
-                # There is no concept as project email in GCP
-                # "account_email": "organizations_metadata.account_details_email",
-                output_data["account_tags"] = provider.projects[
-                    check_output.project_id
-                ].labels
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-
-                if (
-                    provider.projects
-                    and check_output.project_id in provider.projects
-                    and getattr(
-                        provider.projects[check_output.project_id], "organization"
-                    )
-                ):
-                    output_data["account_organization_uid"] = provider.projects[
-                        check_output.project_id
-                    ].organization.id
-                    # TODO: for now is None since we don't retrieve that data
-                    output_data["account_organization_name"] = provider.projects[
-                        check_output.project_id
-                    ].organization.display_name
-
-            elif provider.type == "kubernetes":
-                if provider.identity.context == "In-Cluster":
-                    output_data["auth_method"] = "in-cluster"
-                else:
-                    output_data["auth_method"] = "kubeconfig"
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["account_name"] = f"context: {provider.identity.context}"
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.cluster"
-                )
-                output_data["region"] = f"namespace: {check_output.namespace}"
-
-            elif provider.type == "github":
-                output_data["auth_method"] = provider.auth_method
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-
-                if isinstance(provider.identity, GithubIdentityInfo):
-                    # GithubIdentityInfo (Personal Access Token, OAuth)
-                    output_data["account_name"] = provider.identity.account_name
-                    output_data["account_uid"] = provider.identity.account_id
-                    output_data["account_email"] = provider.identity.account_email
-                elif isinstance(provider.identity, GithubAppIdentityInfo):
-                    # GithubAppIdentityInfo (GitHub App)
-                    output_data["account_name"] = provider.identity.app_name
-                    output_data["account_uid"] = provider.identity.app_id
-                    output_data["installations"] = provider.identity.installations
-
-                output_data["region"] = check_output.owner
-
-            elif provider.type == "m365":
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-
-            elif provider.type == "mongodbatlas":
-                output_data["auth_method"] = "api_key"
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.organization_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.organization_name"
-                )
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-
-            elif provider.type == "nhn":
-                output_data["auth_method"] = (
-                    f"passwordCredentials: username={get_nested_attribute(provider, '_identity.username')}, "
-                    f"tenantId={get_nested_attribute(provider, '_identity.tenant_id')}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-
-            elif provider.type == "iac":
-                output_data["auth_method"] = provider.auth_method
-                output_data["account_uid"] = "iac"
-                output_data["account_name"] = "iac"
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_name
-                output_data["region"] = check_output.resource_line_range
-                output_data["resource_line_range"] = check_output.resource_line_range
-                output_data["framework"] = check_output.check_metadata.ServiceName
-
-            elif provider.type == "llm":
-                output_data["auth_method"] = provider.auth_method
-                output_data["account_uid"] = "llm"
-                output_data["account_name"] = "llm"
-                output_data["resource_name"] = check_output.model
-                output_data["resource_uid"] = check_output.model
-                output_data["region"] = check_output.model
-
-            elif provider.type == "oci":
-                output_data["auth_method"] = (
-                    f"Profile: {get_nested_attribute(provider, 'session.profile')}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenancy_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenancy_name"
-                )
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.region
+            account_data, account_data_valid = context.get_account_data(check_output)
+            output_data.update(account_data)
+            (
+                output_data["resource_name"],
+                output_data["resource_uid"],
+                output_data["region"],
+            ) = context.get_resource_data(check_output)
 
             # check_output Unique ID
             # TODO: move this to a function
             # TODO: in Azure, GCP and K8s there are findings without resource_name
             output_data["uid"] = (
-                f"prowler-{provider.type}-{check_output.check_metadata.CheckID}-{output_data['account_uid']}-"
+                f"prowler-{context.provider_type}-{check_output.check_metadata.CheckID}-{output_data['account_uid']}-"
                 f"{output_data['region']}-{output_data['resource_name']}"
             )
 
@@ -354,6 +164,20 @@ class Finding(BaseModel):
                     f"Check {check_output.check_metadata.CheckID} has no resource_name."
                 )
 
+            # The values of the run were validated once by the context, if the values of the finding already
+            # have their types the validation is skipped
+            if (
+                account_data_valid
+                and context.timestamp_valid
+                and output_data["status"] in Status._value2member_map_
+            ):
+                output_data["status"] = Status(output_data["status"])
+                if all(
+                    type(output_data[field]) is field_type
+                    for field, field_type in FINDING_FIELD_TYPES.items()
+                ) and isinstance(output_data["muted_reason"], (str, type(None))):
+                    return cls.construct(**output_data)
+
             return cls(**output_data)
         except ValidationError as validation_error:
             logger.error(
@@ -367,7 +191,9 @@ class Finding(BaseModel):
             raise error
 
     @classmethod
-    def transform_api_finding(cls, finding, provider) -> "Finding":
+    def transform_api_finding(
+        cls, finding, provider, context: "FindingContext" = None
+    ) -> "Finding":
         """
         Transform a FindingModel instance into an API-friendly Finding object.
 
@@ -381,6 +207,7 @@ class Finding(BaseModel):
         Args:
             finding (API Finding): An API Finding instance containing data from the database.
             provider (Provider): the provider object.
+            context (FindingContext): the values of the provider shared by all the findings, see generate_output.
 
         Returns:
             Finding: A new Finding instance populated with data from the provided model.
@@ -448,7 +275,9 @@ class Finding(BaseModel):
             [{"key": tag.key, "value": tag.value} for tag in resource.tags.all()]
         )
 
-        return cls.generate_output(provider, finding, SimpleNamespace())
+        return cls.generate_output(
+            provider, finding, SimpleNamespace(), context=context
+        )
 
     def _transform_findings_stats(scan_summaries: list[dict]) -> dict:
         """
@@ -555,3 +384,334 @@ class Finding(BaseModel):
             "all_fails_are_muted": all_fails_are_muted,
         }
         return stats
+
+
+# The types of the values of every finding, the findings with other types are validated by the model
+FINDING_FIELD_TYPES = {
+    "metadata": CheckMetadata,
+    "status_extended": str,
+    "muted": bool,
+    "resource_details": str,
+    "resource_tags": dict,
+    "compliance": dict,
+    "resource_metadata": dict,
+    "resource_name": str,
+    "resource_uid": str,
+    "region": str,
+    "uid": str,
+}
+
+
+class FindingContext:
+    """
+    FindingContext holds the values of the findings that are the same during a run, the authentication method,
+    account, organization, partition and timestamp of the provider and the compliance of every check, so they are
+    computed once and not for every finding.
+
+    The values are computed when they are first needed, once per account for the providers with several accounts
+    in the same run (the Azure subscriptions and the GCP projects).
+
+    Example:
+        context = FindingContext(provider, output_options)
+        for check_output in check_outputs:
+            Finding.generate_output(provider, check_output, output_options, context=context)
+    """
+
+    def __init__(self, provider: Provider, output_options=None) -> None:
+        """
+        Args:
+            provider (Provider): the provider object
+            output_options: the output options object, depending on the provider, the defaults are used if not set
+        """
+        self.provider = provider
+        self.provider_type = provider.type
+        unix_timestamp = getattr(output_options, "unix_timestamp", False)
+        self.timestamp = outputs_unix_timestamp(unix_timestamp, timestamp)
+        validated_timestamp, errors = Finding.__fields__["timestamp"].validate(
+            self.timestamp, {}, loc="timestamp", cls=Finding
+        )
+        self.timestamp_valid = not errors
+        if self.timestamp_valid:
+            self.timestamp = validated_timestamp
+        self.bulk_checks_metadata = getattr(output_options, "bulk_checks_metadata", {})
+        # Check ID -> compliance of the check
+        self._compliance = {}
+        # Account key -> (account data, if the account data is valid)
+        self._account_data = {}
+
+        self._account_key = ACCOUNT_KEYS.get(self.provider_type, lambda _: None)
+
+    def get_compliance(self, check_output: Check_Report) -> dict:
+        """get_compliance returns the compliance of the finding, computed once per check"""
+        try:
+            return check_output.compliance
+        except AttributeError:
+            check_id = check_output.check_metadata.CheckID
+            if check_id not in self._compliance:
+                self._compliance[check_id] = get_check_compliance(
+                    check_output, self.provider_type, self.bulk_checks_metadata
+                )
+            return dict(self._compliance[check_id])
+
+    def get_resource_data(self, check_output: Check_Report) -> tuple[str, str, str]:
+        """get_resource_data returns the resource_name, resource_uid and region of the finding"""
+        return RESOURCE_DATA[self.provider_type](check_output)
+
+    def get_account_data(self, check_output: Check_Report) -> tuple[dict, bool]:
+        """
+        get_account_data returns the account data of the finding and if it is valid for the Finding model
+
+        Returns:
+            tuple[dict, bool]: The account data, e.g. {"auth_method": ..., "account_uid": ...}, and if it is valid
+        """
+        account_key = self._account_key(check_output)
+        if account_key not in self._account_data:
+            # Validate the account data once with the Finding model fields
+            account_data = self._load_account_data(account_key)
+            validated_account_data = {}
+            for field, value in account_data.items():
+                validated_account_data[field], errors = Finding.__fields__[
+                    field
+                ].validate(value, {}, loc=field, cls=Finding)
+                if errors:
+                    # The findings of the account are validated by the model
+                    self._account_data[account_key] = (account_data, False)
+                    break
+            else:
+                self._account_data[account_key] = (validated_account_data, True)
+        account_data, account_data_valid = self._account_data[account_key]
+        # Every finding gets its own dicts
+        return {
+            field: dict(value) if type(value) is dict else value
+            for field, value in account_data.items()
+        }, account_data_valid
+
+    def _load_account_data(self, account_key) -> dict:
+        provider = self.provider
+        account_data = {}
+        if self.provider_type == "aws":
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.account"
+            )
+            account_data["account_name"] = get_nested_attribute(
+                provider, "organizations_metadata.account_name"
+            )
+            account_data["account_email"] = get_nested_attribute(
+                provider, "organizations_metadata.account_email"
+            )
+            account_data["account_organization_uid"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_arn"
+            )
+            account_data["account_organization_name"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_id"
+            )
+            account_data["account_tags"] = get_nested_attribute(
+                provider, "organizations_metadata.account_tags"
+            )
+            account_data["partition"] = get_nested_attribute(
+                provider, "identity.partition"
+            )
+
+            # TODO: probably Organization UID is without the account id
+            account_data["auth_method"] = (
+                f"profile: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+
+        elif self.provider_type == "azure":
+            # The account key is the subscription
+            # TODO: we should show the authentication method used I think
+            account_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            # Get the first tenant domain ID, just in case
+            account_data["account_organization_uid"] = get_nested_attribute(
+                provider, "identity.tenant_ids"
+            )[0]
+            account_data["account_uid"] = (
+                account_data["account_organization_uid"]
+                if "Tenant:" in account_key
+                else provider.identity.subscriptions[account_key]
+            )
+            account_data["account_name"] = account_key
+            # TODO: check the tenant_ids
+            # TODO: we have to get the account organization, the tenant is not that
+            account_data["account_organization_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+            account_data["partition"] = get_nested_attribute(
+                provider, "region_config.name"
+            )
+            # TODO: pending to get the subscription tags
+            # "account_tags": "organizations_metadata.account_details_tags",
+            # TODO: store subscription_name + id pairs
+            # "account_name": "organizations_metadata.account_details_name",
+            # "account_email": "organizations_metadata.account_details_email",
+
+        elif self.provider_type == "gcp":
+            # The account key is the project ID
+            account_data["auth_method"] = (
+                f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+            account_data["account_uid"] = provider.projects[account_key].id
+            account_data["account_name"] = provider.projects[account_key].name
+            # There is no concept as project email in GCP
+            # "account_email": "organizations_metadata.account_details_email",
+            account_data["account_tags"] = provider.projects[account_key].labels
+
+            if (
+                provider.projects
+                and account_key in provider.projects
+                and getattr(provider.projects[account_key], "organization")
+            ):
+                account_data["account_organization_uid"] = provider.projects[
+                    account_key
+                ].organization.id
+                # TODO: for now is None since we don't retrieve that data
+                account_data["account_organization_name"] = provider.projects[
+                    account_key
+                ].organization.display_name
+
+        elif self.provider_type == "kubernetes":
+            if provider.identity.context == "In-Cluster":
+                account_data["auth_method"] = "in-cluster"
+            else:
+                account_data["auth_method"] = "kubeconfig"
+            account_data["account_name"] = f"context: {provider.identity.context}"
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.cluster"
+            )
+
+        elif self.provider_type == "github":
+            account_data["auth_method"] = provider.auth_method
+
+            if isinstance(provider.identity, GithubIdentityInfo):
+                # GithubIdentityInfo (Personal Access Token, OAuth)
+                account_data["account_name"] = provider.identity.account_name
+                account_data["account_uid"] = provider.identity.account_id
+                account_data["account_email"] = provider.identity.account_email
+            elif isinstance(provider.identity, GithubAppIdentityInfo):
+                # GithubAppIdentityInfo (GitHub App)
+                account_data["account_name"] = provider.identity.app_name
+                account_data["account_uid"] = provider.identity.app_id
+
+        elif self.provider_type == "m365":
+            account_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenant_id"
+            )
+            account_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+        elif self.provider_type == "mongodbatlas":
+            account_data["auth_method"] = "api_key"
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.organization_id"
+            )
+            account_data["account_name"] = get_nested_attribute(
+                provider, "identity.organization_name"
+            )
+
+        elif self.provider_type == "nhn":
+            account_data["auth_method"] = (
+                f"passwordCredentials: username={get_nested_attribute(provider, '_identity.username')}, "
+                f"tenantId={get_nested_attribute(provider, '_identity.tenant_id')}"
+            )
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenant_id"
+            )
+            account_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+        elif self.provider_type == "iac":
+            account_data["auth_method"] = provider.auth_method
+            account_data["account_uid"] = "iac"
+            account_data["account_name"] = "iac"
+
+        elif self.provider_type == "llm":
+            account_data["auth_method"] = provider.auth_method
+            account_data["account_uid"] = "llm"
+            account_data["account_name"] = "llm"
+
+        elif self.provider_type == "oci":
+            account_data["auth_method"] = (
+                f"Profile: {get_nested_attribute(provider, 'session.profile')}"
+            )
+            account_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenancy_id"
+            )
+            account_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenancy_name"
+            )
+
+        return account_data
+
+
+# Provider -> the finding attribute with the account of the finding, for the providers with several accounts
+ACCOUNT_KEYS = {
+    "azure": lambda check_output: check_output.subscription,
+    "gcp": lambda check_output: check_output.project_id,
+}
+
+# Provider -> (resource_name, resource_uid, region) of the finding
+RESOURCE_DATA = {
+    "aws": lambda check_output: (
+        check_output.resource_id,
+        check_output.resource_arn,
+        check_output.region,
+    ),
+    "azure": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.location,
+    ),
+    "gcp": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.location,
+    ),
+    "kubernetes": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        f"namespace: {check_output.namespace}",
+    ),
+    "github": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.owner,
+    ),
+    "m365": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.location,
+    ),
+    "mongodbatlas": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.location,
+    ),
+    "nhn": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.location,
+    ),
+    "iac": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_name,
+        check_output.resource_line_range,
+    ),
+    "llm": lambda check_output: (
+        check_output.model,
+        check_output.model,
+        check_output.model,
+    ),
+    "oci": lambda check_output: (
+        check_output.resource_name,
+        check_output.resource_id,
+        check_output.region,
+    ),
+}
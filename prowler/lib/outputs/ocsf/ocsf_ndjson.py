@@ -0,0 +1,74 @@
+import gzip
+
+import orjson
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+
+
+class OCSFNDJSON(OCSF):
+    """
+    OCSFNDJSON writes the OCSF Detection Findings as newline delimited JSON, one event per line.
+
+    - The file can be appended to and split by lines, so it can be read in parallel (e.g. by Spark or Vector).
+    - The events are converted to dicts and serialized with orjson instead of the pydantic JSON encoder.
+    - The file is compressed with gzip or zstd when its path ends with `.gz` or `.zst`, as a stream kept open
+      between batches and finished when the file is closed.
+    """
+
+    def create_file_descriptor(self, file_path: str) -> None:
+        """
+        Creates a file descriptor and its compression stream for writing data to a file.
+
+        Parameters:
+            file_path (str): The path to the file where the data will be written, ending with .gz or .zst to compress it.
+
+        Note:
+            The file is opened in binary append mode ("ab"), the gzip members and the zstd frames of appended writes are
+            read as a single stream.
+        """
+        try:
+            self._file_descriptor = open(file_path, "ab")
+            if file_path.endswith(".gz"):
+                self._stream = gzip.GzipFile(fileobj=self._file_descriptor, mode="ab")
+            elif file_path.endswith(".zst"):
+                # zstandard is an optional dependency, only imported with the zstd compression
+                import zstandard
+
+                self._stream = zstandard.ZstdCompressor().stream_writer(
+                    self._file_descriptor, closefd=False
+                )
+            else:
+                self._stream = self._file_descriptor
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings to a file using the OCSF format, one finding per line, using the `Output._file_descriptor`."""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+                and self._data
+            ):
+                stream = getattr(self, "_stream", self._file_descriptor)
+                lines = []
+                for finding in self._data:
+                    try:
+                        lines.append(orjson.dumps(finding.dict(exclude_none=True)))
+                    except Exception as error:
+                        logger.error(
+                            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                if lines:
+                    stream.write(b"\n".join(lines) + b"\n")
+                if self.close_file or self._from_cli:
+                    if stream is not self._file_descriptor:
+                        stream.close()
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
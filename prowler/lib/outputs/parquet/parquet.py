@@ -0,0 +1,220 @@
+from datetime import datetime
+from typing import List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.output import Output
+
+# The repeated values are dictionary encoded, so every value is stored once per row group
+DICTIONARY_STRING = pa.dictionary(pa.int32(), pa.string())
+STRING_LIST = pa.list_(pa.string())
+TAGS = pa.map_(pa.string(), pa.string())
+
+PARQUET_SCHEMA = pa.schema(
+    [
+        ("auth_method", DICTIONARY_STRING),
+        ("timestamp", pa.timestamp("us")),
+        ("account_uid", DICTIONARY_STRING),
+        ("account_name", DICTIONARY_STRING),
+        ("account_email", DICTIONARY_STRING),
+        ("account_organization_uid", DICTIONARY_STRING),
+        ("account_organization_name", DICTIONARY_STRING),
+        ("account_tags", TAGS),
+        ("finding_uid", pa.string()),
+        ("provider", DICTIONARY_STRING),
+        ("check_id", DICTIONARY_STRING),
+        ("check_title", DICTIONARY_STRING),
+        ("check_type", STRING_LIST),
+        ("status", DICTIONARY_STRING),
+        ("status_extended", pa.string()),
+        ("muted", pa.bool_()),
+        ("service_name", DICTIONARY_STRING),
+        ("subservice_name", DICTIONARY_STRING),
+        ("severity", DICTIONARY_STRING),
+        ("resource_type", DICTIONARY_STRING),
+        ("resource_uid", pa.string()),
+        ("resource_name", pa.string()),
+        ("resource_details", pa.string()),
+        ("resource_tags", TAGS),
+        ("partition", DICTIONARY_STRING),
+        ("region", DICTIONARY_STRING),
+        ("description", DICTIONARY_STRING),
+        ("risk", DICTIONARY_STRING),
+        ("related_url", DICTIONARY_STRING),
+        ("remediation_recommendation_text", DICTIONARY_STRING),
+        ("remediation_recommendation_url", DICTIONARY_STRING),
+        ("remediation_code_nativeiac", DICTIONARY_STRING),
+        ("remediation_code_terraform", DICTIONARY_STRING),
+        ("remediation_code_cli", DICTIONARY_STRING),
+        ("remediation_code_other", DICTIONARY_STRING),
+        ("compliance", pa.map_(pa.string(), STRING_LIST)),
+        ("categories", STRING_LIST),
+        ("depends_on", STRING_LIST),
+        ("related_to", STRING_LIST),
+        ("notes", DICTIONARY_STRING),
+        ("prowler_version", DICTIONARY_STRING),
+        ("additional_urls", STRING_LIST),
+    ]
+)
+
+
+class Parquet(Output):
+    """
+    Parquet writes the findings to an Apache Parquet file with typed columns.
+
+    - The values repeated across the findings (account, check, service, severity, region, ...) are dictionary encoded.
+    - The compliance and the tags are map columns, the lists of the check metadata are list columns.
+    - Every call to `batch_write_data_to_file` writes its findings as a new row group, so the findings can be written
+      in batches.
+    """
+
+    def __init__(
+        self,
+        findings: List[Finding],
+        file_path: str = None,
+        file_extension: str = "",
+        from_cli: bool = True,
+    ) -> None:
+        self._writer = None
+        super().__init__(findings, file_path, file_extension, from_cli)
+
+    def transform(self, findings: List[Finding]) -> None:
+        """Transforms the findings into the rows of the Parquet file.
+
+        Args:
+            findings (list[Finding]): a list of Finding objects
+
+        """
+        try:
+            for finding in findings:
+                timestamp = finding.timestamp
+                if isinstance(timestamp, int):
+                    timestamp = datetime.fromtimestamp(timestamp)
+                finding_dict = {}
+                finding_dict["auth_method"] = finding.auth_method
+                finding_dict["timestamp"] = timestamp
+                finding_dict["account_uid"] = finding.account_uid
+                finding_dict["account_name"] = finding.account_name
+                finding_dict["account_email"] = finding.account_email
+                finding_dict["account_organization_uid"] = (
+                    finding.account_organization_uid
+                )
+                finding_dict["account_organization_name"] = (
+                    finding.account_organization_name
+                )
+                finding_dict["account_tags"] = self._get_tags(finding.account_tags)
+                finding_dict["finding_uid"] = finding.uid
+                finding_dict["provider"] = finding.metadata.Provider
+                finding_dict["check_id"] = finding.metadata.CheckID
+                finding_dict["check_title"] = finding.metadata.CheckTitle
+                finding_dict["check_type"] = finding.metadata.CheckType
+                finding_dict["status"] = finding.status.value
+                finding_dict["status_extended"] = finding.status_extended
+                finding_dict["muted"] = finding.muted
+                finding_dict["service_name"] = finding.metadata.ServiceName
+                finding_dict["subservice_name"] = finding.metadata.SubServiceName
+                finding_dict["severity"] = finding.metadata.Severity.value
+                finding_dict["resource_type"] = finding.metadata.ResourceType
+                finding_dict["resource_uid"] = finding.resource_uid
+                finding_dict["resource_name"] = finding.resource_name
+                finding_dict["resource_details"] = finding.resource_details
+                finding_dict["resource_tags"] = self._get_tags(finding.resource_tags)
+                finding_dict["partition"] = finding.partition
+                finding_dict["region"] = finding.region
+                finding_dict["description"] = finding.metadata.Description
+                finding_dict["risk"] = finding.metadata.Risk
+                finding_dict["related_url"] = finding.metadata.RelatedUrl
+                finding_dict["remediation_recommendation_text"] = (
+                    finding.metadata.Remediation.Recommendation.Text
+                )
+                finding_dict["remediation_recommendation_url"] = (
+                    finding.metadata.Remediation.Recommendation.Url
+                )
+                finding_dict["remediation_code_nativeiac"] = (
+                    finding.metadata.Remediation.Code.NativeIaC
+                )
+                finding_dict["remediation_code_terraform"] = (
+                    finding.metadata.Remediation.Code.Terraform
+                )
+                finding_dict["remediation_code_cli"] = (
+                    finding.metadata.Remediation.Code.CLI
+                )
+                finding_dict["remediation_code_other"] = (
+                    finding.metadata.Remediation.Code.Other
+                )
+                finding_dict["compliance"] = {
+                    framework: (
+                        [str(requirement) for requirement in requirements]
+                        if isinstance(requirements, list)
+                        else [str(requirements)]
+                    )
+                    for framework, requirements in finding.compliance.items()
+                }
+                finding_dict["categories"] = finding.metadata.Categories
+                finding_dict["depends_on"] = finding.metadata.DependsOn
+                finding_dict["related_to"] = finding.metadata.RelatedTo
+                finding_dict["notes"] = finding.metadata.Notes
+                finding_dict["prowler_version"] = finding.prowler_version
+                finding_dict["additional_urls"] = finding.metadata.AdditionalURLs
+                self._data.append(finding_dict)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @staticmethod
+    def _get_tags(tags: dict) -> dict:
+        """Returns the tags with string values, the tags of some providers have lists or numbers as values"""
+        return {
+            str(key): value if isinstance(value, str) else str(value)
+            for key, value in (tags or {}).items()
+        }
+
+    def create_file_descriptor(self, file_path: str) -> None:
+        """
+        Creates a file descriptor for writing data to a file.
+
+        Parameters:
+            file_path (str): The path to the file where the data will be written.
+
+        Note:
+            The file is opened in binary write mode ("wb") since a Parquet file is written with its footer and can not
+            be appended to.
+        """
+        try:
+            self._file_descriptor = open(file_path, "wb")
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings as a row group of the Parquet file using the `Output._file_descriptor`.
+
+        The Parquet writer is created with the first batch and closed, writing the footer of the file, with the last one.
+        """
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
+                if self._writer is None and (
+                    self._data or self.close_file or self._from_cli
+                ):
+                    self._writer = pq.ParquetWriter(
+                        self._file_descriptor, PARQUET_SCHEMA, compression="zstd"
+                    )
+                if self._data:
+                    self._writer.write_table(
+                        pa.Table.from_pylist(self._data, schema=PARQUET_SCHEMA)
+                    )
+                if self.close_file or self._from_cli:
+                    self._writer.close()
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
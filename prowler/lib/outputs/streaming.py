@@ -0,0 +1,255 @@
+from collections import Counter
+from importlib import import_module
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Any, NamedTuple
+
+from prowler.config.config import (
+    csv_file_suffix,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+    json_ocsf_ndjson_file_suffix,
+    ndjson_compression_file_suffixes,
+    parquet_file_suffix,
+)
+from prowler.lib.check.models import Check_Report, CheckMetadata
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.compliance_writers import ComplianceFanOut
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding, FindingContext
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.ocsf.ocsf_ndjson import OCSFNDJSON
+from prowler.lib.outputs.output import Output
+from prowler.lib.outputs.outputs import FindingsStatistics
+
+# Output format -> (output class, file suffix) of the outputs written in batches
+STREAMING_OUTPUT_FORMATS = {
+    "csv": (CSV, csv_file_suffix),
+    "json-asff": (ASFF, json_asff_file_suffix),
+    "json-ocsf": (OCSF, json_ocsf_file_suffix),
+    "json-ocsf-ndjson": (OCSFNDJSON, json_ocsf_ndjson_file_suffix),
+    # The module of the output is imported when it is requested, since it needs an optional dependency
+    "parquet": ("prowler.lib.outputs.parquet.parquet.Parquet", parquet_file_suffix),
+}
+
+
+class CheckResult(NamedTuple):
+    """The fields of a check report used by the summary and compliance tables, with the number of findings it stands for"""
+
+    check_metadata: CheckMetadata
+    status: str
+    muted: bool
+    count: int = 1
+
+
+class StreamingOutputs:
+    """
+    StreamingOutputs writes the findings of every check to all the outputs as soon as the check finishes, so the
+    findings of the scan are never kept in memory.
+
+    - Every output keeps its last transformed batch until a new one arrives, so the last batch of the scan is written
+      with `close_file` set and the output is closed with its footer.
+    - The HTML header shows the statistics of the whole scan, so its rows are written to a temporary file and the
+      report is built when the scan ends.
+    - The statistics, the summary table and the compliance tables are computed from running counters.
+
+    Example:
+        streaming_outputs = StreamingOutputs(provider, output_options, ["csv", "html"], compliance_frameworks)
+        execute_checks(..., on_check_findings=streaming_outputs.add_check_findings)
+        generated_outputs = streaming_outputs.close()
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        output_options: Any,
+        output_formats: list,
+        compliance_frameworks: dict,
+        keep_asff_findings: bool = False,
+    ) -> None:
+        """
+        Args:
+            provider (Any): The provider of the scan
+            output_options (Any): The output options of the provider
+            output_formats (list): The output formats to write, e.g. ["csv", "json-ocsf", "html"]
+            compliance_frameworks (dict): The compliance frameworks to write by name, e.g. {"cis_2.0_aws": Compliance}
+            keep_asff_findings (bool): Keep the ASFF findings written, to be sent to AWS Security Hub. They are kept in
+                memory until the scan ends, so the memory usage is not constant with it.
+        """
+        self._provider = provider
+        self._output_options = output_options
+        self._finding_context = FindingContext(provider, output_options)
+        self._keep_asff_findings = keep_asff_findings
+        self.asff_findings = []
+        self.statistics = FindingsStatistics()
+        self._check_results = Counter()
+        self._checks_metadata = {}
+
+        filename = f"{output_options.output_directory}/{output_options.output_filename}"
+        self._outputs = []
+        for output_format in output_formats:
+            if output_format in STREAMING_OUTPUT_FORMATS:
+                output_class, suffix = STREAMING_OUTPUT_FORMATS[output_format]
+                if isinstance(output_class, str):
+                    module_path, class_name = output_class.rsplit(".", 1)
+                    output_class = getattr(import_module(module_path), class_name)
+                if output_class is OCSFNDJSON:
+                    suffix += ndjson_compression_file_suffixes.get(
+                        getattr(output_options, "ndjson_compression", None), ""
+                    )
+                self._outputs.append(
+                    output_class(
+                        findings=[], file_path=f"{filename}{suffix}", from_cli=False
+                    )
+                )
+        self._compliance_fan_out = ComplianceFanOut(
+            provider.type,
+            compliance_frameworks,
+            file_path=f"{output_options.output_directory}/compliance/{output_options.output_filename}",
+            from_cli=False,
+        )
+
+        self._html = None
+        self._html_rows = None
+        if "html" in output_formats:
+            self._html = HTML(
+                findings=[], file_path=f"{filename}{html_file_suffix}", from_cli=False
+            )
+            self._html_rows = TemporaryFile(mode="w+", encoding="utf-8")
+
+    def add_check_findings(self, check_findings: list[Check_Report]) -> None:
+        """add_check_findings converts the findings of a check and writes them to all the outputs"""
+        findings = []
+        for check_finding in check_findings:
+            check_id = check_finding.check_metadata.CheckID
+            self._checks_metadata.setdefault(check_id, check_finding.check_metadata)
+            self._check_results[
+                (check_id, check_finding.status, check_finding.muted)
+            ] += 1
+            try:
+                finding = Finding.generate_output(
+                    self._provider,
+                    check_finding,
+                    self._output_options,
+                    context=self._finding_context,
+                )
+            except Exception:
+                continue
+            self.statistics.add(finding)
+            findings.append(finding)
+        if not findings:
+            return
+
+        for output in self._outputs:
+            self._write_batch(output, (findings,))
+        # The findings are routed to the compliance frameworks of their checks in a single pass
+        for output, transform_args in self._compliance_fan_out.get_transform_args(
+            findings
+        ):
+            self._write_batch(output, transform_args)
+        if self._html:
+            self._html.transform(findings)
+            self._html_rows.writelines(self._html.data)
+            self._html.data.clear()
+
+    def _write_batch(self, output: Output, transform_args: tuple) -> None:
+        # Transform the new batch and write the previous one, which is not the last
+        pending = output.data
+        try:
+            output._data = []
+            output.transform(*transform_args)
+        except Exception as error:
+            # The new batch is dropped but the previous one is still written
+            output._data = pending
+            logger.error(
+                f"{output.file_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return
+        try:
+            if not output.data:
+                output._data = pending
+                return
+            if pending:
+                batch = output.data
+                output._data = pending
+                self._write_data(output)
+                output._data = batch
+        except Exception as error:
+            logger.error(
+                f"{output.file_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _write_data(self, output: Output) -> None:
+        if not output.file_descriptor:
+            output.create_file_descriptor(output.file_path)
+        output.batch_write_data_to_file()
+        if self._keep_asff_findings and isinstance(output, ASFF):
+            self.asff_findings.extend(output.data)
+
+    def close(self) -> dict:
+        """
+        close writes the last batch of every output, builds the HTML report and closes all the files
+
+        Returns:
+            dict: The outputs with a file, {"regular": [Output], "compliance": [ComplianceOutput]}
+        """
+        generated_outputs = {"regular": [], "compliance": []}
+        for output_type, outputs in (
+            ("regular", self._outputs),
+            ("compliance", list(self._compliance_fan_out.outputs.values())),
+        ):
+            for output in outputs:
+                try:
+                    if output.data:
+                        output.close_file = True
+                        self._write_data(output)
+                        output._data = []
+                    if output.file_descriptor and not output.file_descriptor.closed:
+                        output.file_descriptor.close()
+                except Exception as error:
+                    logger.error(
+                        f"{output.file_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                if output.file_descriptor:
+                    generated_outputs[output_type].append(output)
+
+        if self._html:
+            try:
+                if self._html_rows.tell() > 0:
+                    self._html.create_file_descriptor(self._html.file_path)
+                    HTML.write_header(
+                        self._html.file_descriptor,
+                        self._provider,
+                        self.statistics.stats,
+                    )
+                    self._html_rows.seek(0)
+                    copyfileobj(self._html_rows, self._html.file_descriptor)
+                    HTML.write_footer(self._html.file_descriptor)
+                    self._html.file_descriptor.close()
+                    generated_outputs["regular"].append(self._html)
+            except Exception as error:
+                logger.error(
+                    f"{self._html.file_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            finally:
+                self._html_rows.close()
+        return generated_outputs
+
+    @property
+    def stats(self) -> dict:
+        """stats returns the statistics of the findings written, see extract_findings_statistics"""
+        return self.statistics.stats
+
+    @property
+    def check_results(self) -> list[CheckResult]:
+        """
+        check_results returns a CheckResult per check, status and muted value of the findings written, with the
+        number of findings as its count, for the summary and compliance tables.
+        """
+        return [
+            CheckResult(self._checks_metadata[check_id], status, muted, count)
+            for (check_id, status, muted), count in self._check_results.items()
+        ]
@@ -98,7 +98,7 @@ def display_summary_table(
                 "Low": [],
                 "Muted": [],
             }
-            pass_count = fail_count = muted_count = 0
+            pass_count = fail_count = muted_count = total_count = 0
             # Sort findings by ServiceName
             findings.sort(key=lambda x: x.check_metadata.ServiceName)
             for finding in findings:
@@ -116,23 +116,26 @@ def display_summary_table(
                 current["Service"] = finding.check_metadata.ServiceName
                 current["Provider"] = finding.check_metadata.Provider
 
-                current["Total"] += 1
+                # The check results of the streaming outputs stand for several findings
+                count = getattr(finding, "count", 1)
+                total_count += count
+                current["Total"] += count
                 if finding.muted:
-                    muted_count += 1
-                    current["Muted"] += 1
+                    muted_count += count
+                    current["Muted"] += count
                 if finding.status == "PASS":
-                    pass_count += 1
-                    current["Pass"] += 1
+                    pass_count += count
+                    current["Pass"] += count
                 elif finding.status == "FAIL":
-                    fail_count += 1
+                    fail_count += count
                     if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
+                        current["Critical"] += count
                     elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
+                        current["High"] += count
                     elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
+                        current["Medium"] += count
                     elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
+                        current["Low"] += count
 
             # Add final service
 
@@ -141,9 +144,9 @@ def display_summary_table(
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count / len(findings) * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count / len(findings) * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
-                    f"{orange_color}{round(muted_count / len(findings) * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count / total_count * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count / total_count * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{orange_color}{round(muted_count / total_count * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
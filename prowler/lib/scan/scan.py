@@ -2,19 +2,18 @@ import datetime
 from types import SimpleNamespace
 from typing import Generator
 
-from prowler.lib.check.check import (
-    execute,
-    import_check,
-    list_services,
-    update_audit_metadata,
-)
+from prowler.lib.check.check import list_services, run_checks, update_audit_metadata
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.models import CheckMetadata, Severity
+from prowler.lib.check.services_loader import (
+    get_service_clients_to_load,
+    load_service_clients,
+)
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingContext
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -41,6 +40,9 @@ class Scan:
     _status: list[str] = None
     _bulk_checks_metadata: dict[str, CheckMetadata]
     _bulk_compliance_frameworks: dict
+    _max_workers: int = 1
+    _group_checks_by_service: bool = False
+    _services_workers: int = 1
 
     def __init__(
         self,
@@ -53,6 +55,9 @@ class Scan:
         excluded_checks: list[str] = None,
         excluded_services: list[str] = None,
         status: list[str] = None,
+        max_workers: int = 1,
+        group_checks_by_service: bool = False,
+        services_workers: int = 1,
     ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
@@ -67,6 +72,9 @@ class Scan:
             excluded_checks: list[str] -> The checks to exclude
             excluded_services: list[str] -> The services to exclude
             status: list[str] -> The status of the checks
+            max_workers: int -> The number of threads used to execute the checks
+            group_checks_by_service: bool -> Execute the checks of the same service in the same thread
+            services_workers: int -> The number of services loaded concurrently before executing the checks
 
         Raises:
             ScanInvalidCheckError: If the check does not exist in the provider or is from another provider.
@@ -77,6 +85,9 @@ class Scan:
             ScanInvalidStatusError: If the status does not exist in the provider.
         """
         self._provider = provider
+        self._max_workers = max_workers
+        self._group_checks_by_service = group_checks_by_service
+        self._services_workers = services_workers
 
         # Validate the status
         if status:
@@ -265,56 +276,54 @@ class Scan:
             )
 
             start_time = datetime.datetime.now()
-
-            for check_name in checks_to_execute:
+            # The values of the provider shared by all the findings of the scan
+            finding_context = FindingContext(self.provider, output_options)
+
+            # Build the service clients concurrently before executing the checks
+            if self._services_workers > 1:
+                load_service_clients(
+                    get_service_clients_to_load(self._provider.type, checks_to_execute),
+                    self._services_workers,
+                )
+
+            def update_progress(check_name: str, check, check_findings: list):
+                service = get_service_name_from_check_name(check_name)
+                # Remove the executed check
+                self._service_checks_to_execute[service].remove(check_name)
+                if len(self._service_checks_to_execute[service]) == 0:
+                    self._service_checks_to_execute.pop(service, None)
+                # Add the completed check
+                if service not in self._service_checks_completed:
+                    self._service_checks_completed[service] = set()
+                self._service_checks_completed[service].add(check_name)
+                self._number_of_checks_completed += 1
+
+                # This should be done just once all the service's checks are completed
+                # This metadata needs to get to the services not within the provider
+                # since it is present in the Scan class
+                self._provider.audit_metadata = update_audit_metadata(
+                    self._provider.audit_metadata,
+                    self.get_completed_services(),
+                    self.get_completed_checks(),
+                )
+
+            # Findings are yielded in the order of the checks to execute, even if they run concurrently
+            for check_name, _, check_findings in run_checks(
+                checks_to_execute,
+                self._provider,
+                custom_checks_metadata,
+                output_options=None,
+                max_workers=self._max_workers,
+                group_by_service=self._group_checks_by_service,
+                on_check_completed=update_progress,
+            ):
                 try:
-                    # Recover service from check name
-                    service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
-
                     # Filter the findings by the status
                     if self._status:
                         for finding in check_findings:
                             if finding.status not in self._status:
                                 check_findings.remove(finding)
 
-                    # Remove the executed check
-                    self._service_checks_to_execute[service].remove(check_name)
-                    if len(self._service_checks_to_execute[service]) == 0:
-                        self._service_checks_to_execute.pop(service, None)
-                    # Add the completed check
-                    if service not in self._service_checks_completed:
-                        self._service_checks_completed[service] = set()
-                    self._service_checks_completed[service].add(check_name)
-                    self._number_of_checks_completed += 1
-
-                    # This should be done just once all the service's checks are completed
-                    # This metadata needs to get to the services not within the provider
-                    # since it is present in the Scan class
-                    self._provider.audit_metadata = update_audit_metadata(
-                        self._provider.audit_metadata,
-                        self.get_completed_services(),
-                        self.get_completed_checks(),
-                    )
-
                     findings = []
                     for finding in check_findings:
                         try:
@@ -323,17 +332,13 @@ class Scan:
                                     self.provider,
                                     finding,
                                     output_options=output_options,
+                                    context=finding_context,
                                 )
                             )
                         except Exception:
                             continue
 
                     yield self.progress, findings
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -54,6 +54,11 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.retries.retries import (
+    AVAILABLE_RETRIES_MODES,
+    AdaptiveRetryHandler,
+)
+from prowler.providers.aws.lib.service.limiter import get_api_call_metrics
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -98,6 +103,7 @@ class AwsProvider(Provider):
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
+    _adaptive_retry_handler: Optional[AdaptiveRetryHandler] = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -123,6 +129,7 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        retries_mode: str = "standard",
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +155,7 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - retries_mode: The retries mode, standard or adaptive. The adaptive mode adds a client-side rate limiter per service shared by all the regional clients.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -202,7 +210,9 @@ class AwsProvider(Provider):
             aws_secret_access_key=aws_secret_access_key,
             aws_session_token=aws_session_token,
         )
-        session_config = self.set_session_config(retries_max_attempts)
+        session_config = self.set_session_config(retries_max_attempts, retries_mode)
+        if retries_mode == "adaptive":
+            self._adaptive_retry_handler = AdaptiveRetryHandler()
         # Current session and the original session points to the same session object until we get a new one, if needed
         self._session = AWSSession(
             current_session=aws_session,
@@ -416,6 +426,35 @@ class AwsProvider(Provider):
         """
         return self._mutelist
 
+    @property
+    def adaptive_retry_handler(self) -> Optional[AdaptiveRetryHandler]:
+        """
+        adaptive_retry_handler returns the handler of the adaptive retries mode, None if it is not enabled.
+        """
+        return self._adaptive_retry_handler
+
+    @property
+    def retry_statistics(self) -> dict:
+        """
+        retry_statistics returns the retry statistics per API call when the adaptive retries mode is enabled.
+
+        Example:
+            {"ec2.DescribeInstances": {"calls": 17, "retries": 2, "throttles": 2, "errors": 0}}
+        """
+        if self._adaptive_retry_handler:
+            return self._adaptive_retry_handler.statistics
+        return {}
+
+    @property
+    def api_call_metrics(self) -> dict:
+        """
+        api_call_metrics returns the metrics of the AWS API calls of all the services, empty if no service was loaded.
+
+        Example:
+            {"api_calls": 1200, "max_queue_depth": 40, "rate_limited_waits": 0, "throttles": 3, "throttles_by_service": {"ec2": 3}, ...}
+        """
+        return get_api_call_metrics()
+
     # TODO: This can be moved to another class since it doesn't need self
     def get_organizations_info(
         self, organizations_session: Session, aws_account_id: str
@@ -755,6 +794,11 @@ class AwsProvider(Provider):
                     service, region_name=region, config=self._session.session_config
                 )
                 regional_client.region = region
+                # All the regional clients of the service share the same adaptive rate limiter
+                if self._adaptive_retry_handler:
+                    self._adaptive_retry_handler.register_client(
+                        regional_client, service
+                    )
                 regional_clients[region] = regional_client
 
             return regional_clients
@@ -1005,16 +1049,29 @@ class AwsProvider(Provider):
         return AWSMFAInfo(arn=mfa_ARN, totp=mfa_TOTP)
 
     @staticmethod
-    def set_session_config(retries_max_attempts: int) -> Config:
+    def set_session_config(
+        retries_max_attempts: int, retries_mode: str = "standard"
+    ) -> Config:
         """
         set_session_config returns a botocore Config object with the Prowler user agent and the default retrier configuration if nothing is passed as argument
 
         Args:
             - retries_max_attempts: The maximum number of retries for the standard retrier config
+            - retries_mode: The retries mode, standard or adaptive. Both use the botocore standard retrier, the adaptive
+              client-side rate limiting is not set in the Config since botocore would create a limiter per client, it is
+              shared per service by the AdaptiveRetryHandler in generate_regional_clients instead.
 
         Returns:
             - Config: The botocore Config object
+
+        Raises:
+            - AWSArgumentTypeValidationError: If the retries mode is not valid
         """
+        if retries_mode not in AVAILABLE_RETRIES_MODES:
+            raise AWSArgumentTypeValidationError(
+                message=f"Retries mode must be one of {', '.join(AVAILABLE_RETRIES_MODES)}.",
+                file=os.path.basename(__file__),
+            )
         # Set the maximum retries for the standard retrier config
         default_session_config = Config(
             retries={"max_attempts": 3, "mode": "standard"},
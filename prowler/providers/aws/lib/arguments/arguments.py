@@ -4,6 +4,7 @@ from re import fullmatch, search
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.retries.retries import AVAILABLE_RETRIES_MODES
 
 
 def init_parser(self):
@@ -148,6 +149,12 @@ def init_parser(self):
         type=int,
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
+    boto3_config_subparser.add_argument(
+        "--aws-retries-mode",
+        default="standard",
+        choices=AVAILABLE_RETRIES_MODES,
+        help="Set the retries mode. The adaptive mode adds a client-side rate limiter per service, shared by all the regional clients, that learns from the throttling responses and saves the retry statistics per API call (Default: standard)",
+    )
 
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
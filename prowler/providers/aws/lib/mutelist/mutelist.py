@@ -7,7 +7,7 @@ from boto3.dynamodb.conditions import Attr
 from prowler.lib.check.models import Check_Report_AWS
 from prowler.lib.logger import logger
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class AWSMutelist(Mutelist):
@@ -48,14 +48,26 @@ class AWSMutelist(Mutelist):
         finding: Check_Report_AWS,
         aws_account_id: str,
     ) -> bool:
-        return self.is_muted(
-            aws_account_id,
-            finding.check_metadata.CheckID,
-            finding.region,
-            finding.resource_id,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, aws_account_id)
         )
 
+    def get_finding_mutelist_fields(
+        self,
+        finding: Check_Report_AWS,
+        aws_account_id: str,
+    ) -> list:
+        return [
+            (
+                aws_account_id,
+                finding.check_metadata.CheckID,
+                finding.region,
+                finding.resource_id,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
+
     def get_mutelist_file_from_s3(self, aws_session: Session = None):
         try:
             bucket = self._mutelist_file_path.split("/")[2]
@@ -0,0 +1,112 @@
+import threading
+
+from botocore.retries import bucket, standard, throttling
+from botocore.retries.adaptive import ClientRateLimiter, RateClocker
+
+from prowler.lib.logger import logger
+
+AVAILABLE_RETRIES_MODES = ["standard", "adaptive"]
+
+
+class AdaptiveRetryHandler:
+    """AdaptiveRetryHandler implements the Prowler adaptive retries mode for the AWS provider:
+    - A client-side rate limiter per service, shared by all the regional clients of that service, that
+      learns its rate from the Throttling and TooManyRequestsException responses using the botocore
+      adaptive retries algorithm. Botocore creates one limiter per client in its own adaptive mode, so
+      each regional client would have to be throttled on its own before slowing down.
+    - Retry statistics per API call, e.g. ec2.DescribeInstances
+    """
+
+    def __init__(self):
+        self._rate_limiters = {}
+        self._statistics = {}
+        self._lock = threading.Lock()
+        self._throttling_detector = standard.ThrottlingErrorDetector(
+            retry_event_adapter=standard.RetryEventAdapter(),
+        )
+
+    def get_rate_limiter(self, service: str) -> ClientRateLimiter:
+        """get_rate_limiter returns the rate limiter shared by all the clients of the given service"""
+        with self._lock:
+            if service not in self._rate_limiters:
+                clock = bucket.Clock()
+                self._rate_limiters[service] = ClientRateLimiter(
+                    rate_adjustor=throttling.CubicCalculator(
+                        starting_max_rate=0, start_time=clock.current_time()
+                    ),
+                    rate_clocker=RateClocker(clock),
+                    token_bucket=bucket.TokenBucket(max_rate=1, clock=clock),
+                    throttling_detector=self._throttling_detector,
+                    clock=clock,
+                )
+            return self._rate_limiters[service]
+
+    def register_client(self, client, service: str):
+        """register_client attaches the shared service rate limiter and the retry statistics to the given boto3 client"""
+        try:
+            rate_limiter = self.get_rate_limiter(service)
+            client.meta.events.register("before-send", rate_limiter.on_sending_request)
+            client.meta.events.register(
+                "needs-retry", rate_limiter.on_receiving_response
+            )
+            client.meta.events.register("needs-retry", self._on_needs_retry)
+            client.meta.events.register("after-call", self._on_after_call)
+            client.meta.events.register("after-call-error", self._on_after_call_error)
+        except Exception as error:
+            logger.error(
+                f"{service} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_api_statistics(self, event_name: str) -> dict:
+        # Event name format: "{event}.{service}.{operation}"
+        api = ".".join(event_name.split(".")[-2:])
+        if api not in self._statistics:
+            self._statistics[api] = {
+                "calls": 0,
+                "retries": 0,
+                "throttles": 0,
+                "errors": 0,
+            }
+        return self._statistics[api]
+
+    def _on_needs_retry(self, event_name: str, **kwargs):
+        # This handler must return None to not change the retry decision
+        if kwargs.get("response") is None:
+            return None
+        if self._throttling_detector.is_throttling_error(**kwargs):
+            with self._lock:
+                self._get_api_statistics(event_name)["throttles"] += 1
+        return None
+
+    def _on_after_call(
+        self, event_name: str, http_response=None, parsed: dict = None, **kwargs
+    ):
+        retries = (parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        with self._lock:
+            api_statistics = self._get_api_statistics(event_name)
+            api_statistics["calls"] += 1
+            api_statistics["retries"] += retries
+            if getattr(http_response, "status_code", 200) >= 300:
+                api_statistics["errors"] += 1
+
+    def _on_after_call_error(self, event_name: str, exception=None, **kwargs):
+        # Only emitted when the request could not be sent, e.g. connection errors
+        retries = (
+            (getattr(exception, "response", None) or {})
+            .get("ResponseMetadata", {})
+            .get("RetryAttempts", 0)
+        )
+        with self._lock:
+            api_statistics = self._get_api_statistics(event_name)
+            api_statistics["calls"] += 1
+            api_statistics["errors"] += 1
+            api_statistics["retries"] += retries
+
+    @property
+    def statistics(self) -> dict:
+        """statistics returns the retry statistics per API call, sorted by API"""
+        with self._lock:
+            return {
+                api: dict(api_statistics)
+                for api, api_statistics in sorted(self._statistics.items())
+            }
@@ -168,6 +168,8 @@ class S3:
             subfolder_name = "json-ocsf"
         elif extension == ".asff.json":
             subfolder_name = "json-asff"
+        elif extension.startswith(".ocsf.ndjson"):
+            subfolder_name = "json-ocsf-ndjson"
         else:
             subfolder_name = extension.lstrip(".")
         return subfolder_name
@@ -192,6 +194,10 @@ class S3:
                 ".csv": "text/csv",
                 ".ocsf.json": "application/json",
                 ".asff.json": "application/json",
+                ".parquet": "application/vnd.apache.parquet",
+                ".ocsf.ndjson": "application/x-ndjson",
+                ".ocsf.ndjson.gz": "application/gzip",
+                ".ocsf.ndjson.zst": "application/zstd",
             }
             # Keys are regular and/or compliance
             for key, output_list in outputs.items():
@@ -0,0 +1,248 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from botocore.retries import standard
+
+from prowler.lib.logger import logger
+
+# Default values used when they are not present in the audit config
+DEFAULT_API_MAX_WORKERS = 25
+DEFAULT_API_CALLS_PER_SECOND = 0
+
+
+class TokenBucket:
+    """TokenBucket allows up to `rate` acquisitions per second, with bursts of up to `capacity`.
+
+    A rate of 0 or lower disables the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity else max(rate, 1)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        acquire takes a token from the bucket, blocking until there is one available.
+
+        Returns:
+            float: the seconds the caller had to wait for the token.
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class APICallLimiter:
+    """APICallLimiter is shared by all the AWS services of the process to bound the AWS API calls:
+    - A single thread pool for the __threading_call__ of every service, so the number of
+      in-flight calls does not grow with the number of services loaded concurrently
+    - A token bucket per service and another one per region, that every API call has to go through
+    - Metrics for the queue depth, the calls that waited for the token buckets and the AWS throttling errors
+      received by every service, e.g. Throttling or ThrottlingException
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_API_MAX_WORKERS,
+        service_calls_per_second: float = DEFAULT_API_CALLS_PER_SECOND,
+        region_calls_per_second: float = DEFAULT_API_CALLS_PER_SECOND,
+    ):
+        self.max_workers = max_workers
+        self.service_calls_per_second = service_calls_per_second
+        self.region_calls_per_second = region_calls_per_second
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prowler-aws-api"
+        )
+        self._service_buckets = {}
+        self._region_buckets = {}
+        self._lock = threading.Lock()
+        self._worker = threading.local()
+        # Metrics
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.api_calls = 0
+        self.rate_limited_waits = 0
+        self.rate_limited_seconds = 0.0
+        self.throttles = 0
+        self.throttles_by_service = {}
+        self._throttling_detector = standard.ThrottlingErrorDetector(
+            retry_event_adapter=standard.RetryEventAdapter(),
+        )
+
+    def configure(
+        self, service_calls_per_second: float, region_calls_per_second: float
+    ):
+        """configure updates the rates of the token buckets"""
+        with self._lock:
+            if (
+                service_calls_per_second != self.service_calls_per_second
+                or region_calls_per_second != self.region_calls_per_second
+            ):
+                self.service_calls_per_second = service_calls_per_second
+                self.region_calls_per_second = region_calls_per_second
+                self._service_buckets = {}
+                self._region_buckets = {}
+
+    def in_worker(self) -> bool:
+        """in_worker returns True if the current thread is one of the shared pool threads"""
+        return getattr(self._worker, "active", False)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        submit schedules fn(*args, **kwargs) in the shared thread pool.
+
+        If it is called from one of the pool threads the call is run inline instead, so nested
+        __threading_call__ never wait for threads that are blocked waiting for them.
+        """
+        if self.in_worker():
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as error:
+                future.set_exception(error)
+            return future
+
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        return self.executor.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn, *args, **kwargs):
+        with self._lock:
+            self.queue_depth -= 1
+            self.in_flight += 1
+        self._worker.active = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._worker.active = False
+            with self._lock:
+                self.in_flight -= 1
+
+    def _get_bucket(self, buckets: dict, key: str, rate: float) -> TokenBucket:
+        with self._lock:
+            if key not in buckets:
+                buckets[key] = TokenBucket(rate)
+            return buckets[key]
+
+    def acquire(self, service: str, region: str = None):
+        """acquire blocks until both the service and the region token buckets allow a new API call"""
+        waited = self._get_bucket(
+            self._service_buckets, service, self.service_calls_per_second
+        ).acquire()
+        if region:
+            waited += self._get_bucket(
+                self._region_buckets, region, self.region_calls_per_second
+            ).acquire()
+        with self._lock:
+            self.api_calls += 1
+            if waited:
+                self.rate_limited_waits += 1
+                self.rate_limited_seconds += waited
+
+    def record_response(self, service: str, **kwargs):
+        """record_response counts the response of an API call of the given service if it is a throttling error"""
+        if kwargs.get("response") is None:
+            return
+        if self._throttling_detector.is_throttling_error(**kwargs):
+            with self._lock:
+                self.throttles += 1
+                self.throttles_by_service[service] = (
+                    self.throttles_by_service.get(service, 0) + 1
+                )
+
+    def register_client(self, client, service: str):
+        """register_client makes every API call of the given boto3 client go through the token buckets
+        and counts the throttling errors of its responses, retried ones included"""
+        region = getattr(client.meta, "region_name", None)
+
+        def _before_call(**kwargs):
+            self.acquire(service, region)
+
+        def _needs_retry(**kwargs):
+            self.record_response(service, **kwargs)
+            # This handler must return None to not change the retry decision
+            return None
+
+        client.meta.events.register("before-call", _before_call)
+        client.meta.events.register("needs-retry", _needs_retry)
+
+    @property
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self.in_flight,
+                "api_calls": self.api_calls,
+                "rate_limited_waits": self.rate_limited_waits,
+                "rate_limited_seconds": round(self.rate_limited_seconds, 3),
+                "throttles": self.throttles,
+                "throttles_by_service": dict(sorted(self.throttles_by_service.items())),
+            }
+
+
+_api_call_limiter = None
+_api_call_limiter_lock = threading.Lock()
+
+
+def get_api_call_limiter(audit_config: dict = None) -> APICallLimiter:
+    """
+    get_api_call_limiter returns the process-wide APICallLimiter, creating it with the audit config the first time.
+
+    The following keys are read from the AWS audit config:
+        - api_max_workers: number of threads running AWS API calls at the same time for all the services
+        - api_service_calls_per_second: AWS API calls per second allowed for each service, 0 to disable it
+        - api_region_calls_per_second: AWS API calls per second allowed for each region, 0 to disable it
+    """
+    global _api_call_limiter
+    audit_config = audit_config or {}
+    service_calls_per_second = audit_config.get(
+        "api_service_calls_per_second", DEFAULT_API_CALLS_PER_SECOND
+    )
+    region_calls_per_second = audit_config.get(
+        "api_region_calls_per_second", DEFAULT_API_CALLS_PER_SECOND
+    )
+    with _api_call_limiter_lock:
+        if _api_call_limiter is None:
+            max_workers = audit_config.get("api_max_workers", DEFAULT_API_MAX_WORKERS)
+            logger.info(
+                f"Using {max_workers} threads for the AWS API calls of all the services"
+            )
+            _api_call_limiter = APICallLimiter(
+                max_workers=max_workers,
+                service_calls_per_second=service_calls_per_second,
+                region_calls_per_second=region_calls_per_second,
+            )
+        else:
+            _api_call_limiter.configure(
+                service_calls_per_second, region_calls_per_second
+            )
+    return _api_call_limiter
+
+
+def get_api_call_metrics() -> dict:
+    """get_api_call_metrics returns the metrics of the process-wide APICallLimiter, empty if no AWS service was loaded"""
+    with _api_call_limiter_lock:
+        api_call_limiter = _api_call_limiter
+    if api_call_limiter is None:
+        return {}
+    return api_call_limiter.metrics
@@ -1,7 +1,8 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.service.limiter import get_api_call_limiter
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,15 +10,13 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
-
 
 class AWSService:
     """The AWSService class offers a parent class for each AWS Service to generate:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Thread pool for the __threading_call__, shared by all the services and rate limited per service and region
     - Also handles if the AWS Service is Global
     """
 
@@ -64,8 +63,16 @@ class AWSService:
         self.region = provider.get_default_region(self.service)
         self.client = self.session.client(self.service, self.region)
 
-        # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # Thread pool for __threading_call__, shared by all the AWS services
+        self.thread_pool = get_api_call_limiter(self.audit_config)
+        # Every API call goes through the service and region token buckets
+        if not global_service and self.regional_clients:
+            for regional_client in self.regional_clients.values():
+                self.thread_pool.register_client(regional_client, self.service)
+        self.thread_pool.register_client(self.client, self.service)
+        # The regional clients are already registered by the provider
+        if getattr(provider, "adaptive_retry_handler", None):
+            provider.adaptive_retry_handler.register_client(self.client, self.service)
 
     def __get_session__(self):
         return self.session
@@ -1,6 +1,6 @@
 from prowler.lib.check.models import Check_Report_Azure
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class AzureMutelist(Mutelist):
@@ -9,16 +9,41 @@ class AzureMutelist(Mutelist):
         finding: Check_Report_Azure,
         subscription_id: str,
     ) -> bool:
-        return self.is_muted(
-            subscription_id,  # support Azure Subscription ID in mutelist
-            finding.check_metadata.CheckID,
-            finding.location,
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
-        ) or self.is_muted(
-            finding.subscription,  # support Azure Subscription Name in mutelist
-            finding.check_metadata.CheckID,
-            finding.location,
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, subscription_id)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: Check_Report_Azure,
+        subscription_id: str = None,
+        subscriptions: dict = None,
+    ) -> list:
+        """
+        get_finding_mutelist_fields returns the fields of the finding for its Subscription ID and its Subscription Name.
+
+        Args:
+            finding (Check_Report_Azure): The finding
+            subscription_id (str): The Subscription ID of the finding
+            subscriptions (dict): Subscription Name -> Subscription ID, used if subscription_id is not set
+        """
+        if subscription_id is None and subscriptions:
+            subscription_id = subscriptions.get(finding.subscription)
+        resource_tags = unroll_tags(finding.resource_tags)
+        return [
+            (
+                subscription_id,  # support Azure Subscription ID in mutelist
+                finding.check_metadata.CheckID,
+                finding.location,
+                finding.resource_name,
+                resource_tags,
+            ),
+            (
+                finding.subscription,  # support Azure Subscription Name in mutelist
+                finding.check_metadata.CheckID,
+                finding.location,
+                finding.resource_name,
+                resource_tags,
+            ),
+        ]
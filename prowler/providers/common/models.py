@@ -26,6 +26,10 @@ class ProviderOutputOptions:
     output_filename: str
     only_logs: bool
     unix_timestamp: bool
+    ndjson_compression: str
+    checks_workers: int
+    group_checks_by_service: bool
+    services_workers: int
 
     def __init__(self, arguments, bulk_checks_metadata):
         self.status = getattr(arguments, "status", None)
@@ -35,8 +39,14 @@ class ProviderOutputOptions:
         self.bulk_checks_metadata = bulk_checks_metadata
         self.only_logs = getattr(arguments, "only_logs", None)
         self.unix_timestamp = getattr(arguments, "unix_timestamp", None)
+        self.ndjson_compression = getattr(arguments, "ndjson_compression", None)
         self.shodan_api_key = getattr(arguments, "shodan", None)
         self.fixer = getattr(arguments, "fixer", None)
+        self.checks_workers = getattr(arguments, "checks_workers", 1)
+        self.group_checks_by_service = getattr(
+            arguments, "group_checks_by_service", False
+        )
+        self.services_workers = getattr(arguments, "services_workers", 1)
 
         # Shodan API Key
         if self.shodan_api_key:
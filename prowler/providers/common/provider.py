@@ -178,6 +178,7 @@ class Provider(ABC):
                 if "aws" in provider_class_name.lower():
                     provider_class(
                         retries_max_attempts=arguments.aws_retries_max_attempts,
+                        retries_mode=arguments.aws_retries_mode,
                         role_arn=arguments.role,
                         session_duration=arguments.session_duration,
                         external_id=arguments.external_id,
@@ -1,6 +1,6 @@
 from prowler.lib.check.models import Check_Report_GCP
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class GCPMutelist(Mutelist):
@@ -8,10 +8,21 @@ class GCPMutelist(Mutelist):
         self,
         finding: Check_Report_GCP,
     ) -> bool:
-        return self.is_muted(
-            finding.project_id,
-            finding.check_metadata.CheckID,
-            finding.location,
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: Check_Report_GCP,
+    ) -> list:
+        return [
+            (
+                finding.project_id,
+                finding.check_metadata.CheckID,
+                finding.location,
+                finding.resource_name,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
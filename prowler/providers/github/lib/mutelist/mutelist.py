@@ -1,6 +1,6 @@
 from prowler.lib.check.models import CheckReportGithub
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class GithubMutelist(Mutelist):
@@ -9,10 +9,22 @@ class GithubMutelist(Mutelist):
         finding: CheckReportGithub,
         account_name: str,
     ) -> bool:
-        return self.is_muted(
-            account_name,
-            finding.check_metadata.CheckID,
-            "*",  # TODO: Study regions in GitHub
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, account_name)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: CheckReportGithub,
+        account_name: str,
+    ) -> list:
+        return [
+            (
+                account_name,
+                finding.check_metadata.CheckID,
+                "*",  # TODO: Study regions in GitHub
+                finding.resource_name,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
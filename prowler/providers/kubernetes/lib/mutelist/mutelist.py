@@ -1,6 +1,6 @@
 from prowler.lib.check.models import Check_Report_Kubernetes
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class KubernetesMutelist(Mutelist):
@@ -9,10 +9,22 @@ class KubernetesMutelist(Mutelist):
         finding: Check_Report_Kubernetes,
         cluster: str,
     ) -> bool:
-        return self.is_muted(
-            cluster,
-            finding.check_metadata.CheckID,
-            finding.namespace,
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, cluster)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: Check_Report_Kubernetes,
+        cluster: str,
+    ) -> list:
+        return [
+            (
+                cluster,
+                finding.check_metadata.CheckID,
+                finding.namespace,
+                finding.resource_name,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
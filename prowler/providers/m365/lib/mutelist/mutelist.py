@@ -1,6 +1,6 @@
 from prowler.lib.check.models import CheckReportM365
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class M365Mutelist(Mutelist):
@@ -9,10 +9,22 @@ class M365Mutelist(Mutelist):
         finding: CheckReportM365,
         tenant_id: str,
     ) -> bool:
-        return self.is_muted(
-            tenant_id,
-            finding.check_metadata.CheckID,
-            finding.location,
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, tenant_id)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: CheckReportM365,
+        tenant_id: str,
+    ) -> list:
+        return [
+            (
+                tenant_id,
+                finding.check_metadata.CheckID,
+                finding.location,
+                finding.resource_name,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
@@ -1,6 +1,6 @@
 from prowler.lib.check.models import CheckReportMongoDBAtlas
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
+from prowler.lib.outputs.utils import unroll_tags
 
 
 class MongoDBAtlasMutelist(Mutelist):
@@ -21,10 +21,22 @@ class MongoDBAtlasMutelist(Mutelist):
         Returns:
             bool: True if the finding is muted, False otherwise
         """
-        return self.is_muted(
-            organization_id,
-            finding.check_metadata.CheckID,
-            finding.location,  # TODO: Study regions in MongoDB Atlas
-            finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+        return any(
+            self.is_muted(*fields)
+            for fields in self.get_finding_mutelist_fields(finding, organization_id)
         )
+
+    def get_finding_mutelist_fields(
+        self,
+        finding: CheckReportMongoDBAtlas,
+        organization_id: str,
+    ) -> list:
+        return [
+            (
+                organization_id,
+                finding.check_metadata.CheckID,
+                finding.location,  # TODO: Study regions in MongoDB Atlas
+                finding.resource_name,
+                unroll_tags(finding.resource_tags),
+            )
+        ]
@@ -0,0 +1,225 @@
+import os
+import pickle
+from unittest import mock
+
+import pytest
+
+from prowler.lib.check.catalog import (
+    CATALOG_DISABLED_ENV_VAR,
+    clear_catalogs_cache,
+    get_catalog_file,
+    get_catalog_fingerprint,
+    load_catalog,
+    prowler_directory,
+    save_catalog,
+)
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.models import CheckMetadata, CheckMetadataRegistry
+
+
+@pytest.fixture(autouse=True)
+def enable_catalogs(monkeypatch):
+    monkeypatch.delenv(CATALOG_DISABLED_ENV_VAR, raising=False)
+    clear_catalogs_cache()
+    CheckMetadataRegistry.clear()
+    yield
+    clear_catalogs_cache()
+    CheckMetadataRegistry.clear()
+
+
+class TestCatalog:
+    def test_get_catalog_fingerprint(self):
+        fingerprint = get_catalog_fingerprint("aws")
+
+        assert "iam/iam_root_mfa_enabled" in fingerprint["checks"]
+        assert "iam/iam_root_mfa_enabled" in [
+            check for check, _, _ in fingerprint["metadata"]
+        ]
+        assert fingerprint == get_catalog_fingerprint("aws")
+        assert "cis_2.0_aws.json" in [
+            file_name for file_name, _, _ in fingerprint["compliance"]
+        ]
+
+    def test_get_catalog_fingerprint_oci(self):
+        assert get_catalog_fingerprint("oci")["checks"]
+
+    def test_save_and_load_catalog(self, tmp_path):
+        catalog_file = save_catalog("github", str(tmp_path))
+
+        assert catalog_file == get_catalog_file("github", str(tmp_path))
+        catalog = load_catalog("github", str(tmp_path))
+        assert catalog["provider"] == "github"
+        assert pickle.loads(catalog["checks_metadata"]) == CheckMetadata.get_bulk(
+            "github", use_catalog=False
+        )
+        assert pickle.loads(catalog["compliance_frameworks"]) == Compliance.get_bulk(
+            "github", use_catalog=False
+        )
+        assert os.path.isfile(
+            os.path.join(
+                prowler_directory,
+                catalog["metadata_files"][
+                    "repository_default_branch_requires_signed_commits"
+                ],
+            )
+        )
+
+    def test_load_catalog_not_found(self, tmp_path):
+        assert load_catalog("github", str(tmp_path)) is None
+
+    def test_load_catalog_disabled(self, tmp_path, monkeypatch):
+        save_catalog("github", str(tmp_path))
+        monkeypatch.setenv(CATALOG_DISABLED_ENV_VAR, "true")
+
+        assert load_catalog("github", str(tmp_path)) is None
+
+    def test_load_catalog_other_prowler_version(self, tmp_path):
+        with mock.patch("prowler.lib.check.catalog.prowler_version", "1.0.0"):
+            save_catalog("github", str(tmp_path))
+
+        assert load_catalog("github", str(tmp_path)) is None
+
+    def test_load_catalog_custom_checks(self, tmp_path):
+        save_catalog("github", str(tmp_path))
+        fingerprint = get_catalog_fingerprint("github")
+        fingerprint["checks"].append("repository/repository_custom_check")
+
+        with mock.patch(
+            "prowler.lib.check.catalog.get_catalog_fingerprint",
+            return_value=fingerprint,
+        ):
+            assert load_catalog("github", str(tmp_path)) is None
+
+    def test_load_catalog_metadata_file_edited(self, tmp_path):
+        save_catalog("github", str(tmp_path))
+        catalog = load_catalog("github", str(tmp_path))
+        metadata_file = os.path.join(
+            prowler_directory,
+            catalog["metadata_files"][
+                "repository_default_branch_requires_signed_commits"
+            ],
+        )
+        with open(metadata_file, "rb") as f:
+            content = f.read()
+        metadata_stat = os.stat(metadata_file)
+        try:
+            # The metadata file is edited in place after the catalog is built, keeping its size
+            with open(metadata_file, "wb") as f:
+                f.write(content.replace(b'"Severity": "', b'"Severity":"', 1) + b" ")
+            assert os.stat(metadata_file).st_size == metadata_stat.st_size
+            assert load_catalog("github", str(tmp_path)) is None
+        finally:
+            with open(metadata_file, "wb") as f:
+                f.write(content)
+            os.utime(
+                metadata_file,
+                ns=(metadata_stat.st_atime_ns, metadata_stat.st_mtime_ns),
+            )
+        assert load_catalog("github", str(tmp_path))
+
+    def test_load_catalog_metadata_file_touched(self, tmp_path):
+        save_catalog("github", str(tmp_path))
+        catalog = load_catalog("github", str(tmp_path))
+        metadata_file = os.path.join(
+            prowler_directory,
+            catalog["metadata_files"][
+                "repository_default_branch_requires_signed_commits"
+            ],
+        )
+        metadata_stat = os.stat(metadata_file)
+        try:
+            # Installing a wheel does not keep the modification time of its files
+            os.utime(
+                metadata_file,
+                ns=(metadata_stat.st_atime_ns, metadata_stat.st_mtime_ns + 10**9),
+            )
+            clear_catalogs_cache()
+            assert load_catalog("github", str(tmp_path))
+        finally:
+            os.utime(
+                metadata_file,
+                ns=(metadata_stat.st_atime_ns, metadata_stat.st_mtime_ns),
+            )
+
+    def test_register_catalog_metadata_file_edited(self, tmp_path):
+        save_catalog("github", str(tmp_path))
+        catalog = load_catalog("github", str(tmp_path))
+        metadata_file = os.path.join(
+            prowler_directory,
+            catalog["metadata_files"][
+                "repository_default_branch_requires_signed_commits"
+            ],
+        )
+        CheckMetadataRegistry.register_catalog(catalog)
+        metadata_stat = os.stat(metadata_file)
+        try:
+            # The metadata file is edited after the catalog is added to the registry
+            os.utime(
+                metadata_file,
+                ns=(metadata_stat.st_atime_ns, metadata_stat.st_mtime_ns + 10**9),
+            )
+            with mock.patch(
+                "prowler.lib.check.models.CheckMetadata.parse_file"
+            ) as mock_parse_file:
+                CheckMetadataRegistry.get(metadata_file)
+                mock_parse_file.assert_called_once()
+        finally:
+            os.utime(
+                metadata_file,
+                ns=(metadata_stat.st_atime_ns, metadata_stat.st_mtime_ns),
+            )
+
+    def test_get_bulk_from_catalog(self, tmp_path):
+        save_catalog("github", str(tmp_path))
+
+        with (
+            mock.patch(
+                "prowler.lib.check.catalog.default_catalogs_directory", str(tmp_path)
+            ),
+            mock.patch(
+                "prowler.lib.check.models.recover_checks_from_provider"
+            ) as mock_recover_checks,
+            mock.patch(
+                "prowler.lib.check.compliance_models.list_compliance_modules"
+            ) as mock_list_compliance_modules,
+        ):
+            bulk_checks_metadata = CheckMetadata.get_bulk("github")
+            bulk_compliance_frameworks = Compliance.get_bulk("github")
+            mock_recover_checks.assert_not_called()
+            mock_list_compliance_modules.assert_not_called()
+
+        assert bulk_checks_metadata == CheckMetadata.get_bulk(
+            "github", use_catalog=False
+        )
+        assert bulk_compliance_frameworks == Compliance.get_bulk(
+            "github", use_catalog=False
+        )
+        # Every call returns new objects that can be modified
+        bulk_checks_metadata[
+            "repository_default_branch_requires_signed_commits"
+        ].Severity = "low"
+        with mock.patch(
+            "prowler.lib.check.catalog.default_catalogs_directory", str(tmp_path)
+        ):
+            assert (
+                CheckMetadata.get_bulk("github")[
+                    "repository_default_branch_requires_signed_commits"
+                ].Severity
+                != "low"
+            )
+        # The checks get their metadata from the registry
+        catalog = load_catalog("github", str(tmp_path))
+        metadata_file = os.path.join(
+            prowler_directory,
+            catalog["metadata_files"][
+                "repository_default_branch_requires_signed_commits"
+            ],
+        )
+        with mock.patch(
+            "prowler.lib.check.models.CheckMetadata.parse_file"
+        ) as mock_parse_file:
+            assert (
+                CheckMetadataRegistry.get(metadata_file).CheckID
+                == "repository_default_branch_requires_signed_commits"
+            )
+            mock_parse_file.assert_not_called()
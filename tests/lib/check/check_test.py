@@ -21,6 +21,7 @@ from prowler.lib.check.check import (
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -30,6 +31,7 @@ from prowler.lib.check.utils import (
     recover_checks_from_service,
 )
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
 from prowler.providers.aws.services.accessanalyzer.accessanalyzer_service import (
     Analyzer,
 )
@@ -837,6 +839,45 @@ class TestCheck:
             )
             assert len(findings) == 1
 
+    def test_execute_with_mutelist(self):
+        findings = []
+        for resource_id in ["muted-resource", "resource"]:
+            finding = Mock()
+            finding.status = "FAIL"
+            finding.check_metadata.CheckID = "test_check"
+            finding.region = AWS_REGION_US_EAST_1
+            finding.resource_id = resource_id
+            finding.resource_tags = []
+            findings.append(finding)
+        check = Mock()
+        check.CheckID = "test_check"
+        check.execute = Mock(return_value=findings)
+
+        findings = execute(
+            check=check,
+            global_provider=set_mocked_aws_provider(
+                expected_checks=["test_check"],
+                mutelist=AWSMutelist(
+                    mutelist_content={
+                        "Accounts": {
+                            "*": {
+                                "Checks": {
+                                    "test_check": {
+                                        "Regions": ["*"],
+                                        "Resources": ["muted-resource"],
+                                    }
+                                }
+                            }
+                        }
+                    }
+                ),
+            ),
+            custom_checks_metadata=None,
+            output_options=None,
+        )
+        assert [finding.muted for finding in findings] == [True, False]
+        assert findings[0].muted_reason == "Muted by the mutelist rule */test_check"
+
     def test_execute_with_filtering_status(self):
         accessanalyzer_client = mock.MagicMock
         accessanalyzer_client.region = AWS_REGION_US_EAST_1
@@ -956,6 +997,8 @@ class TestCheck:
 
         output_options = mock.MagicMock()
         output_options.only_logs = True
+        output_options.checks_workers = 1
+        output_options.services_workers = 1
         error = Exception()
         check.execute = Mock(side_effect=error)
 
@@ -973,3 +1016,103 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_execute_checks_on_check_findings(self):
+        checks = ["accessanalyzer_enabled", "iam_root_mfa_enabled"]
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+        output_options.verbose = False
+        output_options.checks_workers = 1
+        output_options.services_workers = 1
+
+        def run_checks(checks_to_execute, *args, **kwargs):
+            for check_name in checks_to_execute:
+                yield check_name, Mock(), [f"{check_name}-finding"]
+
+        check_findings = []
+        with (
+            patch("prowler.lib.check.check.run_checks", side_effect=run_checks),
+            patch("prowler.lib.check.check.report"),
+        ):
+            assert (
+                execute_checks(
+                    checks,
+                    provider,
+                    custom_checks_metadata=None,
+                    config_file=None,
+                    output_options=output_options,
+                    on_check_findings=check_findings.append,
+                )
+                == []
+            )
+
+        assert check_findings == [
+            ["accessanalyzer_enabled-finding"],
+            ["iam_root_mfa_enabled-finding"],
+        ]
+
+    def test_run_checks_concurrently_keeps_order(self):
+        checks = [
+            "accessanalyzer_enabled",
+            "iam_root_mfa_enabled",
+            "accessanalyzer_enabled_without_findings",
+            "s3_bucket_public_access",
+        ]
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        def load_check(check_name, provider_type):
+            check = Mock()
+            check.CheckID = check_name
+            return check
+
+        def execute(check, *args, **kwargs):
+            return [f"{check.CheckID}-finding"]
+
+        completed = []
+        with (
+            patch("prowler.lib.check.check.load_check", side_effect=load_check),
+            patch("prowler.lib.check.check.execute", side_effect=execute),
+        ):
+            for group_by_service in (False, True):
+                completed.clear()
+                results = list(
+                    run_checks(
+                        checks,
+                        provider,
+                        custom_checks_metadata=None,
+                        max_workers=4,
+                        group_by_service=group_by_service,
+                        on_check_completed=lambda check_name, check, findings: completed.append(
+                            check_name
+                        ),
+                    )
+                )
+
+                assert [check_name for check_name, _, _ in results] == checks
+                assert [findings for _, _, findings in results] == [
+                    [f"{check_name}-finding"] for check_name in checks
+                ]
+                assert sorted(completed) == sorted(checks)
+
+    def test_run_checks_skips_not_found_checks(self, caplog):
+        caplog.set_level(ERROR)
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        results = list(
+            run_checks(
+                ["test-check"],
+                provider,
+                custom_checks_metadata=None,
+                max_workers=2,
+            )
+        )
+
+        assert results == []
+        assert caplog.record_tuples == [
+            ("root", 40, "Check 'test-check' was not found for the AWS provider")
+        ]
@@ -1,6 +1,9 @@
 from unittest import mock
 
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.compliance import (
+    ComplianceIndex,
+    update_checks_metadata_with_compliance,
+)
 from prowler.lib.check.compliance_models import (
     CIS_Requirement_Attribute,
     CIS_Requirement_Attribute_AssessmentStatus,
@@ -554,3 +557,54 @@ class TestCompliance:
         assert len(result) == 1
         assert "framework1_aws" in result.keys()
         mock_list_modules.assert_called_once()
+
+
+class TestComplianceIndex:
+    def test_get_requirements(self):
+        compliance_index = ComplianceIndex(custom_compliance_metadata)
+
+        requirements = compliance_index.get_requirements("accessanalyzer_enabled")
+        assert len(requirements) == 1
+        assert requirements[0][0] == "framework1_aws"
+        assert requirements[0][1].Id == "1.1.1"
+        assert compliance_index.get_requirements("not_found_check") == []
+        assert (
+            compliance_index.get_requirements(
+                "accessanalyzer_enabled", framework_name="framework1_azure"
+            )
+            == []
+        )
+
+    def test_get_frameworks(self):
+        compliance_index = ComplianceIndex(custom_compliance_metadata)
+
+        assert compliance_index.get_frameworks(
+            "iam_user_mfa_enabled_console_access"
+        ) == {"framework1_aws"}
+        assert compliance_index.get_frameworks("not_found_check") == set()
+
+    def test_get_check_compliance(self):
+        compliance_index = ComplianceIndex(custom_compliance_metadata)
+
+        assert compliance_index.get_check_compliance(
+            "accessanalyzer_enabled", "aws"
+        ) == {"Framework1-1.0": ["1.1.1"]}
+        assert (
+            compliance_index.get_check_compliance("accessanalyzer_enabled", "azure")
+            == {}
+        )
+
+    def test_get_requirements_by_id(self):
+        compliance_index = ComplianceIndex(custom_compliance_metadata)
+
+        requirements = compliance_index.get_requirements_by_id(
+            "framework1_aws", ["1.1.2", "1.1.1", "not_found"]
+        )
+        assert [requirement.Id for requirement in requirements] == ["1.1.1", "1.1.2"]
+
+    def test_duplicated_check_in_requirement(self):
+        framework = custom_compliance_metadata["framework1_aws"].copy(deep=True)
+        framework.Requirements[0].Checks.append("accessanalyzer_enabled")
+        compliance_index = ComplianceIndex({"framework1_aws": framework})
+
+        assert len(compliance_index.get_requirements("accessanalyzer_enabled")) == 1
@@ -1,10 +1,17 @@
+import os
 import sys
 from unittest import mock
 
 import pytest
 from pydantic.v1 import ValidationError
 
-from prowler.lib.check.models import Check, CheckMetadata
+from prowler.lib.check.models import (
+    Check,
+    Check_Report,
+    CheckMetadata,
+    CheckMetadataRegistry,
+    Severity,
+)
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -810,3 +817,72 @@ class TestCheck:
         msg = str(excinfo.value)
         assert "!= class name" in msg
         assert "!= file name" in msg
+
+
+class TestCheckMetadataRegistry:
+    def setup_method(self):
+        CheckMetadataRegistry.clear()
+
+    def teardown_method(self):
+        CheckMetadataRegistry.clear()
+
+    def test_get_parses_metadata_file_once(self, tmp_path):
+        metadata_file = tmp_path / "accessanalyzer_enabled.metadata.json"
+        metadata_file.write_text(mock_metadata.json())
+
+        with mock.patch(
+            "prowler.lib.check.models.CheckMetadata.parse_file",
+            wraps=CheckMetadata.parse_file,
+        ) as mock_parse_file:
+            check_metadata = CheckMetadataRegistry.get(str(metadata_file))
+            assert CheckMetadataRegistry.get(str(metadata_file)) is check_metadata
+            mock_parse_file.assert_called_once()
+
+        assert check_metadata == mock_metadata
+
+    def test_get_parses_modified_metadata_file(self, tmp_path):
+        metadata_file = tmp_path / "accessanalyzer_enabled.metadata.json"
+        metadata_file.write_text(mock_metadata.json())
+        assert CheckMetadataRegistry.get(str(metadata_file)).CheckTitle == "Check 1"
+
+        metadata_file.write_text(
+            mock_metadata.copy(update={"CheckTitle": "New"}).json()
+        )
+        os.utime(metadata_file, ns=(0, 0))
+
+        assert CheckMetadataRegistry.get(str(metadata_file)).CheckTitle == "New"
+
+    def test_parse_raw_returns_copies(self):
+        metadata = mock_metadata.json()
+
+        with mock.patch(
+            "prowler.lib.check.models.CheckMetadata.parse_raw",
+            wraps=CheckMetadata.parse_raw,
+        ) as mock_parse_raw:
+            first_finding = Check_Report(metadata=metadata, resource={})
+            second_finding = Check_Report(metadata=metadata, resource={})
+            mock_parse_raw.assert_called_once()
+
+        first_finding.check_metadata.Severity = Severity.low
+        assert first_finding.check_metadata == mock_metadata.copy(
+            update={"Severity": Severity.low}
+        )
+        assert second_finding.check_metadata == mock_metadata
+
+    def test_save_and_load_index(self, tmp_path):
+        metadata_file = tmp_path / "accessanalyzer_enabled.metadata.json"
+        metadata_file.write_text(mock_metadata.json())
+        index_file = str(tmp_path / "metadata.index")
+        CheckMetadataRegistry.get(str(metadata_file))
+        CheckMetadataRegistry.save_index(index_file)
+        CheckMetadataRegistry.clear()
+
+        assert CheckMetadataRegistry.load_index(index_file)
+        with mock.patch(
+            "prowler.lib.check.models.CheckMetadata.parse_file"
+        ) as mock_parse_file:
+            assert CheckMetadataRegistry.get(str(metadata_file)) == mock_metadata
+            mock_parse_file.assert_not_called()
+
+    def test_load_index_not_found(self, tmp_path):
+        assert not CheckMetadataRegistry.load_index(str(tmp_path / "not_found"))
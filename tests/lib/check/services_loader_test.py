@@ -0,0 +1,55 @@
+from unittest import mock
+
+from prowler.lib.check.services_loader import (
+    get_service_clients_to_load,
+    load_service_clients,
+)
+
+
+class TestServicesLoader:
+    def test_get_service_clients_to_load(self):
+        assert get_service_clients_to_load(
+            "aws", ["iam_root_mfa_enabled", "ec2_instance_public_ip"]
+        ) == {
+            "prowler.providers.aws.services.iam.iam_client": set(),
+            "prowler.providers.aws.services.ec2.ec2_client": set(),
+        }
+
+    def test_get_service_clients_to_load_with_dependencies(self):
+        assert get_service_clients_to_load(
+            "azure", ["app_function_access_keys_configured"]
+        ) == {
+            "prowler.providers.azure.services.app.app_client": {
+                "prowler.providers.azure.services.monitor.monitor_client"
+            },
+            "prowler.providers.azure.services.monitor.monitor_client": set(),
+        }
+
+    def test_get_service_clients_to_load_no_checks(self):
+        assert get_service_clients_to_load("aws", []) == {}
+
+    def test_load_service_clients(self):
+        service_clients = {
+            "app_client": {"monitor_client"},
+            "monitor_client": set(),
+            "iam_client": set(),
+            "broken_client": set(),
+        }
+        imported = []
+
+        def import_module(client_module):
+            if client_module == "broken_client":
+                raise Exception("Service failed")
+            imported.append(client_module)
+
+        loaded = []
+        with mock.patch(
+            "prowler.lib.check.services_loader.importlib.import_module",
+            side_effect=import_module,
+        ):
+            assert load_service_clients(
+                service_clients, max_workers=4, on_client_loaded=loaded.append
+            ) == {"app_client", "monitor_client", "iam_client"}
+
+        assert sorted(loaded) == sorted(service_clients)
+        assert imported.index("monitor_client") < imported.index("app_client")
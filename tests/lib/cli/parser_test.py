@@ -66,6 +66,8 @@ class Test_Parser:
         assert not parsed.no_color
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.streaming_outputs
+        assert not parsed.ndjson_compression
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -116,6 +118,7 @@ class Test_Parser:
         assert not parsed.no_color
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.streaming_outputs
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -158,6 +161,7 @@ class Test_Parser:
         assert not parsed.no_color
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.streaming_outputs
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -195,6 +199,7 @@ class Test_Parser:
         assert not parsed.no_color
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.streaming_outputs
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -317,6 +322,20 @@ class Test_Parser:
         assert len(parsed.output_formats) == 1
         assert "json-ocsf" in parsed.output_formats
 
+    def test_root_parser_output_formats_parquet(self):
+        command = [prowler_command, "-M", "parquet"]
+        parsed = self.parser.parse(command)
+        assert parsed.output_formats == ["parquet"]
+
+    def test_root_parser_output_formats_parquet_without_pyarrow(self, capsys):
+        command = [prowler_command, "-M", "parquet"]
+        with patch("prowler.lib.cli.parser.find_spec", return_value=None):
+            with pytest.raises(SystemExit) as wrapped_exit:
+                _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "pip install 'prowler[parquet]'" in capsys.readouterr().err
+
     def test_root_parser_output_formats_short_html(self):
         command = [prowler_command, "-M", "html"]
         parsed = self.parser.parse(command)
@@ -389,6 +408,45 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.unix_timestamp
 
+    def test_root_parser_streaming_outputs(self):
+        command = [prowler_command, "--streaming-outputs"]
+        parsed = self.parser.parse(command)
+        assert parsed.streaming_outputs
+
+    def test_root_parser_ndjson_compression(self):
+        command = [
+            prowler_command,
+            "-M",
+            "json-ocsf-ndjson",
+            "--ndjson-compression",
+            "zstd",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.output_formats == ["json-ocsf-ndjson"]
+        assert parsed.ndjson_compression == "zstd"
+
+    def test_root_parser_ndjson_compression_without_value(self):
+        command = [prowler_command, "--ndjson-compression"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_ndjson_compression_zstd_without_zstandard(self, capsys):
+        command = [
+            prowler_command,
+            "-M",
+            "json-ocsf-ndjson",
+            "--ndjson-compression",
+            "zstd",
+        ]
+        with patch("prowler.lib.cli.parser.find_spec", return_value=None):
+            with pytest.raises(SystemExit) as wrapped_exit:
+                _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "pip install 'prowler[zstd]'" in capsys.readouterr().err
+
     def test_logging_parser_only_logs_set(self):
         command = [prowler_command, "--only-logs"]
         parsed = self.parser.parse(command)
@@ -1103,6 +1161,32 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_retries_mode(self):
+        argument = "--aws-retries-mode"
+        retries_mode = "adaptive"
+        command = [prowler_command, argument, retries_mode]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_retries_mode == retries_mode
+
+    def test_aws_parser_retries_mode_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_retries_mode == "standard"
+
+    def test_aws_parser_retries_mode_invalid(self):
+        argument = "--aws-retries-mode"
+        command = [prowler_command, argument, "legacy"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_aws_parser_retries_mode_without_value(self):
+        argument = "--aws-retries-mode"
+        command = [prowler_command, argument]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
     def test_aws_parser_scan_unused_services(self):
         argument = "--scan-unused-services"
         command = [prowler_command, argument]
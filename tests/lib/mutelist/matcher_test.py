@@ -0,0 +1,234 @@
+from prowler.lib.mutelist.matcher import (
+    CompiledMutelist,
+    ItemsMatcher,
+    MutedCheck,
+    MutedChecks,
+    TagsMatcher,
+    get_tags_key,
+    is_tag_item_structured,
+    unroll_tags_key,
+)
+
+
+class TestItemsMatcher:
+    def test_matches_combined_regex(self):
+        matcher = ItemsMatcher(["i-123", "bucket-*", "prowler$"])
+        assert matcher._regex is not None
+        assert matcher.matches("i-123")
+        assert matcher.matches("bucket-test")
+        assert matcher.matches("test-prowler")
+        assert not matcher.matches("prowler-test")
+        assert not matcher.matches(None)
+
+    def test_matches_items_not_combinable(self):
+        matcher = ItemsMatcher(["(a)\\1", "(?i)test"])
+        assert matcher._regex is None
+        assert matcher.matches("aa")
+        assert matcher.matches("TEST")
+        assert not matcher.matches("ab")
+
+    def test_matches_tags(self):
+        matcher = ItemsMatcher(
+            ["environment=dev | environment=test", "team=a"], tag=True
+        )
+        assert matcher.matches("team=a | environment=test")
+        assert not matcher.matches("environment=test | team=b")
+        assert not matcher.matches("environment=prod | team=a")
+
+    def test_matches_empty(self):
+        assert not ItemsMatcher([]).matches("test")
+        assert ItemsMatcher(["*"]).matches("")
+        assert not ItemsMatcher(["*"]).matches({})
+
+    def test_matches_invalid_regex(self):
+        matcher = ItemsMatcher(["test", "[invalid"])
+        assert matcher._regex is None and matcher._regexes is None
+        assert matcher.matches("test")
+        assert not matcher.matches("other")
+
+
+class TestTagsMatcher:
+    def test_get_tags_key(self):
+        tags_key = get_tags_key({"environment": "dev", "owners": ["a", "b"]})
+        assert tags_key == (("environment", "dev"), ("owners", "a, b"))
+        assert unroll_tags_key(tags_key) == "environment=dev | owners=a, b"
+        assert get_tags_key({"environment": {"unhashable": "value"}}) is None
+
+    def test_is_tag_item_structured(self):
+        assert is_tag_item_structured("environment=dev")
+        assert is_tag_item_structured("environment=dev|project=(test|stage)")
+        assert is_tag_item_structured("environment=*")
+        assert is_tag_item_structured("*")
+        assert is_tag_item_structured("owner=john.doe")
+        assert not is_tag_item_structured("environment=dev | project=test")
+        assert not is_tag_item_structured("environment=dev*project=test")
+        assert not is_tag_item_structured("^environment=dev")
+        assert not is_tag_item_structured("environment=dev.")
+
+    def test_matches_structured(self):
+        matcher = TagsMatcher(["environment=dev|environment=test", "project=*"])
+        assert matcher._structured_regexes is not None
+        assert matcher.matches({"environment": "test", "project": "prowler"})
+        assert matcher.matches("environment=test | project=prowler")
+        assert not matcher.matches({"environment": "prod", "project": "prowler"})
+        assert not matcher.matches({"environment": "dev"})
+
+    def test_matches_not_structured(self):
+        matcher = TagsMatcher(["environment=dev | project=prowler"])
+        assert matcher._structured_regexes is None
+        # The items are searched in the unrolled tags, so the spaces are part of them
+        assert matcher.matches({"environment": "dev", "project": "prowler"})
+        assert not matcher.matches({"environment": "dev"})
+        assert matcher.matches("environment=dev | project=prowler")
+
+    def test_matches_empty_tags(self):
+        assert TagsMatcher(["*"]).matches({})
+        assert TagsMatcher(["*"]).matches("")
+        assert not TagsMatcher(["environment=dev"]).matches({})
+        assert not TagsMatcher([]).matches({"environment": "dev"})
+        assert not TagsMatcher(["*"]).matches(None)
+
+    def test_matches_cached(self):
+        matcher = TagsMatcher(["environment=dev"])
+        for _ in range(3):
+            assert matcher.matches({"environment": "dev"})
+        assert matcher._cached_matches.cache_info().hits == 2
+        assert matcher._cached_matches.cache_info().misses == 1
+
+
+class TestMutedChecks:
+    def test_muted_check_lambda(self):
+        muted_check = MutedCheck(
+            "lambda_function_url_public", {"Regions": ["*"], "Resources": ["*"]}
+        )
+        assert muted_check.name == "awslambda_function_url_public"
+        assert muted_check.matches_check("awslambda_function_url_public")
+
+    def test_get_entries_cached(self):
+        muted_checks = MutedChecks(
+            {
+                "ec2_*": {"Regions": ["*"], "Resources": ["*"]},
+                "s3_bucket_public_access": {"Regions": ["*"], "Resources": ["*"]},
+                "*": {"Regions": ["*"], "Resources": ["*"]},
+            }
+        )
+        entries = muted_checks.get_entries("ec2_instance_public_ip")
+        assert [entry.name for entry in entries] == ["ec2_*", "*"]
+        assert muted_checks.get_entries("ec2_instance_public_ip") is entries
+
+    def test_is_muted_exception_before_mute(self):
+        muted_checks = MutedChecks(
+            {
+                "ec2_*": {
+                    "Regions": ["*"],
+                    "Resources": ["*"],
+                    "Exceptions": {"Regions": ["eu-west-1"]},
+                },
+                "ec2_instance_public_ip": {"Regions": ["*"], "Resources": ["*"]},
+            }
+        )
+        assert not muted_checks.is_muted(
+            "123456789012", "ec2_instance_public_ip", "eu-west-1", "i-123", ""
+        )
+        assert muted_checks.is_muted(
+            "123456789012", "ec2_instance_public_ip", "us-east-1", "i-123", ""
+        )
+
+    def test_is_muted_mute_before_exception(self):
+        muted_checks = MutedChecks(
+            {
+                "ec2_instance_public_ip": {"Regions": ["*"], "Resources": ["*"]},
+                "ec2_*": {
+                    "Regions": ["*"],
+                    "Resources": ["*"],
+                    "Exceptions": {"Regions": ["eu-west-1"]},
+                },
+            }
+        )
+        assert muted_checks.is_muted(
+            "123456789012", "ec2_instance_public_ip", "eu-west-1", "i-123", ""
+        )
+
+
+class TestCompiledMutelist:
+    def test_is_muted(self):
+        compiled_mutelist = CompiledMutelist(
+            {
+                "Accounts": {
+                    "123456789012": {
+                        "Checks": {
+                            "iam_root_mfa_enabled": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                            }
+                        }
+                    },
+                    "*": {
+                        "Checks": {
+                            "s3_*": {
+                                "Regions": ["us-east-1"],
+                                "Resources": ["bucket-*"],
+                                "Tags": ["environment=dev"],
+                            }
+                        }
+                    },
+                }
+            }
+        )
+        assert compiled_mutelist.is_muted(
+            "123456789012", "iam_root_mfa_enabled", "us-east-1", "root", ""
+        )
+        assert not compiled_mutelist.is_muted(
+            "210987654321", "iam_root_mfa_enabled", "us-east-1", "root", ""
+        )
+        assert compiled_mutelist.is_muted(
+            "210987654321",
+            "s3_bucket_public_access",
+            "us-east-1",
+            "bucket-test",
+            "environment=dev",
+        )
+        assert not compiled_mutelist.is_muted(
+            "210987654321",
+            "s3_bucket_public_access",
+            "us-east-1",
+            "bucket-test",
+            "environment=prod",
+        )
+
+    def test_get_muting_rules(self):
+        compiled_mutelist = CompiledMutelist(
+            {
+                "Accounts": {
+                    "*": {
+                        "Checks": {
+                            "ec2_*": {
+                                "Regions": ["eu-west-1"],
+                                "Resources": ["i-123"],
+                                "Exceptions": {"Resources": ["i-1234"]},
+                            },
+                            "ec2_instance_public_ip": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                            },
+                        }
+                    }
+                }
+            }
+        )
+        assert compiled_mutelist.get_muting_rules(
+            "123456789012",
+            "ec2_instance_public_ip",
+            "eu-west-1",
+            [("i-123", ""), ("i-1234", ""), ("i-456", "")],
+        ) == ["*/ec2_*", None, "*/ec2_instance_public_ip"]
+        assert compiled_mutelist.get_muting_rules(
+            "123456789012", "s3_bucket_public_access", "eu-west-1", [("bucket", "")]
+        ) == [None]
+
+    def test_is_muted_empty_mutelist(self):
+        compiled_mutelist = CompiledMutelist({})
+        assert compiled_mutelist.accounts == {}
+        assert not compiled_mutelist.is_muted(
+            "123456789012", "iam_root_mfa_enabled", "us-east-1", "root", ""
+        )
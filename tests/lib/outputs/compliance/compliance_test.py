@@ -442,3 +442,38 @@ class TestComplianceOutput:
         )
 
         assert compliance_output.file_extension == ".csv"
+
+    def test_get_check_compliance_with_compliance_index(self):
+        from prowler.lib.check.compliance import ComplianceIndex
+
+        compliance_index = ComplianceIndex(
+            {
+                "cis_1.4_aws": Compliance(
+                    Framework="CIS",
+                    Version="1.4",
+                    Provider="AWS",
+                    Name="CIS Amazon Web Services Foundations Benchmark v1.4.0",
+                    Description="Test compliance framework",
+                    Requirements=[
+                        Compliance_Requirement(
+                            Checks=["iam_user_accesskey_unused"],
+                            Id="1.12",
+                            Description="Ensure credentials unused for 45 days or greater are disabled",
+                            Attributes=[],
+                        ),
+                        Compliance_Requirement(
+                            Checks=["s3_bucket_no_mfa_delete"],
+                            Id="2.1.3",
+                            Description="Ensure MFA Delete is enabled on S3 buckets",
+                            Attributes=[],
+                        ),
+                    ],
+                )
+            }
+        )
+        finding = mock.MagicMock()
+        finding.check_metadata.CheckID = "iam_user_accesskey_unused"
+
+        assert get_check_compliance(
+            finding, "aws", {}, compliance_index=compliance_index
+        ) == {"CIS-1.4": ["1.12"]}
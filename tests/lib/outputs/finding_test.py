@@ -13,7 +13,7 @@ from prowler.lib.check.models import (
     Severity,
 )
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingContext
 from prowler.providers.github.models import GithubAppIdentityInfo
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.github.github_fixtures import (
@@ -59,6 +59,37 @@ def mock_check_metadata(provider):
     )
 
 
+def mock_aws_provider():
+    provider = MagicMock()
+    provider.type = "aws"
+    provider.identity.profile = "mock_auth"
+    provider.identity.account = "mock_account_uid"
+    provider.identity.partition = "aws"
+    provider.organizations_metadata.account_name = "mock_account_name"
+    provider.organizations_metadata.account_email = "mock_account_email"
+    provider.organizations_metadata.organization_arn = "mock_account_org_uid"
+    provider.organizations_metadata.organization_id = "mock_account_org_name"
+    provider.organizations_metadata.account_tags = {"tag1": "value1"}
+    return provider
+
+
+def mock_aws_check_output(resource_id: str, status: str = "FAIL"):
+    """Return a check output of an AWS resource, without compliance to get it from the checks metadata"""
+    return SimpleNamespace(
+        resource_id=resource_id,
+        resource_arn=f"arn:aws:service:us-west-1:123456789012:{resource_id}",
+        resource_details="",
+        resource_tags=[{"Key": "env", "Value": "prod"}],
+        region="us-west-1",
+        status=status,
+        status_extended="mock_status_extended",
+        muted=False,
+        muted_reason=None,
+        check_metadata=mock_check_metadata(provider="aws"),
+        resource={},
+    )
+
+
 def mock_get_check_compliance(*_):
     return {
         "CIS-2.0": ["1.12"],
@@ -163,6 +194,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="aws")
         check_output.resource = {"metadata": "mock_metadata"}
         check_output.compliance = {
@@ -267,6 +299,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="azure")
         check_output.resource = {}
         check_output.compliance = {
@@ -361,6 +394,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="gcp")
         check_output.resource = {}
         check_output.compliance = {
@@ -444,6 +478,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="kubernetes")
         check_output.timestamp = datetime.now()
         check_output.resource = {}
@@ -536,6 +571,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "Repository has security features enabled"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="github")
         check_output.resource = {"url": "https://github.com/owner/test_repository"}
         check_output.compliance = {
@@ -602,6 +638,7 @@ class TestFinding:
             "Repository lacks required security configuration"
         )
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="github")
         check_output.resource = {"url": "https://github.com/org/test_repository"}
         check_output.compliance = {
@@ -670,6 +707,7 @@ class TestFinding:
         check_output.status = Status.PASS
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="iac")
         check_output.compliance = {}
 
@@ -740,6 +778,7 @@ class TestFinding:
         check_output.partition = "aws"
         check_output.status_extended = "mock_status_extended"
         check_output.muted = False
+        check_output.muted_reason = None
         check_output.check_metadata = mock_check_metadata(provider="aws")
         check_output.resource = {}
 
@@ -754,6 +793,96 @@ class TestFinding:
         with pytest.raises(ValidationError):
             Finding.generate_output(provider, check_output, output_options)
 
+    @patch(
+        "prowler.lib.outputs.finding.get_check_compliance",
+        return_value={"CIS-2.0": ["1.12"]},
+    )
+    def test_generate_output_with_context(self, mock_get_check_compliance):
+        provider = mock_aws_provider()
+        output_options = SimpleNamespace(unix_timestamp=False, bulk_checks_metadata={})
+        context = FindingContext(provider, output_options)
+
+        findings = [
+            Finding.generate_output(
+                provider,
+                mock_aws_check_output(f"resource-{index}"),
+                output_options,
+                context=context,
+            )
+            for index in range(3)
+        ]
+
+        # The compliance of the check is computed once
+        mock_get_check_compliance.assert_called_once()
+        for index, finding in enumerate(findings):
+            # The finding is the same as the one validated by the model
+            assert finding == Finding(**finding.dict())
+            assert finding == Finding.generate_output(
+                provider, mock_aws_check_output(f"resource-{index}"), output_options
+            )
+            assert finding.status == Status.FAIL
+            assert finding.account_uid == "mock_account_uid"
+            assert finding.auth_method == "profile: mock_auth"
+            assert finding.resource_name == f"resource-{index}"
+            assert finding.resource_tags == {"env": "prod"}
+            assert finding.compliance == {"CIS-2.0": ["1.12"]}
+            assert finding.timestamp == context.timestamp
+        # Every finding has its own dicts
+        assert findings[0].account_tags is not findings[1].account_tags
+        assert findings[0].compliance is not findings[1].compliance
+
+    def test_finding_context_account_data_once_per_account(self):
+        provider = MagicMock()
+        provider.type = "gcp"
+        provider.identity.profile = "mock_profile"
+        provider.projects = {
+            "project-1": MagicMock(id="project-1", labels={}, organization=None),
+            "project-2": MagicMock(id="project-2", labels={}, organization=None),
+        }
+        provider.projects["project-1"].name = "Project 1"
+        provider.projects["project-2"].name = "Project 2"
+        context = FindingContext(provider, SimpleNamespace())
+
+        with patch.object(
+            FindingContext,
+            "_load_account_data",
+            autospec=True,
+            side_effect=FindingContext._load_account_data,
+        ) as mock_load_account_data:
+            for project_id in ["project-1", "project-2", "project-1", "project-2"]:
+                account_data, account_data_valid = context.get_account_data(
+                    SimpleNamespace(project_id=project_id)
+                )
+                assert account_data["account_uid"] == project_id
+                assert account_data_valid
+
+        assert mock_load_account_data.call_count == 2
+
+    def test_finding_context_invalid_account_data(self):
+        provider = mock_aws_provider()
+        provider.organizations_metadata.account_tags = None
+        output_options = SimpleNamespace(unix_timestamp=False)
+        context = FindingContext(provider, output_options)
+
+        check_output = mock_aws_check_output("resource-1")
+        check_output.compliance = {}
+        with pytest.raises(ValidationError):
+            Finding.generate_output(
+                provider, check_output, output_options, context=context
+            )
+
+    def test_generate_output_with_context_validation_error(self):
+        provider = mock_aws_provider()
+        output_options = SimpleNamespace(unix_timestamp=False)
+        context = FindingContext(provider, output_options)
+
+        check_output = mock_aws_check_output("resource-1", status="Invalid")
+        check_output.compliance = {}
+        with pytest.raises(ValidationError):
+            Finding.generate_output(
+                provider, check_output, output_options, context=context
+            )
+
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
         new=mock_get_check_compliance,
@@ -829,6 +958,7 @@ class TestFinding:
         dummy_finding.check_metadata = check_metadata
         dummy_finding.resources = resources
         dummy_finding.muted = True
+        dummy_finding.muted_reason = "Muted by mutelist"
 
         # Call the transform_api_finding classmethod
         finding_obj = Finding.transform_api_finding(dummy_finding, provider)
@@ -959,6 +1089,7 @@ class TestFinding:
         api_finding.resources = DummyResources(api_resource)
         api_finding.subscription = "default"
         api_finding.muted = False
+        api_finding.muted_reason = None
         finding_obj = Finding.transform_api_finding(api_finding, provider)
 
         assert finding_obj.account_organization_uid == "test-ing-432a-a828-d9c965196f87"
@@ -1061,6 +1192,7 @@ class TestFinding:
         dummy_finding.raw_result = {}
         dummy_finding.project_id = "project1"
         dummy_finding.muted = True
+        dummy_finding.muted_reason = "Muted by mutelist"
 
         resource = DummyResource(
             uid="gcp-resource-uid",
@@ -1151,6 +1283,7 @@ class TestFinding:
         resource.region = "namespace: default"
         api_finding.resources = DummyResources(resource)
         api_finding.muted = True
+        api_finding.muted_reason = "Muted by mutelist"
         finding_obj = Finding.transform_api_finding(api_finding, provider)
         assert finding_obj.auth_method == "in-cluster"
         assert finding_obj.resource_name == "k8s-resource-name"
@@ -1158,6 +1291,8 @@ class TestFinding:
         assert finding_obj.account_name == "context: In-Cluster"
         assert finding_obj.account_uid == "cluster-1"
         assert finding_obj.region == "namespace: default"
+        assert finding_obj.muted
+        assert finding_obj.muted_reason == "Muted by mutelist"
 
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
@@ -1217,6 +1352,7 @@ class TestFinding:
         )
         dummy_finding.resources = DummyResources(resource)
         dummy_finding.muted = True
+        dummy_finding.muted_reason = "Muted by mutelist"
         finding_obj = Finding.transform_api_finding(dummy_finding, provider)
         assert finding_obj.auth_method == "ms_identity_type: ms_identity_id"
         assert finding_obj.account_uid == "ms-tenant-id"
@@ -0,0 +1,85 @@
+import gzip
+import json
+
+import zstandard
+
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.ocsf.ocsf_ndjson import OCSFNDJSON
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+def read_lines(file_path: str) -> list[dict]:
+    if file_path.endswith(".gz"):
+        with gzip.open(file_path, "rt") as file:
+            content = file.read()
+    elif file_path.endswith(".zst"):
+        with open(file_path, "rb") as file:
+            content = (
+                zstandard.ZstdDecompressor()
+                .stream_reader(file, read_across_frames=True)
+                .read()
+                .decode()
+            )
+    else:
+        with open(file_path) as file:
+            content = file.read()
+    assert content.endswith("\n")
+    return [json.loads(line) for line in content.splitlines()]
+
+
+class TestOCSFNDJSON:
+    def test_batch_write_data_to_file(self, tmp_path):
+        findings = [
+            generate_finding_output(
+                status="FAIL", resource_uid="resource-1", resource_tags={"a": "b"}
+            ),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+        ]
+        file_path = f"{tmp_path}/prowler-output.ocsf.ndjson"
+        output = OCSFNDJSON(findings, file_path=file_path)
+        output.batch_write_data_to_file()
+
+        assert output.file_descriptor.closed
+        assert output.file_extension == ".ocsf.ndjson"
+        # The events are the same as the ones of the OCSF output
+        assert read_lines(file_path) == [
+            json.loads(event.json(exclude_none=True)) for event in OCSF(findings).data
+        ]
+
+    def test_batch_write_data_to_file_in_batches(self, tmp_path):
+        for file_name in [
+            "prowler-output.ocsf.ndjson",
+            "prowler-output.ocsf.ndjson.gz",
+            "prowler-output.ocsf.ndjson.zst",
+        ]:
+            file_path = f"{tmp_path}/{file_name}"
+            output = OCSFNDJSON(findings=[], file_path=file_path, from_cli=False)
+            output.create_file_descriptor(file_path)
+            for batch in range(3):
+                output._data = []
+                output.transform(
+                    [
+                        generate_finding_output(
+                            check_id=f"service_check_{batch}",
+                            resource_uid=f"resource-{batch}-{index}",
+                        )
+                        for index in range(batch + 1)
+                    ]
+                )
+                output.close_file = batch == 2
+                output.batch_write_data_to_file()
+
+            assert output.file_descriptor.closed
+            events = read_lines(file_path)
+            assert [event["resources"][0]["uid"] for event in events] == [
+                "resource-0-0",
+                "resource-1-0",
+                "resource-1-1",
+                "resource-2-0",
+                "resource-2-1",
+                "resource-2-2",
+            ]
+            assert events[0]["metadata"]["event_code"] == "service_check_0"
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not OCSFNDJSON([])._file_descriptor
@@ -0,0 +1,130 @@
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from freezegun import freeze_time
+
+from prowler.config.config import prowler_version
+from prowler.lib.outputs.parquet.parquet import PARQUET_SCHEMA, Parquet
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1
+
+
+class TestParquet:
+    def test_output_transform(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                status_extended="status-extended",
+                resource_uid="resource-123",
+                resource_name="Example Resource",
+                resource_tags={"tag1": "value1", "tag2": 2},
+                compliance={"CIS-1.4": ["2.1.3", "2.1.4"], "ENS": "op.exp.1"},
+                timestamp=1705305600,
+            )
+        ]
+
+        output = Parquet(findings)
+        output_data = output.data[0]
+
+        assert isinstance(output_data, dict)
+        assert output_data["timestamp"] == datetime.fromtimestamp(1705305600)
+        assert output_data["account_uid"] == AWS_ACCOUNT_NUMBER
+        assert output_data["account_tags"] == {"test-tag": "test-value"}
+        assert output_data["check_id"] == "service_test_check_id"
+        assert output_data["check_type"] == ["test-type"]
+        assert output_data["status"] == "FAIL"
+        assert output_data["muted"] is False
+        assert output_data["severity"] == "high"
+        assert output_data["resource_uid"] == "resource-123"
+        assert output_data["resource_tags"] == {"tag1": "value1", "tag2": "2"}
+        assert output_data["region"] == AWS_REGION_EU_WEST_1
+        assert output_data["compliance"] == {
+            "CIS-1.4": ["2.1.3", "2.1.4"],
+            "ENS": ["op.exp.1"],
+        }
+        assert output_data["categories"] == ["test-category"]
+        assert output_data["prowler_version"] == prowler_version
+        assert set(output_data) == set(PARQUET_SCHEMA.names)
+
+    @freeze_time(datetime.now())
+    def test_parquet_write_to_file(self, tmp_path):
+        file_path = f"{tmp_path}/prowler-output.parquet"
+        output = Parquet(
+            findings=[generate_finding_output(resource_tags={"tag1": "value1"})],
+            file_path=file_path,
+        )
+        output.batch_write_data_to_file()
+
+        assert output.file_descriptor.closed
+        table = pq.read_table(file_path)
+        assert table.schema == PARQUET_SCHEMA
+        assert table.schema.field("check_id").type == pa.dictionary(
+            pa.int32(), pa.string()
+        )
+        assert table.schema.field("compliance").type == pa.map_(
+            pa.string(), pa.list_(pa.string())
+        )
+        row = table.to_pylist()[0]
+        assert row["timestamp"] == datetime.now()
+        assert row["check_id"] == "service_test_check_id"
+        assert row["status"] == "PASS"
+        assert row["resource_tags"] == [("tag1", "value1")]
+        assert row["compliance"] == [("test-compliance", ["test-compliance"])]
+
+    def test_parquet_write_batches(self, tmp_path):
+        file_path = f"{tmp_path}/prowler-output.parquet"
+        output = Parquet(findings=[], file_path=file_path, from_cli=False)
+        output.create_file_descriptor(file_path)
+        for batch, regions in enumerate(
+            [["eu-west-1", "us-east-1"], ["eu-west-1"], ["ap-south-1"]]
+        ):
+            output._data = []
+            output.transform(
+                [
+                    generate_finding_output(
+                        check_id=f"service_check_{batch}", region=region
+                    )
+                    for region in regions
+                ]
+            )
+            output.close_file = batch == 2
+            output.batch_write_data_to_file()
+
+        assert output.file_descriptor.closed
+        parquet_file = pq.ParquetFile(file_path)
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.metadata.num_rows == 4
+        table = parquet_file.read()
+        assert table.column("region").to_pylist() == [
+            "eu-west-1",
+            "us-east-1",
+            "eu-west-1",
+            "ap-south-1",
+        ]
+        assert table.column("check_id").to_pylist() == [
+            "service_check_0",
+            "service_check_0",
+            "service_check_1",
+            "service_check_2",
+        ]
+
+    def test_parquet_close_without_findings(self, tmp_path):
+        file_path = f"{tmp_path}/prowler-output.parquet"
+        output = Parquet(findings=[], file_path=file_path, from_cli=False)
+        output.create_file_descriptor(file_path)
+        output.close_file = True
+        output.batch_write_data_to_file()
+
+        assert output.file_descriptor.closed
+        table = pq.read_table(file_path)
+        assert table.num_rows == 0
+        assert table.schema == PARQUET_SCHEMA
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not Parquet([])._file_descriptor
+
+    def test_parquet_with_file_path(self):
+        parquet = Parquet(findings=[], file_path="test.parquet")
+
+        assert parquet.file_extension == ".parquet"
@@ -0,0 +1,409 @@
+import csv
+import gzip
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pyarrow.parquet as pq
+
+from prowler.lib.outputs.compliance.cis.cis import get_cis_table
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.compliance_writers import (
+    ComplianceFanOut,
+    get_compliance_output_class,
+)
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.streaming import StreamingOutputs
+from prowler.lib.outputs.summary_table import display_summary_table
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS, CIS_1_5_AWS
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+OUTPUT_FILENAME = "prowler-output"
+
+
+def generate_check_findings(statuses: list[str], check_id: str) -> list:
+    """Return the check reports and their findings with the given statuses"""
+    findings = [
+        generate_finding_output(
+            status=status,
+            check_id=check_id,
+            resource_uid=f"resource-{index}",
+            compliance={"CIS-1.4": "2.1.3"},
+        )
+        for index, status in enumerate(statuses)
+    ]
+    check_reports = [
+        SimpleNamespace(
+            check_metadata=finding.metadata,
+            status=finding.status.value,
+            muted=finding.muted,
+            finding=finding,
+        )
+        for finding in findings
+    ]
+    return check_reports
+
+
+def generate_output(_provider, check_report, _output_options, context=None):
+    return check_report.finding
+
+
+class TestStreamingOutputs:
+    def setup_method(self):
+        self.provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+
+    def _streaming_outputs(self, tmp_path, output_formats, compliance_frameworks={}):
+        (tmp_path / "compliance").mkdir(exist_ok=True)
+        output_options = SimpleNamespace(
+            output_directory=str(tmp_path), output_filename=OUTPUT_FILENAME
+        )
+        return StreamingOutputs(
+            self.provider,
+            output_options,
+            output_formats,
+            compliance_frameworks,
+            keep_asff_findings=True,
+        )
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_multiple_checks(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(
+            tmp_path, ["csv", "json-ocsf", "json-asff"]
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL"], "service_check_one")
+        )
+        streaming_outputs.add_check_findings([])
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["FAIL"], "service_check_two")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "PASS"], "service_check_three")
+        )
+        generated_outputs = streaming_outputs.close()
+
+        assert len(generated_outputs["regular"]) == 3
+        assert all(
+            output.file_descriptor.closed for output in generated_outputs["regular"]
+        )
+        with open(f"{tmp_path}/{OUTPUT_FILENAME}.csv") as csv_file:
+            rows = list(csv.DictReader(csv_file, delimiter=";"))
+        assert [row["CHECK_ID"] for row in rows] == [
+            "service_check_one",
+            "service_check_one",
+            "service_check_two",
+            "service_check_three",
+            "service_check_three",
+        ]
+        with open(f"{tmp_path}/{OUTPUT_FILENAME}.ocsf.json") as ocsf_file:
+            assert len(json.load(ocsf_file)) == 5
+        # The findings of every batch are in a single JSON array
+        with open(f"{tmp_path}/{OUTPUT_FILENAME}.asff.json") as asff_file:
+            assert len(json.load(asff_file)) == 5
+        assert len(streaming_outputs.asff_findings) == 5
+
+        stats = streaming_outputs.stats
+        assert stats["findings_count"] == 5
+        assert stats["total_pass"] == 3
+        assert stats["total_fail"] == 2
+        assert stats["resources_count"] == 2
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_transform_error(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(tmp_path, ["csv"])
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL"], "service_check_one")
+        )
+        with mock.patch(
+            "prowler.lib.outputs.streaming.CSV.transform",
+            side_effect=Exception("transform error"),
+        ):
+            streaming_outputs.add_check_findings(
+                generate_check_findings(["FAIL"], "service_check_two")
+            )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS"], "service_check_three")
+        )
+        streaming_outputs.close()
+
+        # The batch pending when the transform failed is still written
+        with open(f"{tmp_path}/{OUTPUT_FILENAME}.csv") as csv_file:
+            rows = list(csv.DictReader(csv_file, delimiter=";"))
+        assert [row["CHECK_ID"] for row in rows] == [
+            "service_check_one",
+            "service_check_one",
+            "service_check_three",
+        ]
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_without_findings(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(tmp_path, ["csv", "html"])
+        streaming_outputs.add_check_findings([])
+
+        assert streaming_outputs.close() == {"regular": [], "compliance": []}
+        assert not (tmp_path / f"{OUTPUT_FILENAME}.csv").exists()
+        assert not (tmp_path / f"{OUTPUT_FILENAME}.html").exists()
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_html(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(tmp_path, ["html"])
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL"], "service_check_one")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["FAIL"], "service_check_two")
+        )
+        generated_outputs = streaming_outputs.close()
+
+        assert len(generated_outputs["regular"]) == 1
+        with open(f"{tmp_path}/{OUTPUT_FILENAME}.html") as html_file:
+            content = html_file.read()
+        assert content.startswith("<!DOCTYPE html>")
+        assert content.rstrip().endswith("</html>")
+        assert content.count("service<wbr />_check<wbr />_one") == 2
+        assert content.count("service<wbr />_check<wbr />_two") == 1
+        # The header shows the statistics of the whole scan
+        assert "<b>Total Findings:</b> 3" in content
+        assert "<b>Passed:</b> 1" in content
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_parquet(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(tmp_path, ["parquet"])
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL"], "service_check_one")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["FAIL"], "service_check_two")
+        )
+        generated_outputs = streaming_outputs.close()
+
+        assert len(generated_outputs["regular"]) == 1
+        assert generated_outputs["regular"][0].file_descriptor.closed
+        parquet_file = pq.ParquetFile(f"{tmp_path}/{OUTPUT_FILENAME}.parquet")
+        # A row group is written per check
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read().column("check_id").to_pylist() == [
+            "service_check_one",
+            "service_check_one",
+            "service_check_two",
+        ]
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_ndjson_compressed(self, _, tmp_path):
+        output_options = SimpleNamespace(
+            output_directory=str(tmp_path),
+            output_filename=OUTPUT_FILENAME,
+            ndjson_compression="gzip",
+        )
+        streaming_outputs = StreamingOutputs(
+            self.provider, output_options, ["json-ocsf-ndjson"], {}
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL"], "service_check_one")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["FAIL"], "service_check_two")
+        )
+        generated_outputs = streaming_outputs.close()
+
+        assert len(generated_outputs["regular"]) == 1
+        assert generated_outputs["regular"][0].file_extension == ".ocsf.ndjson.gz"
+        with gzip.open(f"{tmp_path}/{OUTPUT_FILENAME}.ocsf.ndjson.gz", "rt") as file:
+            events = [json.loads(line) for line in file]
+        assert [event["metadata"]["event_code"] for event in events] == [
+            "service_check_one",
+            "service_check_one",
+            "service_check_two",
+        ]
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_compliance(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(
+            tmp_path, ["csv"], {"cis_1.4_aws": CIS_1_4_AWS}
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["FAIL"], "service_test_check_id")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS"], "service_test_check_id")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS"], "service_test_check_id")
+        )
+        generated_outputs = streaming_outputs.close()
+
+        assert len(generated_outputs["compliance"]) == 1
+        assert isinstance(generated_outputs["compliance"][0], AWSCIS)
+        with open(
+            f"{tmp_path}/compliance/{OUTPUT_FILENAME}_cis_1.4_aws.csv"
+        ) as compliance_file:
+            rows = list(csv.DictReader(compliance_file, delimiter=";"))
+        assert [row["REQUIREMENTS_ID"] for row in rows].count("2.1.3") == 3
+        # The manual requirement is written only once
+        assert [row["REQUIREMENTS_ID"] for row in rows].count("2.1.4") == 1
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_check_results(self, _, tmp_path):
+        streaming_outputs = self._streaming_outputs(tmp_path, [])
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["PASS", "FAIL", "FAIL"], "service_check_one")
+        )
+        streaming_outputs.add_check_findings(
+            generate_check_findings(["MANUAL"], "service_check_two")
+        )
+
+        check_results = streaming_outputs.check_results
+        # A check result per check, status and muted value with the number of findings
+        assert len(check_results) == 3
+        assert sorted(
+            (result.check_metadata.CheckID, result.status, result.count)
+            for result in check_results
+        ) == [
+            ("service_check_one", "FAIL", 2),
+            ("service_check_one", "PASS", 1),
+            ("service_check_two", "MANUAL", 1),
+        ]
+        assert streaming_outputs.close() == {"regular": [], "compliance": []}
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_streaming_outputs_check_results_tables(self, _, tmp_path, capsys):
+        streaming_outputs = self._streaming_outputs(tmp_path, [])
+        check_findings = generate_check_findings(
+            ["PASS", "FAIL", "FAIL", "PASS", "FAIL"], "service_check_one"
+        )
+        check_findings[0].muted = True
+        streaming_outputs.add_check_findings(check_findings)
+        output_options = SimpleNamespace(
+            output_directory=str(tmp_path),
+            output_filename=OUTPUT_FILENAME,
+            output_modes=["csv"],
+        )
+        bulk_checks_metadata = {
+            "service_check_one": SimpleNamespace(Compliance=[CIS_1_4_AWS])
+        }
+
+        # The tables of the check results are the same as the tables of all the findings
+        tables = []
+        for findings in [check_findings, streaming_outputs.check_results]:
+            display_summary_table(list(findings), self.provider, output_options)
+            get_cis_table(
+                findings,
+                bulk_checks_metadata,
+                "cis_1.4_aws",
+                OUTPUT_FILENAME,
+                str(tmp_path),
+                False,
+            )
+            tables.append(capsys.readouterr().out)
+        assert "(3) FAIL" in tables[0]
+        assert tables[0] == tables[1]
+
+
+class TestComplianceWriters:
+    def test_get_compliance_output_class(self):
+        assert get_compliance_output_class("aws", "cis_1.4_aws") is AWSCIS
+
+    def test_get_compliance_output_class_generic(self):
+        assert (
+            get_compliance_output_class("aws", "nist_800_53_revision_4_aws")
+            is GenericCompliance
+        )
+        assert (
+            get_compliance_output_class("mongodbatlas", "cis_1.0_mongodbatlas")
+            is GenericCompliance
+        )
+
+    def test_compliance_fan_out_route(self):
+        compliance_fan_out = ComplianceFanOut(
+            "aws", {"cis_1.4_aws": CIS_1_4_AWS, "cis_1.5_aws": CIS_1_5_AWS}
+        )
+        finding_in_framework = generate_finding_output(
+            check_id="service_test_check_id", compliance={"CIS-1.4": "2.1.3"}
+        )
+        finding_not_in_framework = generate_finding_output(
+            check_id="service_other_check_id", compliance={}
+        )
+
+        routed_findings = compliance_fan_out.route(
+            [finding_in_framework, finding_not_in_framework, finding_in_framework]
+        )
+
+        assert routed_findings == {
+            "cis_1.4_aws": [finding_in_framework, finding_in_framework],
+            "cis_1.5_aws": [],
+        }
+
+    def test_compliance_fan_out_transform(self, tmp_path):
+        findings = [
+            generate_finding_output(
+                status=status,
+                check_id=check_id,
+                resource_uid=f"resource-{index}",
+                compliance=(
+                    {"CIS-1.4": "2.1.3"} if check_id == "service_test_check_id" else {}
+                ),
+            )
+            for index, (status, check_id) in enumerate(
+                [
+                    ("PASS", "service_test_check_id"),
+                    ("FAIL", "service_other_check_id"),
+                    ("FAIL", "service_test_check_id"),
+                ]
+            )
+        ]
+        compliance_fan_out = ComplianceFanOut(
+            "aws",
+            {"cis_1.4_aws": CIS_1_4_AWS, "cis_1.5_aws": CIS_1_5_AWS},
+            file_path=f"{tmp_path}/{OUTPUT_FILENAME}",
+            from_cli=False,
+        )
+        # Two batches, the manual requirements are added only by the first one
+        compliance_fan_out.transform(findings[:2])
+        compliance_fan_out.transform(findings[2:])
+
+        cis_1_4_output = compliance_fan_out.outputs["cis_1.4_aws"]
+        assert isinstance(cis_1_4_output, AWSCIS)
+        assert (
+            cis_1_4_output.file_path == f"{tmp_path}/{OUTPUT_FILENAME}_cis_1.4_aws.csv"
+        )
+        assert cis_1_4_output.file_descriptor
+        # The same rows as the output transforming all the findings
+        assert sorted(
+            (row.Requirements_Id, row.ResourceId) for row in cis_1_4_output.data
+        ) == sorted(
+            (row.Requirements_Id, row.ResourceId)
+            for row in AWSCIS(findings=findings, compliance=CIS_1_4_AWS).data
+        )
+        # CIS 1.5 only has a manual requirement
+        assert [
+            (row.Requirements_Id, row.Status)
+            for row in compliance_fan_out.outputs["cis_1.5_aws"].data
+        ] == [("2.1.3", "MANUAL")]
@@ -49,7 +49,7 @@ def mock_provider():
 
 @pytest.fixture
 def mock_execute():
-    with mock.patch("prowler.lib.scan.scan.execute", autospec=True) as mock_exec:
+    with mock.patch("prowler.lib.check.check.execute", autospec=True) as mock_exec:
         findings = [finding]
         mock_exec.side_effect = lambda *args, **kwargs: findings
         yield mock_exec
@@ -75,7 +75,9 @@ def mock_generate_output():
     with mock.patch(
         "prowler.lib.outputs.finding.Finding.generate_output", autospec=True
     ) as mock_gen_output:
-        mock_gen_output.side_effect = lambda provider, finding, output_options: finding
+        mock_gen_output.side_effect = (
+            lambda provider, finding, output_options, context=None: finding
+        )
         yield mock_gen_output
 
 
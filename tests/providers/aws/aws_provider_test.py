@@ -1948,6 +1948,43 @@ aws:
         assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
         assert session_config.retries == {"max_attempts": 10, "mode": "standard"}
 
+    @mock_aws
+    def test_set_session_config_adaptive_mode(self):
+        aws_provider = AwsProvider()
+        session_config = aws_provider.set_session_config(5, "adaptive")
+
+        assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
+        assert session_config.retries == {"max_attempts": 5, "mode": "standard"}
+
+    @mock_aws
+    def test_set_session_config_invalid_mode(self):
+        aws_provider = AwsProvider()
+        with raises(AWSArgumentTypeValidationError) as exception:
+            aws_provider.set_session_config(None, "legacy")
+
+        assert exception.type == AWSArgumentTypeValidationError
+        assert "Retries mode must be one of standard, adaptive." in str(exception.value)
+
+    @mock_aws
+    def test_aws_provider_adaptive_retries_mode(self):
+        aws_provider = AwsProvider(retries_mode="adaptive")
+
+        assert aws_provider.adaptive_retry_handler is not None
+        assert aws_provider.retry_statistics == {}
+        regional_clients = aws_provider.generate_regional_clients("ec2")
+        for regional_client in regional_clients.values():
+            regional_client.describe_vpcs()
+        assert aws_provider.retry_statistics["ec2.DescribeVpcs"]["calls"] == len(
+            regional_clients
+        )
+
+    @mock_aws
+    def test_aws_provider_standard_retries_mode(self):
+        aws_provider = AwsProvider()
+
+        assert aws_provider.adaptive_retry_handler is None
+        assert aws_provider.retry_statistics == {}
+
     @mock_aws
     @patch(
         "prowler.lib.check.utils.recover_checks_from_provider",
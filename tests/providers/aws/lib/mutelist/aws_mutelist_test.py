@@ -346,6 +346,101 @@ class TestAWSMutelist:
         result = mutelist.validate_mutelist(invalid_mutelist)
         assert result == {}
 
+    def test_mute_findings(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["prowler"],
+                        }
+                    }
+                },
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "check_*": {
+                            "Regions": ["*"],
+                            "Resources": ["^test"],
+                        }
+                    }
+                },
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for region, resource_id in [
+            (AWS_REGION_US_EAST_1, "prowler"),
+            (AWS_REGION_EU_WEST_1, "prowler"),
+            (AWS_REGION_EU_WEST_1, "test-resource"),
+            (AWS_REGION_US_EAST_1, "other"),
+        ]:
+            finding = MagicMock()
+            finding.check_metadata.CheckID = "check_test"
+            finding.status = "FAIL"
+            finding.region = region
+            finding.resource_id = resource_id
+            finding.resource_tags = []
+            findings.append(finding)
+
+        muted, rules = mutelist.mute_findings(
+            findings, aws_account_id=AWS_ACCOUNT_NUMBER
+        )
+
+        assert muted == [True, False, True, False]
+        assert rules == ["*/check_test", None, f"{AWS_ACCOUNT_NUMBER}/check_*", None]
+        assert muted == [
+            mutelist.is_finding_muted(finding, AWS_ACCOUNT_NUMBER)
+            for finding in findings
+        ]
+
+    def test_mute_findings_empty(self):
+        mutelist = AWSMutelist(mutelist_content={})
+
+        assert mutelist.mute_findings([], aws_account_id=AWS_ACCOUNT_NUMBER) == (
+            [],
+            [],
+        )
+
+    def test_get_muting_rule(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "lambda_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert (
+            mutelist.get_muting_rule(
+                AWS_ACCOUNT_NUMBER,
+                "awslambda_function_url_public",
+                AWS_REGION_US_EAST_1,
+                "prowler",
+                "",
+            )
+            == "*/lambda_*"
+        )
+        assert (
+            mutelist.get_muting_rule(
+                AWS_ACCOUNT_NUMBER,
+                "s3_bucket_public_access",
+                AWS_REGION_US_EAST_1,
+                "prowler",
+                "",
+            )
+            is None
+        )
+
     def test_mutelist_findings_only_wildcard(self):
         # Mutelist
         mutelist_content = {
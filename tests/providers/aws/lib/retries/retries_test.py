@@ -0,0 +1,82 @@
+from unittest import mock
+
+from boto3 import client
+from moto import mock_aws
+
+from prowler.providers.aws.lib.retries.retries import AdaptiveRetryHandler
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+class TestAdaptiveRetryHandler:
+    def test_get_rate_limiter_shared_by_service(self):
+        handler = AdaptiveRetryHandler()
+
+        assert handler.get_rate_limiter("ec2") is handler.get_rate_limiter("ec2")
+        assert handler.get_rate_limiter("ec2") is not handler.get_rate_limiter("iam")
+
+    def test_on_needs_retry_counts_throttles(self):
+        handler = AdaptiveRetryHandler()
+        throttling_response = (
+            mock.MagicMock(status_code=400),
+            {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+        )
+
+        assert (
+            handler._on_needs_retry(
+                "needs-retry.ec2.DescribeInstances",
+                response=throttling_response,
+                attempts=1,
+                operation=mock.MagicMock(),
+                caught_exception=None,
+                request_dict={"context": {}},
+            )
+            is None
+        )
+        assert (
+            handler._on_needs_retry(
+                "needs-retry.ec2.DescribeInstances",
+                response=None,
+                attempts=1,
+                operation=mock.MagicMock(),
+                caught_exception=None,
+            )
+            is None
+        )
+        assert handler.statistics["ec2.DescribeInstances"]["throttles"] == 1
+
+    def test_statistics(self):
+        handler = AdaptiveRetryHandler()
+        handler._on_after_call(
+            "after-call.iam.ListUsers",
+            http_response=mock.MagicMock(status_code=200),
+            parsed={"ResponseMetadata": {"RetryAttempts": 2}},
+        )
+        handler._on_after_call(
+            "after-call.ec2.DescribeVpcs",
+            http_response=mock.MagicMock(status_code=403),
+            parsed={"ResponseMetadata": {"RetryAttempts": 0}},
+        )
+        handler._on_after_call_error(
+            "after-call-error.ec2.DescribeVpcs", exception=Exception("Timeout")
+        )
+
+        assert handler.statistics == {
+            "ec2.DescribeVpcs": {"calls": 2, "retries": 0, "throttles": 0, "errors": 2},
+            "iam.ListUsers": {"calls": 1, "retries": 2, "throttles": 0, "errors": 0},
+        }
+
+    @mock_aws
+    def test_register_client(self):
+        handler = AdaptiveRetryHandler()
+        for region in [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]:
+            regional_client = client("ec2", region_name=region)
+            handler.register_client(regional_client, "ec2")
+            regional_client.describe_vpcs()
+
+        assert handler.statistics["ec2.DescribeVpcs"] == {
+            "calls": 2,
+            "retries": 0,
+            "throttles": 0,
+            "errors": 0,
+        }
+        assert list(handler._rate_limiters) == ["ec2"]
@@ -324,6 +324,16 @@ class TestS3:
     def test_generate_subfolder_name_by_extension_json_ocsf(self):
         assert S3.generate_subfolder_name_by_extension(".ocsf.json") == "json-ocsf"
 
+    def test_generate_subfolder_name_by_extension_json_ocsf_ndjson(self):
+        assert (
+            S3.generate_subfolder_name_by_extension(".ocsf.ndjson")
+            == "json-ocsf-ndjson"
+        )
+        assert (
+            S3.generate_subfolder_name_by_extension(".ocsf.ndjson.gz")
+            == "json-ocsf-ndjson"
+        )
+
     @mock_aws
     def test_test_connection_S3(self):
         # Create a mock IAM user
@@ -0,0 +1,162 @@
+from unittest import mock
+
+from prowler.providers.aws.lib.service.limiter import (
+    APICallLimiter,
+    TokenBucket,
+    get_api_call_limiter,
+    get_api_call_metrics,
+)
+
+
+class TestTokenBucket:
+    def test_token_bucket_unlimited(self):
+        bucket = TokenBucket(0)
+        for _ in range(100):
+            assert bucket.acquire() == 0.0
+
+    def test_token_bucket_waits_when_empty(self):
+        bucket = TokenBucket(rate=2, capacity=1)
+        with mock.patch(
+            "prowler.providers.aws.lib.service.limiter.time.sleep"
+        ) as mock_sleep:
+            assert bucket.acquire() == 0.0
+            mock_sleep.side_effect = lambda seconds: setattr(
+                bucket, "_tokens", bucket._tokens + 1
+            )
+            assert bucket.acquire() > 0
+            mock_sleep.assert_called_once()
+
+
+class TestAPICallLimiter:
+    def test_submit(self):
+        limiter = APICallLimiter(max_workers=2)
+        futures = [limiter.submit(lambda x: x * 2, item) for item in range(10)]
+
+        assert [future.result() for future in futures] == [
+            item * 2 for item in range(10)
+        ]
+        assert limiter.metrics["queue_depth"] == 0
+        assert limiter.metrics["in_flight"] == 0
+        assert limiter.metrics["max_queue_depth"] >= 1
+
+    def test_submit_nested_runs_inline(self):
+        limiter = APICallLimiter(max_workers=1)
+
+        def outer(item):
+            return limiter.submit(lambda: item + 1).result()
+
+        futures = [limiter.submit(outer, item) for item in range(3)]
+
+        assert [future.result(timeout=5) for future in futures] == [1, 2, 3]
+
+    def test_submit_exception(self):
+        limiter = APICallLimiter(max_workers=1)
+
+        def fail():
+            raise ValueError("error")
+
+        future = limiter.submit(fail)
+
+        assert isinstance(future.exception(timeout=5), ValueError)
+
+    def test_acquire_rate_limited_waits(self):
+        limiter = APICallLimiter(
+            max_workers=1, service_calls_per_second=1, region_calls_per_second=0
+        )
+        with mock.patch.object(TokenBucket, "acquire", side_effect=[0.0, 0.5]):
+            limiter.acquire("ec2")
+            limiter.acquire("ec2")
+
+        assert limiter.metrics["api_calls"] == 2
+        assert limiter.metrics["rate_limited_waits"] == 1
+        assert limiter.metrics["rate_limited_seconds"] == 0.5
+
+    def test_register_client(self):
+        limiter = APICallLimiter(max_workers=1)
+        client = mock.MagicMock()
+        client.meta.region_name = "eu-west-1"
+
+        with mock.patch.object(limiter, "acquire") as mock_acquire:
+            limiter.register_client(client, "ec2")
+            handlers = dict(
+                call[0] for call in client.meta.events.register.call_args_list
+            )
+            handlers["before-call"](model=None, params={})
+
+        mock_acquire.assert_called_once_with("ec2", "eu-west-1")
+        assert "needs-retry" in handlers
+
+    def test_register_client_counts_throttles(self):
+        limiter = APICallLimiter(max_workers=1)
+        client = mock.MagicMock()
+        client.meta.region_name = "eu-west-1"
+        limiter.register_client(client, "ec2")
+        handlers = dict(call[0] for call in client.meta.events.register.call_args_list)
+
+        def response(code):
+            return (
+                mock.MagicMock(status_code=400),
+                {"Error": {"Code": code, "Message": ""}},
+            )
+
+        for code in ["Throttling", "ThrottlingException", "AccessDenied"]:
+            assert (
+                handlers["needs-retry"](
+                    response=response(code),
+                    endpoint=None,
+                    operation=mock.MagicMock(),
+                    attempts=1,
+                    caught_exception=None,
+                    request_dict={"context": {}},
+                )
+                is None
+            )
+        # The calls that could not be sent have no response
+        handlers["needs-retry"](
+            response=None,
+            endpoint=None,
+            operation=mock.MagicMock(),
+            attempts=1,
+            caught_exception=ConnectionError(),
+            request_dict={"context": {}},
+        )
+
+        assert limiter.metrics["throttles"] == 2
+        assert limiter.metrics["throttles_by_service"] == {"ec2": 2}
+
+    def test_configure(self):
+        limiter = APICallLimiter(max_workers=1)
+        limiter.acquire("ec2", "eu-west-1")
+        limiter.configure(10, 5)
+
+        assert limiter.service_calls_per_second == 10
+        assert limiter.region_calls_per_second == 5
+        assert limiter._service_buckets == {}
+        assert limiter._region_buckets == {}
+
+
+class TestGetAPICallLimiter:
+    def test_get_api_call_limiter_is_shared(self):
+        with mock.patch(
+            "prowler.providers.aws.lib.service.limiter._api_call_limiter", None
+        ):
+            limiter = get_api_call_limiter(
+                {"api_max_workers": 3, "api_service_calls_per_second": 5}
+            )
+            assert limiter.max_workers == 3
+            assert limiter.service_calls_per_second == 5
+            assert limiter.region_calls_per_second == 0
+
+            assert get_api_call_limiter({"api_region_calls_per_second": 7}) is limiter
+            assert limiter.service_calls_per_second == 0
+            assert limiter.region_calls_per_second == 7
+
+    def test_get_api_call_metrics(self):
+        with mock.patch(
+            "prowler.providers.aws.lib.service.limiter._api_call_limiter", None
+        ):
+            assert get_api_call_metrics() == {}
+
+            get_api_call_limiter({"api_max_workers": 1}).acquire("ec2")
+            assert get_api_call_metrics()["api_calls"] == 1
+            assert get_api_call_metrics()["throttles"] == 0
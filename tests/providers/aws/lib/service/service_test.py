@@ -152,3 +152,22 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_shared_thread_pool(self):
+        provider = set_mocked_aws_provider()
+        s3_service = AWSService("s3", provider)
+        ec2_service = AWSService("ec2", provider)
+
+        assert s3_service.thread_pool is ec2_service.thread_pool
+
+    def test_AWSService_threading_call(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        processed = []
+
+        def _process_item(item):
+            processed.append(item)
+
+        service.__threading_call__(_process_item, iterator=[1, 2, 3])
+
+        assert sorted(processed) == [1, 2, 3]
@@ -132,3 +132,58 @@ class TestAzureMutelist:
         assert muted_finding.status == "MUTED"
         assert muted_finding.muted is True
         assert muted_finding.raw["status"] == "FAIL"
+
+    def test_mute_findings_subscriptions(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "12345678-1234-1234-1234-123456789012": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["test_resource"],
+                        }
+                    }
+                },
+                "subscription_2": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                },
+            }
+        }
+
+        mutelist = AzureMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for subscription, resource_name in [
+            ("subscription_1", "test_resource"),
+            ("subscription_1", "other_resource"),
+            ("subscription_2", "other_resource"),
+        ]:
+            finding = MagicMock()
+            finding.check_metadata.CheckID = "check_test"
+            finding.location = "West Europe"
+            finding.status = "FAIL"
+            finding.resource_name = resource_name
+            finding.resource_tags = {}
+            finding.subscription = subscription
+            findings.append(finding)
+
+        muted, rules = mutelist.mute_findings(
+            findings,
+            subscriptions={
+                "subscription_1": "12345678-1234-1234-1234-123456789012",
+                "subscription_2": "87654321-4321-4321-4321-210987654321",
+            },
+        )
+
+        assert muted == [True, False, True]
+        assert rules == [
+            "12345678-1234-1234-1234-123456789012/check_test",
+            None,
+            "subscription_2/check_test",
+        ]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the conversion of the check reports to findings with Finding.generate_output, with a FindingContext
+per finding (the values of the provider and the compliance are computed for every finding) and with a FindingContext
+shared by all the findings of the run.
+
+Usage:
+    python util/benchmark_finding_output.py --findings 100000
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from prowler.lib.check.compliance import (  # noqa: E402
+    update_checks_metadata_with_compliance,
+)
+from prowler.lib.check.compliance_models import Compliance  # noqa: E402
+from prowler.lib.check.models import Check_Report_AWS, CheckMetadata  # noqa: E402
+from prowler.lib.outputs.finding import Finding, FindingContext  # noqa: E402
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGIONS = ["us-east-1", "eu-west-1", "ap-south-1"]
+
+
+@dataclass
+class Resource:
+    id: str
+    arn: str
+    region: str
+    tags: list
+
+
+def get_provider() -> SimpleNamespace:
+    return SimpleNamespace(
+        type="aws",
+        identity=SimpleNamespace(
+            account=AWS_ACCOUNT_NUMBER, partition="aws", profile="default"
+        ),
+        organizations_metadata=SimpleNamespace(
+            account_name="benchmark",
+            account_email="benchmark@example.com",
+            organization_arn=f"arn:aws:organizations::{AWS_ACCOUNT_NUMBER}:organization/o-benchmark",
+            organization_id="o-benchmark",
+            account_tags={"environment": "benchmark"},
+        ),
+    )
+
+
+def get_check_reports(bulk_checks_metadata: dict, findings: int) -> list:
+    """Return the given number of check reports, spread across the checks"""
+    checks_metadata = list(bulk_checks_metadata.values())
+    # The checks load their metadata once
+    checks_metadata_json = [check_metadata.json() for check_metadata in checks_metadata]
+    check_reports = []
+    for index in range(findings):
+        check_metadata = checks_metadata[index % len(checks_metadata)]
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        resource = Resource(
+            id=f"resource-{index}",
+            arn=f"arn:aws:{check_metadata.ServiceName}:{region}:{AWS_ACCOUNT_NUMBER}:resource/resource-{index}",
+            region=region,
+            tags=[{"Key": "Name", "Value": f"resource-{index}"}],
+        )
+        check_report = Check_Report_AWS(
+            metadata=checks_metadata_json[index % len(checks_metadata)],
+            resource=resource,
+        )
+        check_report.status = "FAIL" if index % 3 else "PASS"
+        check_report.status_extended = f"Resource resource-{index} status."
+        check_reports.append(check_report)
+    return check_reports
+
+
+def benchmark(name: str, convert, check_reports: list) -> float:
+    start = perf_counter()
+    for check_report in check_reports:
+        convert(check_report)
+    elapsed = perf_counter() - start
+    print(
+        f"{name:<28} {elapsed:8.2f}s {len(check_reports) / elapsed:12,.0f} findings/s"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--findings",
+        type=int,
+        default=100000,
+        help="Number of check reports to convert, 100000 by default",
+    )
+    args = parser.parse_args()
+
+    bulk_checks_metadata = update_checks_metadata_with_compliance(
+        Compliance.get_bulk("aws"), CheckMetadata.get_bulk("aws")
+    )
+    provider = get_provider()
+    output_options = SimpleNamespace(
+        unix_timestamp=False, bulk_checks_metadata=bulk_checks_metadata
+    )
+    check_reports = get_check_reports(bulk_checks_metadata, args.findings)
+    print(
+        f"Converting {len(check_reports):,} check reports of {len(bulk_checks_metadata)} checks"
+    )
+
+    per_finding = benchmark(
+        "Context per finding",
+        lambda check_report: Finding.generate_output(
+            provider, check_report, output_options
+        ),
+        check_reports,
+    )
+    context = FindingContext(provider, output_options)
+    shared = benchmark(
+        "Context shared by the run",
+        lambda check_report: Finding.generate_output(
+            provider, check_report, output_options, context=context
+        ),
+        check_reports,
+    )
+    print(f"Speedup: {per_finding / shared:.1f}x")
+
+
+if __name__ == "__main__":
+    main()